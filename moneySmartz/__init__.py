@@ -10,7 +10,13 @@ as a teenager to retirement.
 from moneySmartz.constants import *
 from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
 from moneySmartz.game import Game
-from moneySmartz.ui import Button, TextInput, Screen, GUIManager
+from moneySmartz.engine import SimulationEngine, DecisionPolicy, PassivePolicy
+
+# The GUI needs pygame, but the game logic and headless engine do not
+try:
+    from moneySmartz.ui import Button, TextInput, Screen, GUIManager
+except ImportError:
+    pass
 
 # Version information
 __version__ = "1.0.0"
@@ -0,0 +1,89 @@
+"""
+Loan amortization schedules for Money Smartz.
+
+An AmortizationSchedule plays a loan's regular payments forward from its
+current balance once, with the same rules as Loan.make_payment (interest first,
+rounded to the cent each month, a smaller final payment), and keeps the result
+as arrays: the interest, principal and balance of every period and a running
+total of the interest. After that, "balance after k payments", "months until
+payoff" and "interest left to pay" are array lookups, and "when does the
+balance drop below X" is a binary search, so a loan screen can ask every frame.
+
+Loan.get_schedule keeps one per loan: regular payments just move the loan along
+its schedule, and the schedule is only recomputed when the balance leaves it
+(after an extra payment or a rewind).
+"""
+from array import array
+from bisect import bisect_left
+from moneySmartz.money import monthly_interest
+
+MAX_MONTHS = 1200  # Give up on a loan whose payment doesn't cover its interest after 100 years
+
+class AmortizationSchedule:
+    """
+    The regular payments of a loan from a starting balance (all amounts in cents).
+    Period k (from 0) is the (k+1)th payment from the start: interest[k] and principal[k]
+    are its split, balances[k + 1] the balance after it (balances[0] is the starting balance).
+    """
+    def __init__(self, balance_cents, interest_rate, payment_cents, max_months=MAX_MONTHS):
+        self.interest_rate = interest_rate
+        self.payment_cents = payment_cents
+        self.interest = array("q")
+        self.principal = array("q")
+        self.balances = array("q", [balance_cents])
+        self.interest_totals = array("q", [0])  # interest_totals[k] is the interest of the first k payments
+
+        balance = balance_cents
+        total = 0
+        while balance > 0 and len(self.interest) < max_months:
+            interest = monthly_interest(balance, interest_rate)
+            payment = min(payment_cents, balance + interest)
+            principal = min(payment - interest, balance)
+            if principal < 0:
+                # The payment doesn't cover the interest
+                interest = payment
+                principal = 0
+
+            balance -= principal
+            total += interest
+            self.interest.append(interest)
+            self.principal.append(principal)
+            self.balances.append(balance)
+            self.interest_totals.append(total)
+
+    @property
+    def paid_off(self):
+        """Whether the regular payments pay the loan off (within MAX_MONTHS)."""
+        return self.balances[-1] <= 0
+
+    @property
+    def payoff_months(self):
+        """The number of payments left until the loan is paid off."""
+        return len(self.interest)
+
+    def get_balance(self, months):
+        """Return the balance after a number of payments from the start."""
+        return self.balances[min(months, len(self.balances) - 1)]
+
+    def get_interest_paid(self, months):
+        """Return the interest in the first months payments from the start."""
+        return self.interest_totals[min(months, len(self.interest_totals) - 1)]
+
+    def get_remaining_interest(self, months=0):
+        """Return the interest still to pay after a number of payments from the start."""
+        return self.interest_totals[-1] - self.get_interest_paid(months)
+
+    def get_total_payments(self, months=0):
+        """Return the total still to pay (interest and principal) after a number of payments from the start."""
+        return self.get_balance(months) + self.get_remaining_interest(months)
+
+    def get_months_until(self, balance_cents):
+        """
+        Return the number of payments from the start until the balance is at or below
+        an amount in cents (None if the regular payments never get it there).
+        """
+        # The balances only go down, so their negatives are sorted
+        months = bisect_left(self.balances, -balance_cents, key=lambda balance: -balance)
+        if months == len(self.balances):
+            return None
+        return months
@@ -0,0 +1,273 @@
+"""
+Vectorized cohort simulator for Money Smartz.
+
+Stores thousands of players as NumPy column arrays (a struct of arrays) and
+advances all of them one month at a time with array operations. The monthly
+rules are the same as Game.process_monthly_finances, so a cohort built from
+Player objects follows the same path as the interactive game. Money is kept in
+int64 arrays of cents and rounded with the rules in moneySmartz.money (numpy.rint
+rounds halves to even, like round), so the results are bit-identical to the
+game's models. Requires numpy.
+"""
+import numpy as np
+from moneySmartz.constants import INFLATION_FACTORS, INFLATION_RATE
+from moneySmartz.money import CENTS_PER_DOLLAR
+from moneySmartz.ledger import CHARGE, INTEREST, PAYMENT, MONTH_DAYS
+
+def to_cents(dollars):
+    """Vectorized moneySmartz.money.to_cents."""
+    return round_cents(dollars * CENTS_PER_DOLLAR)
+
+def round_cents(value):
+    """Vectorized moneySmartz.money.round_cents: round to whole cents (halves to even) as int64."""
+    return np.rint(value).astype(np.int64)
+
+class Cohort:
+    """
+    A cohort of players advanced in lockstep.
+    Each attribute is a column array with one entry per player; loans are stored
+    in (players x max_loans) arrays, with loan_active marking the slots in use.
+    Cash, balances, limits and payments are in cents; salaries are in dollars.
+    The card_cycle_* columns are the current statement cycle's running totals
+    (see Card.get_average_daily_balance_cents).
+    """
+    def __init__(self, size, max_loans=4):
+        self.size = size
+        self.max_loans = max_loans
+        self.current_month = 1
+        self.current_year = 0
+
+        # Personal details (defaults match a new Player)
+        self.age = np.full(size, 16, dtype=np.int64)
+        self.has_job = np.zeros(size, dtype=bool)
+        self.salary = np.zeros(size)
+        self.cash = np.full(size, 10000, dtype=np.int64)
+        self.credit_score = np.full(size, 650, dtype=np.int64)
+        self.has_house = np.zeros(size, dtype=bool)
+        self.has_car = np.zeros(size, dtype=bool)
+        self.family_size = np.zeros(size, dtype=np.int64)
+
+        # Bank account
+        self.has_bank_account = np.zeros(size, dtype=bool)
+        self.is_savings = np.zeros(size, dtype=bool)
+        self.bank_balance = np.zeros(size, dtype=np.int64)
+        self.bank_interest_rate = np.zeros(size)
+
+        # Credit card
+        self.has_credit_card = np.zeros(size, dtype=bool)
+        self.card_balance = np.zeros(size, dtype=np.int64)
+        self.card_limit = np.zeros(size, dtype=np.int64)
+        self.card_rate = np.zeros(size)
+        self.card_statement = np.zeros(size, dtype=np.int64)
+        self.card_cycle_charged = np.zeros(size, dtype=np.int64)   # Charges and interest
+        self.card_cycle_paid = np.zeros(size, dtype=np.int64)
+        self.card_cycle_weighted = np.zeros(size, dtype=np.int64)  # Amounts (payments negated) times their days
+
+        # Loans
+        self.loan_active = np.zeros((size, max_loans), dtype=bool)
+        self.loan_balance = np.zeros((size, max_loans), dtype=np.int64)
+        self.loan_rate = np.zeros((size, max_loans))
+        self.loan_payment = np.zeros((size, max_loans), dtype=np.int64)
+
+    @classmethod
+    def from_players(cls, players, current_month=1, current_year=0, max_loans=None):
+        """Build a cohort from a list of Player objects."""
+        if max_loans is None:
+            max_loans = max([len(player.loans) for player in players] + [1])
+
+        cohort = cls(len(players), max_loans)
+        cohort.current_month = current_month
+        cohort.current_year = current_year
+
+        for i, player in enumerate(players):
+            cohort.age[i] = player.age
+            cohort.has_job[i] = bool(player.job)
+            cohort.salary[i] = player.salary
+            cohort.cash[i] = player.cash_cents
+            cohort.credit_score[i] = player.credit_score
+            cohort.has_house[i] = player.assets.has_type("House")
+            cohort.has_car[i] = player.assets.has_type("Car")
+            cohort.family_size[i] = len(player.family)
+
+            if player.bank_account:
+                cohort.has_bank_account[i] = True
+                cohort.is_savings[i] = player.bank_account.account_type == "Savings"
+                cohort.bank_balance[i] = player.bank_account.balance_cents
+                cohort.bank_interest_rate[i] = player.bank_account.interest_rate
+
+            if player.credit_card:
+                cohort.has_credit_card[i] = True
+                cohort.card_balance[i] = player.credit_card.balance_cents
+                cohort.card_limit[i] = player.credit_card.limit_cents
+
+                card = player.credit_card
+                month_index = current_year * 12 + current_month - 1
+                cohort.card_rate[i] = card.interest_rate
+                cohort.card_statement[i] = card.statement_balance_cents
+                cohort.card_cycle_charged[i] = (card.get_total(CHARGE, month_index, month_index)
+                                                + card.get_total(INTEREST, month_index, month_index))
+                cohort.card_cycle_paid[i] = card.get_total(PAYMENT, month_index, month_index)
+                cohort.card_cycle_weighted[i] = (card.get_day_weighted_total(CHARGE, month_index, month_index)
+                                                 + card.get_day_weighted_total(INTEREST, month_index, month_index)
+                                                 - card.get_day_weighted_total(PAYMENT, month_index, month_index))
+
+            if len(player.loans) > max_loans:
+                raise ValueError(f"Player {i} has {len(player.loans)} loans but the cohort only holds {max_loans}.")
+
+            for j, loan in enumerate(player.loans):
+                cohort.loan_active[i, j] = True
+                cohort.loan_balance[i, j] = loan.current_balance_cents
+                cohort.loan_rate[i, j] = loan.interest_rate
+                cohort.loan_payment[i, j] = loan.monthly_payment_cents
+
+        return cohort
+
+    def add_loan(self, players, amount, interest_rate, term_years):
+        """
+        Give each of the selected players (an index array or boolean mask) a new loan
+        of amount dollars. The loan goes in the player's first free slot.
+        """
+        players = np.arange(self.size)[players]
+        free = ~self.loan_active[players]
+        if not free.any(axis=1).all():
+            raise ValueError(f"Some players already have {self.max_loans} loans.")
+        slots = free.argmax(axis=1)
+
+        amount = np.broadcast_to(to_cents(np.asarray(amount, dtype=float)), players.shape)
+        interest_rate = np.broadcast_to(np.asarray(interest_rate, dtype=float), players.shape)
+
+        self.loan_active[players, slots] = True
+        self.loan_balance[players, slots] = amount
+        self.loan_rate[players, slots] = interest_rate
+        self.loan_payment[players, slots] = self.calculate_payment(amount, interest_rate, term_years)
+
+    @staticmethod
+    def calculate_payment(amount, interest_rate, term_years):
+        """Vectorized version of Loan.calculate_payment (amount and payment in cents)."""
+        r = np.asarray(interest_rate, dtype=float) / 12  # Monthly interest rate
+        n = np.asarray(term_years) * 12                   # Total number of payments
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = (1 + r) ** n
+            payment = (amount * r * growth) / (growth - 1)
+        return round_cents(np.where(r == 0, amount / n, payment))
+
+    def advance_month(self):
+        """
+        Advance every player by one month in the order of the monthly tick pipeline:
+        calendar rollover, credit card statements, monthly finances, then savings
+        interest in a new year. Everything happens on the first day of the month.
+        """
+        self.current_month += 1
+        new_year = self.current_month > 12
+        if new_year:
+            self.current_month = 1
+            self.current_year += 1
+            self.age += 1
+
+        self.close_card_statements()
+        self.process_monthly_finances()
+
+        if new_year:
+            # Apply interest to savings
+            earning = self.has_bank_account & self.is_savings & (self.bank_balance > 0)
+            self.bank_balance += np.where(earning, round_cents(self.bank_balance * self.bank_interest_rate), 0)
+
+    def run(self, months):
+        """Advance the cohort by a number of months."""
+        for _ in range(months):
+            self.advance_month()
+
+    def close_card_statements(self):
+        """Close every credit card's statement cycle and charge its interest (see Card.close_statement)."""
+        # Interest on the average daily balance, unless the last statement was paid in full
+        net = self.card_cycle_charged - self.card_cycle_paid
+        opening = self.card_balance - net
+        average = round_cents((opening * MONTH_DAYS + net * MONTH_DAYS - self.card_cycle_weighted) / MONTH_DAYS)
+        owing = self.has_credit_card & (self.card_cycle_paid < self.card_statement)
+        interest = np.where(owing, np.rint(np.maximum(average, 0) * self.card_rate / 12).astype(np.int64), 0)
+
+        self.card_balance += interest
+        self.card_statement = np.where(self.has_credit_card, self.card_balance, 0)
+
+        # The interest opens the next cycle
+        self.card_cycle_charged = interest
+        self.card_cycle_paid = np.zeros(self.size, dtype=np.int64)
+        self.card_cycle_weighted = np.zeros(self.size, dtype=np.int64)
+
+    def process_monthly_finances(self):
+        """Process monthly income and expenses for every player (see Game.process_monthly_finances)."""
+        # Process income, auto depositing 80% to the bank if an account exists
+        monthly_income = to_cents(self.salary / 12)
+        self.cash += np.where(self.has_job, monthly_income, 0)
+
+        depositing = self.has_job & self.has_bank_account
+        deposit_amount = round_cents(monthly_income * 0.8)
+        self.bank_balance += np.where(depositing & (deposit_amount > 0), deposit_amount, 0)
+        self.cash -= np.where(depositing, deposit_amount, 0)
+
+        # Process loan payments (paid off loans cost nothing; the final payment is just what's owed)
+        for j in range(self.max_loans):
+            due = self.loan_active[:, j] & (self.loan_balance[:, j] > 0)
+            if not due.any():
+                continue
+
+            balance = self.loan_balance[:, j]
+            amount_due = np.minimum(self.loan_payment[:, j], balance + round_cents(balance * self.loan_rate[:, j] / 12))
+            paid = self._pay(amount_due, due, use_credit_card=True)
+            self._apply_loan_payment(j, amount_due, paid)
+
+            # Missed payment - credit score impact
+            self.credit_score -= np.where(due & ~paid, 30, 0)
+
+        # Process credit card minimum payments (5% of balance, minimum $25, never more than the balance)
+        carrying = self.has_credit_card & (self.card_balance > 0)
+        if carrying.any():
+            min_payment = np.minimum(np.maximum(2500, round_cents(self.card_balance * 0.05)), self.card_balance)
+            paid = self._pay(min_payment, carrying, use_credit_card=False)
+            self.card_balance -= np.where(paid, min_payment, 0)
+            self.card_cycle_paid += np.where(paid, min_payment, 0)
+
+            # Missed payment - credit score impact
+            self.credit_score -= np.where(carrying & ~paid, 50, 0)
+
+        # Process living expenses, adjusted for inflation over time (2% per year)
+        living_expenses = 1000 + 500 * self.has_house + 200 * self.has_car + 500 * self.family_size
+        if self.current_year < len(INFLATION_FACTORS):
+            living_expenses = to_cents(living_expenses * INFLATION_FACTORS[self.current_year])
+        else:
+            living_expenses = to_cents(living_expenses * (1 + INFLATION_RATE) ** self.current_year)
+
+        paid = self._pay(living_expenses, np.ones(self.size, dtype=bool), use_credit_card=True)
+        self.credit_score -= np.where(paid, 0, 20)
+
+    def _pay(self, amount, due, use_credit_card):
+        """
+        Pay amount for each player where due is set, from cash, then the bank account,
+        then (optionally) the credit card. Returns a mask of the players who paid.
+        """
+        by_cash = due & (self.cash >= amount)
+        self.cash -= np.where(by_cash, amount, 0)
+
+        by_bank = due & ~by_cash & self.has_bank_account & (self.bank_balance >= amount)
+        self.bank_balance -= np.where(by_bank, amount, 0)
+
+        paid = by_cash | by_bank
+
+        if use_credit_card:
+            by_card = due & ~paid & self.has_credit_card & (self.card_balance + amount <= self.card_limit)
+            self.card_balance += np.where(by_card, amount, 0)
+            self.card_cycle_charged += np.where(by_card, amount, 0)
+            paid |= by_card
+
+        return paid
+
+    def _apply_loan_payment(self, slot, payment, paying):
+        """Apply this month's payment to loan slot for the paying players (see Loan.make_payment)."""
+        balance = self.loan_balance[:, slot]
+
+        # Apply payment to interest first, then principal
+        interest_payment = round_cents(balance * self.loan_rate[:, slot] / 12)
+        principal_payment = np.minimum(payment - interest_payment, balance)
+        principal_payment = np.where(principal_payment < 0, 0, principal_payment)
+
+        self.loan_balance[:, slot] = np.where(paying, balance - principal_payment, balance)
@@ -2,6 +2,8 @@
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
+IDLE_TIMEOUT = 250  # Longest the main loop waits for input (in milliseconds) when nothing is animating
+TITLE_PARTICLES = 20  # Coins floating behind the title screen
 
 # Colors
 WHITE = (255, 255, 255)
@@ -19,8 +21,56 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 
-# Font sizes
+# Fonts
+FONT_FAMILY = 'Arial'
 FONT_SMALL = 18
 FONT_MEDIUM = 24
 FONT_LARGE = 32
-FONT_TITLE = 48
\ No newline at end of file
+FONT_TITLE = 48
+TEXT_CACHE_SIZE = 256  # Most rendered text surfaces kept for reuse
+
+# Notification toasts
+TOAST_DURATION = 4000  # Milliseconds a toast stays on screen
+TOAST_LIMIT = 4        # Most toasts shown at once
+
+# Life event options
+CAR_OPTIONS = [
+    {"name": "Used Economy Car", "value": 5000},
+    {"name": "New Economy Car", "value": 18000},
+    {"name": "Used Luxury Car", "value": 15000},
+    {"name": "New Luxury Car", "value": 35000},
+]
+
+HOUSE_OPTIONS = [
+    {"name": "Small Starter Home", "value": 150000},
+    {"name": "Mid-size Family Home", "value": 250000},
+    {"name": "Large Luxury Home", "value": 500000},
+    {"name": "Urban Condo", "value": 200000},
+]
+
+# Loan offers: (minimum credit score, annual interest rate) tiers, best first
+AUTO_LOAN_RATES = [(700, 0.03), (650, 0.05), (0, 0.08)]
+MORTGAGE_RATES = [(750, 0.035), (700, 0.04), (650, 0.045), (0, 0.055)]
+CREDIT_CARD_APR = 0.18  # Credit card interest rate on unpaid balances
+MID_MONTH_DAY = 15      # Day of the month stamped on transactions after the monthly bills (events, the player's own)
+
+# Economy
+RANDOM_EVENT_CHANCE = 0.3      # Chance of a random event each month
+FAMILY_PLANNING_CHANCE = 0.1   # Monthly chance of a family planning opportunity once eligible
+INFLATION_RATE = 0.02          # Living expenses grow 2% per year
+INFLATION_FACTORS = [(1 + INFLATION_RATE) ** year for year in range(100)]  # Precomputed by game year
+
+# Rewind
+SNAPSHOT_CAPACITY = 60  # Months of history kept for rewinding
+
+# What-if comparisons
+WHAT_IF_RUNS = 200                # Simulated futures per branch
+WHAT_IF_HORIZONS = (10, 20, 30)   # Years ahead at which branches are compared
+
+# Loan comparisons
+AUTO_LOAN_TERMS = (3, 4, 5, 6, 7)              # Terms (years) compared for auto loans
+AUTO_LOAN_DOWN_PAYMENTS = (0.0, 0.1, 0.2)      # Down payments compared for auto loans (share of the price)
+MORTGAGE_TERMS = (15, 20, 30)                  # Terms (years) compared for mortgages
+MORTGAGE_DOWN_PAYMENTS = (0.05, 0.1, 0.2)      # Down payments compared for mortgages
+AUTO_LOAN_MAX_SHARE = 0.15                     # Largest affordable car payment, as a share of monthly income
+MORTGAGE_MAX_SHARE = 0.28                      # Largest affordable mortgage payment, as a share of monthly income
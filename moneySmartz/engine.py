@@ -0,0 +1,280 @@
+"""
+Headless simulation engine for Money Smartz.
+
+The SimulationEngine advances the game one month at a time without pygame or
+any screens. Choices that the GUI would ask the player to make are delegated to
+a DecisionPolicy, so whole lifetimes can be simulated for grading and balance
+testing.
+"""
+from moneySmartz.constants import CAR_OPTIONS, HOUSE_OPTIONS
+from moneySmartz.game import Game
+from moneySmartz.models import Player, BankAccount, Card
+from moneySmartz.payments import CASH, BANK
+from moneySmartz.tick import MonthlyTick, BATCHED_STAGES
+from moneySmartz.notifications import NotificationQueue, COUNT
+from moneySmartz.snapshots import SnapshotHistory
+
+class DecisionPolicy:
+    """
+    Makes the player's decisions for the SimulationEngine.
+    Override any of the methods to change how the simulated player behaves.
+    The default policy plays a cautious game: it studies, buys the cheapest car
+    and house it can afford and keeps its credit card paid off.
+    """
+    def open_bank_account(self, game):
+        """Return True to open a bank account at the start of the game."""
+        return True
+
+    def get_debit_card(self, game):
+        """Return True to get a debit card with the new checking account."""
+        return True
+
+    def choose_education(self, game):
+        """Return "college", "trade school" or "work" after high school graduation."""
+        return "college"
+
+    def choose_job(self, game, job_options):
+        """Return one of the job options to apply for, or None to keep the current situation."""
+        if not job_options:
+            return None
+        return max(job_options, key=lambda job: job["salary"])
+
+    def choose_car(self, game, car_options):
+        """Return one of the car options to buy, or None to skip the purchase."""
+        return min(car_options, key=lambda car: car["value"])
+
+    def choose_car_payment(self, game, car, payment_options):
+        """Return one of the payment options for the selected car."""
+        if game.player.cash >= car["value"]:
+            return "Cash"
+        if "Bank Account" in payment_options:
+            return "Bank Account"
+        return "Auto Loan"
+
+    def choose_house(self, game, house_options):
+        """Return one of the house options to buy, or None to skip the purchase."""
+        affordable = [house for house in house_options if game.get_down_payment_options(house)]
+        if not affordable:
+            return None
+        return min(affordable, key=lambda house: house["value"])
+
+    def choose_down_payment(self, game, house, payment_options):
+        """Return one of the payment options for the down payment on the selected house."""
+        return payment_options[0]
+
+    def start_family(self, game, profile):
+        """Return True to get married when the family planning opportunity comes up."""
+        return True
+
+    def have_children(self, game, profile):
+        """Return True to have the children described by the family profile."""
+        return True
+
+    def monthly_actions(self, game):
+        """
+        Take any voluntary actions for the month, such as looking for a job or paying down debt.
+        Called after the month's finances and events have been processed.
+        """
+        player = game.player
+
+        # Look for work once out of school
+        if not player.job and player.age >= 18 and player.education not in ("High School", "College (In Progress)"):
+            job = self.choose_job(game, game.generate_job_options())
+            if job:
+                game.apply_for_job(job)
+
+        # Apply for a credit card as soon as eligible
+        if not player.credit_card and player.age >= 18 and player.job:
+            game.open_credit_card()
+
+        # Pay off the credit card in full when possible
+        if player.credit_card and player.credit_card.balance_cents > 0:
+            balance = player.credit_card.balance_cents
+            if game.payments.pay(player, balance, order=(CASH, BANK)).fully_paid:
+                player.credit_card.pay_cents(balance)
+
+class PassivePolicy(DecisionPolicy):
+    """
+    Makes the same life stage decisions as the default policy but takes no monthly
+    actions, so nothing it does depends on the quiet months in between and
+    SimulationEngine.fast_forward can skip them.
+    """
+    def monthly_actions(self, game):
+        pass
+
+class SimulationEngine:
+    """
+    Runs the game without a display.
+    Owns the monthly tick and resolves life stage events through a DecisionPolicy.
+    """
+    def __init__(self, game=None, policy=None, seed=None):
+        if game is None:
+            game = Game(seed)
+            game.monthly_tick = MonthlyTick(BATCHED_STAGES)  # Settle each month's bills in one pass
+            game.notifications = NotificationQueue(mode=COUNT)  # Nobody reads them, so just count them
+            game.history = SnapshotHistory(0)  # Batches never rewind
+        self.game = game
+        self.policy = policy if policy is not None else DecisionPolicy()
+        self.end_reason = None
+
+    def start(self, name="Player"):
+        """Create a new player and make the opening choices (bank account and debit card)."""
+        self.game.player = Player(name)
+
+        if self.policy.open_bank_account(self.game):
+            self.game.player.bank_account = BankAccount()
+            self.game.player.bank_account.deposit(50)  # Parents give you $50 to start
+
+            if self.policy.get_debit_card(self.game):
+                self.game.player.debit_card = Card("Debit")
+
+        return self.game.player
+
+    def advance_month(self):
+        """
+        Advance the game by one month.
+        Returns a dict describing the random event and life stage events that occurred;
+        "life_event" is the first life stage event of the month and "life_events" lists all of them.
+        "all_paid" is False if a bill went unpaid.
+        """
+        game = self.game
+        report = {"random_event": None, "life_event": None, "life_events": []}
+
+        # Calendar, finances and random events
+        tick = game.advance_month()
+        if tick["random_event"]:
+            report["random_event"] = tick["random_event"]["event"]["name"]
+
+        # Life stage events based on age (several can come due in the same month)
+        life_event = game.get_life_stage_event()
+        while life_event:
+            self.handle_life_stage_event(life_event)
+            report["life_events"].append(life_event)
+            life_event = game.get_life_stage_event()
+
+        if report["life_events"]:
+            report["life_event"] = report["life_events"][0]
+        report["all_paid"] = tick["all_paid"]
+
+        self.policy.monthly_actions(game)
+
+        # Check game over conditions
+        if game.player.age >= 65:  # Retirement age
+            game.game_over = True
+            self.end_reason = "retirement"
+
+        return report
+
+    def fast_forward(self, max_months=None):
+        """
+        Jump through quiet months, then play the month in which something happens
+        (a random event, life stage event or retirement).
+        Returns that month's report, with "months" (the number of months advanced)
+        and "stop_reason" (see Game.fast_forward) added.
+
+        Skipping months is only exact for a policy that acts on events alone (a
+        PassivePolicy): the skipped months don't call monthly_actions. For any other
+        policy the quiet months are played one at a time with its monthly actions,
+        stopping at the same months.
+        """
+        if not isinstance(self.policy, PassivePolicy):
+            return self.step_to_next_event(max_months)
+
+        months, reason = self.game.fast_forward(max_months)
+
+        if reason in ("random_event", "life_event", "retirement"):
+            report = self.advance_month()
+            months += 1
+        else:
+            report = {"random_event": None, "life_event": None, "life_events": []}
+
+        report["months"] = months
+        report["stop_reason"] = reason
+        return report
+
+    def step_to_next_event(self, max_months=None):
+        """Play month by month up to the next month in which something happens (see fast_forward)."""
+        report = {"random_event": None, "life_event": None, "life_events": []}
+        months = 0
+        reason = "limit"
+        while max_months is None or months < max_months:
+            report = self.advance_month()
+            months += 1
+
+            if self.game.game_over:
+                reason = "retirement"
+            elif report["random_event"]:
+                reason = "random_event"
+            elif report["life_events"]:
+                reason = "life_event"
+            elif not report["all_paid"]:
+                reason = "missed_payment"
+            else:
+                continue
+            break
+
+        report["months"] = months
+        report["stop_reason"] = reason
+        return report
+
+    def run(self, max_months=None):
+        """
+        Advance month by month until the player retires or max_months have passed.
+        Starts a new player first if the game doesn't have one yet.
+        """
+        if self.game.player is None:
+            self.start()
+
+        months = 0
+        while not self.game.game_over and (max_months is None or months < max_months):
+            self.advance_month()
+            months += 1
+
+        return self.game
+
+    def handle_life_stage_event(self, event):
+        """Resolve a life stage event using the decision policy."""
+        game = self.game
+        policy = self.policy
+
+        if event == "high_school_graduation":
+            choice = policy.choose_education(game)
+            if choice == "college":
+                game.attend_college()
+            elif choice == "trade school":
+                game.attend_trade_school()
+            else:
+                game.start_working()
+                self.look_for_job()
+
+        elif event == "college_graduation":
+            game.graduate_college()
+            self.look_for_job()
+
+        elif event == "job_opportunity":
+            self.look_for_job()
+
+        elif event == "car_purchase":
+            car = policy.choose_car(game, CAR_OPTIONS)
+            if car:
+                payment_method = policy.choose_car_payment(game, car, game.get_car_payment_options(car))
+                game.purchase_car(car, payment_method)
+
+        elif event == "house_purchase":
+            house = policy.choose_house(game, HOUSE_OPTIONS)
+            if house:
+                payment_options = game.get_down_payment_options(house)
+                if payment_options:
+                    game.purchase_house(house, policy.choose_down_payment(game, house, payment_options))
+
+        elif event == "family_planning":
+            profile = game.generate_family_profile()
+            if policy.start_family(game, profile):
+                game.start_family(profile)
+                if policy.have_children(game, profile):
+                    game.have_children(profile["num_children"])
+
+    def look_for_job(self):
+        """Let the policy pick a job and apply for it. Returns True if the player was hired."""
+        job = self.policy.choose_job(self.game, self.game.generate_job_options())
+        return job is not None and self.game.apply_for_job(job)
@@ -1,37 +1,58 @@
-import random
 import time
 import os
+from moneySmartz.constants import (
+    CAR_OPTIONS, HOUSE_OPTIONS, RANDOM_EVENT_CHANCE, FAMILY_PLANNING_CHANCE, INFLATION_RATE, INFLATION_FACTORS,
+    SNAPSHOT_CAPACITY, AUTO_LOAN_RATES, MORTGAGE_RATES, MID_MONTH_DAY
+)
 from moneySmartz.models import Player, BankAccount, Card, Loan, Asset
-from moneySmartz.screens.life_event_screens import HousingScreen, FamilyPlanningScreen
-from moneySmartz.screens.base_screens import EndGameScreen
+from moneySmartz.rng import RNGRegistry
+from moneySmartz.scheduler import LifeStageTrigger, LifeStageScheduler
+from moneySmartz.tick import MonthlyTick
+from moneySmartz.money import to_cents, to_dollars, apply_rate, monthly_interest
+from moneySmartz.payments import PaymentRouter, Obligation, CASH, BANK, CREDIT_CARD, get_card_minimum_payment
+from moneySmartz.notifications import NotificationQueue, MISSED_PAYMENT, UNAFFORDABLE_EXPENSE, CARD_INTEREST
+from moneySmartz.ledger import DEPOSIT, WITHDRAWAL
+from moneySmartz.payoff import get_debts, compare_strategies, MINIMUM
+from moneySmartz.snapshots import SnapshotHistory
+
+# The monthly credit card minimum payment (its amount is worked out from the balance when it's settled)
+CARD_MINIMUM_OBLIGATION = Obligation("card_minimum", None, order=(CASH, BANK), penalty=50, card_payment=True)
 
 class Game:
     """
     Main game class that manages the game state and logic.
     """
-    def __init__(self):
+    def __init__(self, seed=None):
         self.player = None
         self.current_month = 1
         self.current_year = 0
         self.game_over = False
+        self.rng = RNGRegistry(seed)  # Independent random streams per subsystem
         self.events = self.initialize_events()
+        self.life_stages = LifeStageScheduler(self.create_life_stage_triggers())
+        self.monthly_tick = MonthlyTick()  # Pipeline of stages run each month
+        self.payments = PaymentRouter()  # Cash -> bank -> credit card fallback for bills
+        self.notifications = NotificationQueue()  # Missed payments etc., shown by the front end
+        self.history = SnapshotHistory(SNAPSHOT_CAPACITY)  # Recent monthly states, for rewinding
         self.gui_manager = None  # Will be set by the main script
 
     def initialize_events(self):
         """Initialize the random events that can occur during gameplay."""
+        rng = self.rng.stream("events")
+
         # Define possible random events
         events = {
             "positive": [
-                {"name": "Tax Refund", "description": "You received a tax refund!", "cash_effect": lambda: random.randint(100, 1000)},
-                {"name": "Birthday Gift", "description": "You received money as a birthday gift!", "cash_effect": lambda: random.randint(20, 200)},
-                {"name": "Found Money", "description": "You found money on the ground!", "cash_effect": lambda: random.randint(5, 50)},
-                {"name": "Bonus", "description": "You received a bonus at work!", "cash_effect": lambda: int(self.player.salary * random.uniform(0.01, 0.1)) if self.player.salary > 0 else 0},
+                {"name": "Tax Refund", "description": "You received a tax refund!", "cash_effect": lambda: rng.randint(100, 1000)},
+                {"name": "Birthday Gift", "description": "You received money as a birthday gift!", "cash_effect": lambda: rng.randint(20, 200)},
+                {"name": "Found Money", "description": "You found money on the ground!", "cash_effect": lambda: rng.randint(5, 50)},
+                {"name": "Bonus", "description": "You received a bonus at work!", "cash_effect": lambda: int(self.player.salary * rng.uniform(0.01, 0.1)) if self.player.salary > 0 else 0},
             ],
             "negative": [
-                {"name": "Car Repair", "description": "Your car needs repairs.", "cash_effect": lambda: -random.randint(100, 2000) if any(a.asset_type == "Car" for a in self.player.assets) else 0},
-                {"name": "Medical Bill", "description": "You have unexpected medical expenses.", "cash_effect": lambda: -random.randint(50, 5000)},
+                {"name": "Car Repair", "description": "Your car needs repairs.", "cash_effect": lambda: -rng.randint(100, 2000) if self.player.assets.has_type("Car") else 0},
+                {"name": "Medical Bill", "description": "You have unexpected medical expenses.", "cash_effect": lambda: -rng.randint(50, 5000)},
                 {"name": "Lost Wallet", "description": "You lost your wallet!", "cash_effect": lambda: -min(50, self.player.cash)},
-                {"name": "Phone Repair", "description": "Your phone screen cracked.", "cash_effect": lambda: -random.randint(50, 300)},
+                {"name": "Phone Repair", "description": "Your phone screen cracked.", "cash_effect": lambda: -rng.randint(50, 300)},
             ]
         }
         return events
@@ -74,26 +95,12 @@ class Game:
     def game_loop(self):
         """Main game loop for text mode (legacy)."""
         while not self.game_over:
-            self.current_month += 1
-            if self.current_month > 12:
-                self.current_month = 1
-                self.current_year += 1
-                self.player.age += 1
-
-                # Apply interest to savings
-                if self.player.bank_account and self.player.bank_account.account_type == "Savings":
-                    self.player.bank_account.apply_interest()
-
-                # Age assets
-                for asset in self.player.assets:
-                    asset.age_asset()
-
-            # Process monthly income and expenses
-            self.process_monthly_finances()
+            report = self.advance_month()
+            self.print_notifications()
 
             # Random events
-            if random.random() < 0.3:  # 30% chance of an event each month
-                self.trigger_random_event()
+            if report["random_event"]:
+                self.display_random_event(report["random_event"])
 
             # Life stage events based on age
             self.check_life_stage_events()
@@ -106,143 +113,461 @@ class Game:
             if self.player.age >= 65:  # Retirement age
                 self.end_game("retirement")
 
+    def advance_month(self):
+        """
+        Advance the game by one month by running the monthly tick pipeline.
+        Returns the month's report (see moneySmartz.tick.MonthlyTick.run).
+        """
+        self.history.record(self)
+        return self.monthly_tick.run(self)
+
+    def rewind(self, months=12):
+        """
+        Rewind the game by up to the given number of months (see SnapshotHistory.rewind).
+        Returns the number of months rewound.
+        """
+        rewound = self.history.rewind(self, months)
+        if rewound:
+            self.notifications.drain()  # They were about the abandoned months
+        return rewound
+
+    def can_rewind(self):
+        """Check whether there's an earlier month to rewind to."""
+        return self.history.can_rewind(self)
+
+    def print_notifications(self):
+        """Print the waiting notifications (text mode)."""
+        for notification in self.notifications.drain():
+            print(notification.message)
+
+    def advance_calendar(self):
+        """
+        Advance the calendar by one month. At the start of a new year the player ages.
+        Returns True if a new year started.
+        """
+        self.current_month += 1
+        if self.current_month > 12:
+            self.current_month = 1
+            self.current_year += 1
+            self.player.age += 1
+
+        # Stamp the month's transactions; the bills are paid on its first day
+        self.player.ledger.month_index = self.get_month_index()
+        self.player.ledger.day = 0
+        return self.current_month == 1
+
+    def start_mid_month(self):
+        """Stamp the rest of the month's transactions (after the bills) with the middle of the month."""
+        self.player.ledger.day = MID_MONTH_DAY
+
+    def close_card_statement(self):
+        """Close the credit card's statement for last month, charging interest on an unpaid balance."""
+        card = self.player.credit_card
+        if card:
+            interest = card.close_statement(self.get_month_index() - 1)
+            if interest > 0:
+                self.notifications.post(CARD_INTEREST, f"${to_dollars(interest):.2f}")
+
+    def apply_savings_interest(self):
+        """Apply a year's interest to a savings account."""
+        if self.player.bank_account and self.player.bank_account.account_type == "Savings":
+            self.player.bank_account.apply_interest()
+
+    def age_assets(self):
+        """Age the player's assets by one year, a type at a time."""
+        rng = self.rng.stream("housing")
+        for asset_type in self.player.assets.get_types():
+            self.player.assets.age_type(asset_type, rng)
+
     def process_monthly_finances(self):
-        """Process monthly income and expenses."""
-        # Process income
+        """
+        Process monthly income and expenses.
+        Returns True if every payment was made, False if any was missed.
+        """
+        self.process_income()
+        return self.settle_monthly_bills()
+
+    def process_income(self):
+        """Pay the month's salary, auto depositing 80% to the bank if an account exists."""
         if self.player.job:
-            monthly_income = self.player.salary / 12
-            self.player.cash += monthly_income
+            monthly_income = to_cents(self.player.salary / 12)
+            self.player.cash_cents += monthly_income
 
             # Auto deposit to bank if account exists
             if self.player.bank_account:
-                deposit_amount = monthly_income * 0.8  # 80% of income goes to bank
-                self.player.bank_account.deposit(deposit_amount)
-                self.player.cash -= deposit_amount
+                deposit_amount = apply_rate(monthly_income, 0.8)  # 80% of income goes to bank
+                self.player.bank_account.deposit_cents(deposit_amount)
+                self.player.cash_cents -= deposit_amount
 
-        # Process loan payments
+    def process_loan_payments(self):
+        """Make the month's loan payments. Returns False if any payment was missed."""
+        all_paid = True
         for loan in self.player.loans:
-            if self.player.cash >= loan.monthly_payment:
-                self.player.cash -= loan.monthly_payment
-                loan.make_payment(loan.monthly_payment)
-            elif self.player.bank_account and self.player.bank_account.balance >= loan.monthly_payment:
-                self.player.bank_account.withdraw(loan.monthly_payment)
-                loan.make_payment(loan.monthly_payment)
-            elif self.player.credit_card and (self.player.credit_card.balance + loan.monthly_payment) <= self.player.credit_card.limit:
-                self.player.credit_card.charge(loan.monthly_payment)
-                loan.make_payment(loan.monthly_payment)
+            amount_due = loan.get_amount_due_cents()
+            if amount_due <= 0:
+                continue  # Paid off
+
+            if self.payments.pay(self.player, amount_due, penalty=30).fully_paid:
+                loan.make_payment_cents(amount_due)
             else:
                 # Missed payment - credit score impact
-                self.player.credit_score -= 30
-                print(f"You missed a payment on your {loan.loan_type} loan. Your credit score has been affected.")
-
-        # Process credit card minimum payments (5% of balance)
-        if self.player.credit_card and self.player.credit_card.balance > 0:
-            min_payment = max(25, self.player.credit_card.balance * 0.05)  # Minimum $25 or 5% of balance
-
-            if self.player.cash >= min_payment:
-                self.player.cash -= min_payment
-                self.player.credit_card.pay(min_payment)
-            elif self.player.bank_account and self.player.bank_account.balance >= min_payment:
-                self.player.bank_account.withdraw(min_payment)
-                self.player.credit_card.pay(min_payment)
+                all_paid = False
+                self.notifications.post(MISSED_PAYMENT, f"{loan.loan_type} loan", -30)
+
+        return all_paid
+
+    def process_card_minimum_payment(self):
+        """Make the credit card minimum payment (5% of balance). Returns False if it was missed."""
+        if self.player.credit_card and self.player.credit_card.balance_cents > 0:
+            min_payment = get_card_minimum_payment(self.player.credit_card.balance_cents)  # Minimum $25 or 5% of balance
+
+            if self.payments.pay(self.player, min_payment, order=(CASH, BANK), penalty=50).fully_paid:
+                self.player.credit_card.pay_cents(min_payment)
             else:
                 # Missed payment - credit score impact
-                self.player.credit_score -= 50
-                print("You missed your credit card payment. Your credit score has been severely affected.")
+                self.notifications.post(MISSED_PAYMENT, "credit card", -50)
+                return False
+
+        return True
+
+    def process_living_expenses(self):
+        """Pay the month's living expenses. Returns False if they couldn't be paid."""
+        living_expenses = self.calculate_living_expenses()
+
+        if not self.payments.pay(self.player, living_expenses, penalty=20).fully_paid:
+            # Couldn't pay living expenses - game over?
+            self.notifications.post(UNAFFORDABLE_EXPENSE, "living expenses", -20)
+            return False
+
+        return True
+
+    def settle_monthly_bills(self):
+        """
+        Pay the month's loan payments, credit card minimum and living expenses in one batched pass
+        (the same rules as the separate loans, card minimum and living expenses steps).
+        Returns True if every payment was made, False if any was missed.
+        """
+        card = self.player.credit_card
+        loans = []
+        obligations = []
+        for loan in self.player.loans:
+            if loan.current_balance_cents > 0:  # Skip paid off loans
+                loans.append(loan)
+                obligations.append(Obligation(loan.loan_type, loan.get_amount_due_cents(), penalty=30))
+
+        # The minimum payment is only due if the card carries a balance (a loan payment may be charged to it first)
+        card_due = card is not None and (card.balance_cents > 0 or bool(loans))
+        if card_due:
+            obligations.append(CARD_MINIMUM_OBLIGATION)
+        obligations.append(Obligation("living_expenses", self.calculate_living_expenses(), penalty=20))
+
+        shortfalls = self.payments.settle(self.player, obligations)
+        all_paid = True
+
+        for loan, obligation, shortfall in zip(loans, obligations, shortfalls):
+            if shortfall:
+                # Missed payment - credit score impact
+                all_paid = False
+                self.notifications.post(MISSED_PAYMENT, f"{loan.loan_type} loan", -30)
+            else:
+                loan.make_payment_cents(obligation.amount)
+
+        if card_due and shortfalls[-2]:
+            all_paid = False
+            self.notifications.post(MISSED_PAYMENT, "credit card", -50)
+
+        if shortfalls[-1]:
+            all_paid = False
+            self.notifications.post(UNAFFORDABLE_EXPENSE, "living expenses", -20)
 
-        # Process living expenses
+        return all_paid
+
+    def calculate_living_expenses(self):
+        """Calculate this month's living expenses in cents, adjusted for inflation."""
         living_expenses = 1000  # Base living expenses
 
-        if any(a.asset_type == "House" for a in self.player.assets):
+        if self.player.assets.has_type("House"):
             living_expenses += 500  # Additional expenses for homeowners
 
-        if any(a.asset_type == "Car" for a in self.player.assets):
+        if self.player.assets.has_type("Car"):
             living_expenses += 200  # Car maintenance and gas
 
         if self.player.family:
             living_expenses += 500 * len(self.player.family)  # Additional expenses per family member
 
         # Adjust for inflation over time (2% per year)
-        inflation_factor = (1.02) ** self.current_year
-        living_expenses *= inflation_factor
-
-        # Pay living expenses
-        if self.player.cash >= living_expenses:
-            self.player.cash -= living_expenses
-        elif self.player.bank_account and self.player.bank_account.balance >= living_expenses:
-            self.player.bank_account.withdraw(living_expenses)
-        elif self.player.credit_card and (self.player.credit_card.balance + living_expenses) <= self.player.credit_card.limit:
-            self.player.credit_card.charge(living_expenses)
+        if self.current_year < len(INFLATION_FACTORS):
+            inflation_factor = INFLATION_FACTORS[self.current_year]
         else:
-            # Couldn't pay living expenses - game over?
-            print("You couldn't afford your living expenses this month!")
-            # For now, just reduce credit score
-            self.player.credit_score -= 20
-
-    def trigger_random_event(self):
-        """Trigger a random financial event."""
-        # Decide if it's a positive or negative event
-        event_type = "positive" if random.random() < 0.5 else "negative"
-        event = random.choice(self.events[event_type])
+            inflation_factor = (1 + INFLATION_RATE) ** self.current_year
+
+        return to_cents(living_expenses * inflation_factor)
+
+    def roll_for_random_event(self):
+        """Roll for this month's random event. Returns True if one occurs."""
+        return self.rng.random("events") < RANDOM_EVENT_CHANCE
+
+    # Fast-forward through quiet months
+
+    def fast_forward(self, max_months=None):
+        """
+        Advance through quiet months: months with no random event, no life stage event,
+        no retirement and no missed payment. Stretches of steady finances within a year
+        are advanced in closed form instead of month by month.
+
+        Stops before the month in which a random event, life stage event or retirement
+        happens, leaving that month for the normal monthly tick. Other months run the
+        tick pipeline without its events and life stages stages. A month with a missed
+        payment is processed and then the fast-forward stops.
+
+        Returns a (months_advanced, reason) tuple, where reason is "random_event",
+        "life_event", "retirement", "missed_payment" or "limit".
+        """
+        months = 0
+        while max_months is None or months < max_months:
+            self.history.record(self)
+
+            limit = 12 - self.current_month  # Months left in this calendar year
+            if max_months is not None:
+                limit = min(limit, max_months - months)
+
+            steady_months, source = self.get_steady_months(limit)
+
+            if steady_months == 0:
+                # The next month starts a new year, or the finances are too irregular
+                # for the closed form, so play it exactly
+                quiet, reason = self.roll_quiet_months(1)
+                if quiet:
+                    report = self.monthly_tick.run(self, skip=("events", "life_stages"))
+                    months += 1
+                    if not report["all_paid"]:
+                        return months, "missed_payment"
+            else:
+                quiet, reason = self.roll_quiet_months(steady_months)
+                self.advance_steady_months(quiet, source)
+                months += quiet
+
+            if reason:
+                return months, reason
+
+        return months, "limit"
+
+    def roll_quiet_months(self, limit):
+        """
+        Roll the monthly random event checks for up to limit upcoming months, stopping at the
+        first month in which a random event, life stage event or retirement would happen.
+        The roll for that month is pushed back so the normal monthly tick draws it again.
+        Returns a (quiet_months, reason) tuple; reason is None if all the months are quiet.
+        """
+        scheduler = self.get_life_stage_scheduler()
+        if scheduler.pending:
+            return 0, "life_event"
+
+        # Months until the player turns 65 (ages rise each January)
+        retirement = (65 - self.player.age - 1) * 12 + (13 - self.current_month)
+        next_due = scheduler.next_due()
+        life_event = next_due - self.get_month_index() if next_due is not None else limit + 1
+
+        for quiet in range(limit):
+            if quiet + 1 >= retirement:
+                return quiet, "retirement"
+
+            if quiet + 1 >= life_event:
+                return quiet, "life_event"
+
+            event_roll = self.rng.random("events")
+            if event_roll < RANDOM_EVENT_CHANCE:
+                self.rng.push_back("events", event_roll)
+                return quiet, "random_event"
+
+        return limit, None
+
+    def get_steady_months(self, limit):
+        """
+        Work out how many of the next limit months (within the current year) have steady
+        finances that can be advanced in closed form: the credit card carries no balance,
+        no loan is paid off, and every loan payment and living expense is paid either
+        entirely from cash ("cash") or entirely from the bank account ("bank").
+        Returns a (months, source) tuple; months is 0 if the closed form doesn't apply.
+        """
+        player = self.player
+        if limit <= 0 or (player.credit_card and player.credit_card.balance_cents > 0):
+            return 0, None
+
+        # Extension stages may change anything, so only the built-in pipeline has a closed form
+        if not self.monthly_tick.is_builtin():
+            return 0, None
+
+        loans = [loan for loan in player.loans if loan.current_balance_cents > 0]
+        payments = [loan.monthly_payment_cents for loan in loans]
+        payments.append(self.calculate_living_expenses())
+        total = sum(payments)
+
+        # Monthly income (in cents), split between cash and the automatic bank deposit
+        income = to_cents(player.salary / 12) if player.job else 0
+        deposit = apply_rate(income, 0.8) if player.job and player.bank_account else 0
+        cash_income = income - deposit
+
+        # Paid from cash: cash before paying, cash + cash_income * (t + 1) - total * t, must cover the total every month
+        cash = player.cash_cents
+        months = self.count_months_at_least(cash + cash_income - total, cash_income - total, limit)
+        source = "cash"
+
+        if not months:
+            # Paid from the bank: cash must stay below every payment while the bank covers the total
+            smallest = min(payments)
+            if not player.bank_account or cash + cash_income >= smallest:
+                return 0, None
+            if cash_income > 0:
+                limit = min(limit, -((cash - smallest) // cash_income) - 1)
+
+            balance = player.bank_account.balance_cents
+            months = self.count_months_at_least(balance + deposit - total, deposit - total, limit)
+            source = "bank"
+
+        # Loans must keep a balance through the stretch (the payoff month is played exactly)
+        for loan in loans:
+            months = self.get_steady_loan_months(loan, months)
+
+        return months, source if months else None
+
+    @staticmethod
+    def count_months_at_least(start, step, limit):
+        """Count the leading months t = 0, 1, ... (up to limit) for which start + step * t >= 0."""
+        if start < 0 or limit <= 0:
+            return 0
+        if step >= 0:
+            return limit
+        return min(limit, start // -step + 1)
+
+    @staticmethod
+    def get_steady_loan_months(loan, limit):
+        """Count the next months (up to limit) in which a loan takes its regular payment and still has a balance after it."""
+        balance = loan.current_balance_cents
+        for month in range(limit):
+            principal = loan.monthly_payment_cents - monthly_interest(balance, loan.interest_rate)
+            if principal >= balance:
+                return month  # The final payment
+            if principal > 0:
+                balance -= principal
+        return limit
+
+    def advance_steady_months(self, months, source):
+        """
+        Advance the calendar and finances by a number of months found by get_steady_months,
+        using the closed form for cash and bank balances. Never crosses into a new year.
+        """
+        if months <= 0:
+            return
 
-        cash_effect = event["cash_effect"]()
+        player = self.player
+        self.current_month += months
+
+        income = to_cents(player.salary / 12) if player.job else 0
+        deposit = apply_rate(income, 0.8) if player.job and player.bank_account else 0
+        living_expenses = self.calculate_living_expenses()
+        loans = [loan for loan in player.loans if loan.current_balance_cents > 0]  # Paid off loans cost nothing
+        payments = [loan.monthly_payment_cents for loan in loans]
+        total = sum(payments) + living_expenses
+
+        # Cash and bank balances change linearly
+        player.cash_cents += (income - deposit) * months
+        if source == "cash":
+            player.cash_cents -= total * months
+
+        account = player.bank_account
+        if account:
+            if deposit > 0:
+                account.balance_cents += deposit * months
+            if source == "bank":
+                account.balance_cents -= total * months
+
+        # The month's transactions are recorded month by month, and each month's interest
+        # is rounded to the cent, so loans amortize month by month
+        ledger = player.ledger
+        ledger.day = 0
+        first_month = self.get_month_index() - months + 1
+        for month_index in range(first_month, first_month + months):
+            ledger.month_index = month_index
+            if account:
+                if deposit > 0:
+                    account.record(DEPOSIT, deposit)
+                if source == "bank":
+                    for amount in payments:
+                        account.record(WITHDRAWAL, amount)
+                    account.record(WITHDRAWAL, living_expenses)
+            for loan in loans:
+                loan.make_payment_cents(loan.monthly_payment_cents)
+        ledger.day = MID_MONTH_DAY
+
+        # A card without a balance closes its statements without interest
+        if player.credit_card:
+            player.credit_card.statement_balance_cents = 0
+            player.credit_card.last_interest_cents = 0
+
+    def choose_random_event(self):
+        """
+        Pick a random event and roll its cash effect.
+        Returns an (event, cash_effect) tuple.
+        """
+        rng = self.rng.stream("events")
 
-        # Only show events that have an effect
-        if cash_effect != 0:
-            self.clear_screen()
-            print("\n" + "!" * 60)
-            print(f"LIFE EVENT: {event['name']}")
-            print(event["description"])
+        # Decide if it's a positive or negative event
+        event_type = "positive" if rng.random() < 0.5 else "negative"
+        event = rng.choice(self.events[event_type])
+
+        return event, event["cash_effect"]()
+
+    def apply_event_cash_effect(self, cash_effect):
+        """
+        Apply the cash effect of a random event to the player.
+        Expenses are paid from cash, then the bank account, then the credit card.
+        Returns a message describing how the effect was handled.
+        """
+        if cash_effect > 0:
+            self.player.cash_cents += to_cents(cash_effect)
+            return f"You received ${cash_effect}!"
+
+        result = self.payments.pay(self.player, to_cents(abs(cash_effect)), penalty=15)
+        if not result.fully_paid:
+            return "You couldn't afford this expense! Your credit score has been affected."
+
+        return {
+            CASH: "You paid in cash.",
+            BANK: "You paid using your bank account.",
+            CREDIT_CARD: "You paid using your credit card."
+        }[result.source]
+
+    def display_random_event(self, random_event):
+        """Show a random event recorded in the month's report (text mode)."""
+        self.clear_screen()
+        print("\n" + "!" * 60)
+        print(f"LIFE EVENT: {random_event['event']['name']}")
+        print(random_event["event"]["description"])
 
-            if cash_effect > 0:
-                print(f"You received ${cash_effect}!")
-                self.player.cash += cash_effect
-            else:
-                print(f"This costs you ${abs(cash_effect)}.")
-
-                # Handle payment
-                if self.player.cash >= abs(cash_effect):
-                    self.player.cash -= abs(cash_effect)
-                    print("You paid in cash.")
-                elif self.player.bank_account and self.player.bank_account.balance >= abs(cash_effect):
-                    self.player.bank_account.withdraw(abs(cash_effect))
-                    print("You paid using your bank account.")
-                elif self.player.credit_card and (self.player.credit_card.balance + abs(cash_effect)) <= self.player.credit_card.limit:
-                    self.player.credit_card.charge(abs(cash_effect))
-                    print("You paid using your credit card.")
-                else:
-                    print("You couldn't afford this expense! Your credit score has been affected.")
-                    self.player.credit_score -= 15
+        if random_event["cash_effect"] < 0:
+            print(f"This costs you ${abs(random_event['cash_effect'])}.")
+        print(random_event["message"])
 
-            print("!" * 60)
-            input("\nPress Enter to continue...")
+        print("!" * 60)
+        input("\nPress Enter to continue...")
 
     def check_life_stage_events(self):
         """Check for and trigger life stage events based on player age."""
-        # High school graduation
-        if self.player.age == 18 and self.player.education == "High School":
-            self.high_school_graduation_event()
-
-        # College graduation (if went to college)
-        if self.player.age == 22 and self.player.education == "College (In Progress)":
-            self.college_graduation_event()
-
-        # First full-time job opportunity
-        if self.player.age == 22 and not self.player.job and self.player.education != "College (In Progress)":
-            self.job_opportunity_event()
-
-        # Car purchase opportunity
-        if self.player.age == 20 and not any(a.asset_type == "Car" for a in self.player.assets):
-            self.car_purchase_opportunity()
-
-        # House purchase opportunity
-        if self.player.age == 30 and not any(a.asset_type == "House" for a in self.player.assets) and self.player.job:
-            self.house_purchase_opportunity()
+        handlers = {
+            "high_school_graduation": self.high_school_graduation_event,
+            "college_graduation": self.college_graduation_event,
+            "job_opportunity": self.job_opportunity_event,
+            "car_purchase": self.car_purchase_opportunity,
+            "house_purchase": self.house_purchase_opportunity,
+            "family_planning": self.family_planning_opportunity
+        }
 
-        # Family planning opportunity
-        if self.player.age >= 28 and not self.player.family and self.player.job:
-            if random.random() < 0.1:  # 10% chance each year after 28
-                self.family_planning_opportunity()
+        # Handle every event that came due this month
+        event = self.get_life_stage_event()
+        while event:
+            handlers[event]()
+            event = self.get_life_stage_event()
 
     def high_school_graduation_event(self):
         """Handle the high school graduation event."""
@@ -263,60 +588,37 @@ class Game:
             print("\nYou've decided to go to college. This is a significant investment")
             print("in your future that could lead to higher-paying jobs.")
 
-            # Check if player can afford college
-            annual_cost = 20000
-            if self.player.cash >= annual_cost:
-                print(f"\nYou pay the first year's tuition of ${annual_cost} in cash.")
-                self.player.cash -= annual_cost
-            elif self.player.bank_account and self.player.bank_account.balance >= annual_cost:
-                print(f"\nYou pay the first year's tuition of ${annual_cost} from your bank account.")
-                self.player.bank_account.withdraw(annual_cost)
+            loan = self.attend_college()
+            if loan is None:
+                print("\nYou pay the first year's tuition of $20000 upfront.")
             else:
-                # Need a student loan
                 print("\nYou don't have enough money to pay for college upfront.")
                 print("You'll need to take out student loans.")
+                print(f"\nYou've taken out a student loan for ${loan.original_amount:.0f}.")
+                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for {loan.term_years} years.")
 
-                loan_amount = 80000  # 4 years of college
-                loan = Loan("Student", loan_amount, 0.05, 20)  # 5% interest, 20-year term
-                self.player.loans.append(loan)
-
-                print(f"\nYou've taken out a student loan for ${loan_amount}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 20 years.")
-
-            self.player.education = "College (In Progress)"
             print("\nYou're now a college student! Your education will take 4 years.")
 
         elif choice == choices[1]:  # Trade school
             print("\nYou've decided to go to trade school. This is a practical choice")
             print("that will give you specific skills for certain careers.")
 
-            # Check if player can afford trade school
-            cost = 10000
-            if self.player.cash >= cost:
-                print(f"\nYou pay the trade school tuition of ${cost} in cash.")
-                self.player.cash -= cost
-            elif self.player.bank_account and self.player.bank_account.balance >= cost:
-                print(f"\nYou pay the trade school tuition of ${cost} from your bank account.")
-                self.player.bank_account.withdraw(cost)
+            loan = self.attend_trade_school()
+            if loan is None:
+                print("\nYou pay the trade school tuition of $10000 upfront.")
             else:
-                # Need a student loan
                 print("\nYou don't have enough money to pay for trade school upfront.")
                 print("You'll need to take out a student loan.")
+                print(f"\nYou've taken out a student loan for ${loan.original_amount:.0f}.")
+                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for {loan.term_years} years.")
 
-                loan = Loan("Student", cost, 0.05, 10)  # 5% interest, 10-year term
-                self.player.loans.append(loan)
-
-                print(f"\nYou've taken out a student loan for ${cost}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 10 years.")
-
-            self.player.education = "Trade School"
             print("\nYou're now a trade school student! Your education will take 2 years.")
 
         else:  # Start working
             print("\nYou've decided to start working full-time without further education.")
             print("You'll start with entry-level positions, but can work your way up.")
 
-            self.player.education = "High School Graduate"
+            self.start_working()
             self.job_opportunity_event()
 
         input("\nPress Enter to continue...")
@@ -330,8 +632,7 @@ class Game:
         print("\nCongratulations! You've graduated from college with a bachelor's degree.")
         print("Your education will open up better job opportunities.")
 
-        self.player.education = "College Graduate"
-        self.player.credit_score += 20  # Education boosts credit score
+        self.graduate_college()
 
         print("\nYour credit score has increased due to your educational achievement.")
         print(f"Your credit score is now {self.player.credit_score}.")
@@ -349,50 +650,7 @@ class Game:
         print("LIFE EVENT: JOB OPPORTUNITY")
         print("=" * 60)
 
-        # Generate job options based on education
-        job_options = []
-
-        if self.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": 25000},
-                {"title": "Food Service Worker", "salary": 22000},
-                {"title": "Warehouse Worker", "salary": 28000},
-            ]
-        elif self.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician Apprentice", "salary": 35000},
-                {"title": "Plumber Assistant", "salary": 32000},
-                {"title": "HVAC Technician", "salary": 38000},
-            ]
-        elif self.player.education == "College Graduate":
-            job_options = [
-                {"title": "Entry-Level Accountant", "salary": 50000},
-                {"title": "Marketing Coordinator", "salary": 45000},
-                {"title": "Software Developer", "salary": 65000},
-            ]
-
-        # Display job options
-        print("\nThe following job opportunities are available to you:")
-        for i, job in enumerate(job_options):
-            print(f"{i+1}. {job['title']} - ${job['salary']}/year")
-
-        # Get player choice
-        choice = 0
-        while choice < 1 or choice > len(job_options):
-            try:
-                choice = int(input(f"\nWhich job would you like to take? (1-{len(job_options)}): "))
-            except ValueError:
-                print("Please enter a valid number.")
-
-        # Apply job
-        selected_job = job_options[choice-1]
-        self.player.job = selected_job["title"]
-        self.player.salary = selected_job["salary"]
-
-        print(f"\nCongratulations! You are now a {self.player.job} earning ${self.player.salary}/year.")
-        print(f"Your monthly income is ${self.player.salary/12:.2f}.")
-
-        input("\nPress Enter to continue...")
+        self.choose_job()
 
     def car_purchase_opportunity(self):
         """Handle car purchase opportunity."""
@@ -407,12 +665,7 @@ class Game:
 
         if choice == "Yes":
             # Car options
-            car_options = [
-                {"name": "Used Economy Car", "value": 5000},
-                {"name": "New Economy Car", "value": 18000},
-                {"name": "Used Luxury Car", "value": 15000},
-                {"name": "New Luxury Car", "value": 35000},
-            ]
+            car_options = CAR_OPTIONS
 
             print("\nHere are your car options:")
             for i, car in enumerate(car_options):
@@ -432,37 +685,17 @@ class Game:
             print(f"\nYou've selected the {selected_car['name']} for ${selected_car['value']}.")
             print("How would you like to pay?")
 
-            payment_options = ["Cash"]
-            if self.player.bank_account and self.player.bank_account.balance >= selected_car['value']:
-                payment_options.append("Bank Account")
-            payment_options.append("Auto Loan")
-
-            payment_choice = self.get_choice("Select payment method:", payment_options)
-
-            if payment_choice == "Cash" and self.player.cash >= selected_car['value']:
-                self.player.cash -= selected_car['value']
-                print(f"\nYou paid ${selected_car['value']} in cash for your new car.")
-            elif payment_choice == "Bank Account":
-                self.player.bank_account.withdraw(selected_car['value'])
-                print(f"\nYou paid ${selected_car['value']} from your bank account for your new car.")
-            else:  # Auto Loan
-                # Determine loan terms based on credit score
-                if self.player.credit_score >= 700:
-                    interest_rate = 0.03  # 3%
-                elif self.player.credit_score >= 650:
-                    interest_rate = 0.05  # 5%
-                else:
-                    interest_rate = 0.08  # 8%
-
-                loan = Loan("Auto", selected_car['value'], interest_rate, 5)  # 5-year auto loan
-                self.player.loans.append(loan)
+            payment_choice = self.get_choice("Select payment method:", self.get_car_payment_options(selected_car))
 
+            loan = self.purchase_car(selected_car, payment_choice)
+            if loan is None:
+                source = "in cash" if payment_choice == "Cash" else "from your bank account"
+                print(f"\nYou paid ${selected_car['value']} {source} for your new car.")
+            else:
                 print(f"\nYou've taken out an auto loan for ${selected_car['value']}.")
-                print(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
-                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 5 years.")
+                print(f"Your interest rate is {loan.interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
+                print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for {loan.term_years} years.")
 
-            # Add car to assets
-            self.player.assets.append(Asset("Car", selected_car['name'], selected_car['value']))
             print(f"\nCongratulations on your new {selected_car['name']}!")
 
         else:
@@ -483,12 +716,7 @@ class Game:
 
         if choice == "Yes":
             # House options
-            house_options = [
-                {"name": "Small Starter Home", "value": 150000},
-                {"name": "Mid-size Family Home", "value": 250000},
-                {"name": "Large Luxury Home", "value": 500000},
-                {"name": "Urban Condo", "value": 200000},
-            ]
+            house_options = HOUSE_OPTIONS
 
             print("\nHere are your housing options:")
             for i, house in enumerate(house_options):
@@ -503,56 +731,34 @@ class Game:
                     print("Please enter a valid number.")
 
             selected_house = house_options[house_choice-1]
-
-            # Calculate down payment (20% is standard)
-            down_payment = selected_house['value'] * 0.2
-            loan_amount = selected_house['value'] - down_payment
+            down_payment = selected_house['value'] * 0.2  # 20% is standard
 
             print(f"\nYou've selected the {selected_house['name']} for ${selected_house['value']}.")
             print(f"A standard mortgage requires a 20% down payment of ${down_payment}.")
 
             # Check if player can afford down payment
-            if self.player.cash < down_payment and (not self.player.bank_account or self.player.bank_account.balance < down_payment):
+            payment_options = self.get_down_payment_options(selected_house)
+            if not payment_options:
                 print("\nYou don't have enough money for the down payment.")
                 print("You'll need to save up more money before buying a house.")
                 input("\nPress Enter to continue...")
                 return
 
-            # Down payment options
-            payment_options = []
-            if self.player.cash >= down_payment:
-                payment_options.append("Cash")
-            if self.player.bank_account and self.player.bank_account.balance >= down_payment:
-                payment_options.append("Bank Account")
-
             payment_choice = self.get_choice("How would you like to pay the down payment?", payment_options)
 
-            if payment_choice == "Cash":
-                self.player.cash -= down_payment
-                print(f"\nYou paid ${down_payment} in cash for your down payment.")
-            else:  # Bank Account
-                self.player.bank_account.withdraw(down_payment)
-                print(f"\nYou paid ${down_payment} from your bank account for your down payment.")
-
-            # Determine mortgage terms based on credit score
-            if self.player.credit_score >= 750:
-                interest_rate = 0.035  # 3.5%
-            elif self.player.credit_score >= 700:
-                interest_rate = 0.04   # 4.0%
-            elif self.player.credit_score >= 650:
-                interest_rate = 0.045  # 4.5%
-            else:
-                interest_rate = 0.055  # 5.5%
+            if not self.purchase_house(selected_house, payment_choice):
+                print("\nThe down payment couldn't be made.")
+                input("\nPress Enter to continue...")
+                return
 
-            loan = Loan("Mortgage", loan_amount, interest_rate, 30)  # 30-year mortgage
-            self.player.loans.append(loan)
+            source = "in cash" if payment_choice == "Cash" else "from your bank account"
+            print(f"\nYou paid ${down_payment} {source} for your down payment.")
 
-            print(f"\nYou've taken out a mortgage for ${loan_amount}.")
-            print(f"Your interest rate is {interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
-            print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for 30 years.")
+            loan = self.player.loans[-1]  # The new mortgage
+            print(f"\nYou've taken out a mortgage for ${loan.original_amount}.")
+            print(f"Your interest rate is {loan.interest_rate*100:.1f}% based on your credit score of {self.player.credit_score}.")
+            print(f"Your monthly payment will be ${loan.monthly_payment:.2f} for {loan.term_years} years.")
 
-            # Add house to assets
-            self.player.assets.append(Asset("House", selected_house['name'], selected_house['value']))
             print(f"\nCongratulations on your new {selected_house['name']}!")
 
         else:
@@ -572,18 +778,14 @@ class Game:
         choice = self.get_choice("Would you like to start a family?", ["Yes", "No"])
 
         if choice == "Yes":
-            # Add a spouse
-            spouse_age = self.player.age - random.randint(-3, 3)  # Spouse age is close to player age
-            self.player.family.append({"relation": "Spouse", "age": spouse_age})
+            profile = self.generate_family_profile()
+            self.start_family(profile)
 
             print("\nCongratulations! You've gotten married.")
-            print(f"Your spouse is {spouse_age} years old.")
+            print(f"Your spouse is {profile['spouse_age']} years old.")
 
-            # Chance for dual income
-            if random.random() < 0.7:  # 70% chance of spouse having a job
-                spouse_income = int(self.player.salary * random.uniform(0.5, 1.5))  # Spouse income relative to player
-                self.player.salary += spouse_income  # Add spouse income to family income
-                print(f"Your spouse has a job that adds ${spouse_income}/year to your family income.")
+            if profile["spouse_has_job"]:
+                print(f"Your spouse has a job that adds ${profile['spouse_income']}/year to your family income.")
                 print(f"Your combined family income is now ${self.player.salary}/year.")
             else:
                 print("Your spouse doesn't currently have a job.")
@@ -592,12 +794,8 @@ class Game:
             child_choice = self.get_choice("Would you like to have children?", ["Yes", "No"])
 
             if child_choice == "Yes":
-                num_children = random.randint(1, 3)  # Random number of children
-
-                for i in range(num_children):
-                    child_name = f"Child {i+1}"  # Placeholder name
-                    child_age = 0  # Newborn
-                    self.player.family.append({"relation": "Child", "name": child_name, "age": child_age})
+                num_children = profile["num_children"]
+                self.have_children(num_children)
 
                 print(f"\nCongratulations! You now have {num_children} {'child' if num_children == 1 else 'children'}.")
                 print("Having children will increase your monthly expenses.")
@@ -652,22 +850,8 @@ class Game:
                 else:
                     print(f"{member['relation']}: {member['name']}, Age {member['age'] + self.current_year}")
 
-        # Calculate and display net worth
-        cash = self.player.cash
-        bank_balance = self.player.bank_account.balance if self.player.bank_account else 0
-        credit_card_debt = self.player.credit_card.balance if self.player.credit_card else 0
-
-        loan_debt = 0
-        for loan in self.player.loans:
-            loan_debt += loan.current_balance
-
-        asset_value = 0
-        for asset in self.player.assets:
-            asset_value += asset.current_value
-
-        net_worth = cash + bank_balance - credit_card_debt - loan_debt + asset_value
-
-        print(f"\nNET WORTH: ${net_worth:.2f}")
+        # Display net worth
+        print(f"\nNET WORTH: ${self.player.balance_sheet.net_worth:.2f}")
 
         print("\n" + "=" * 60)
 
@@ -698,6 +882,8 @@ class Game:
         if self.player.loans:
             actions.append("View loans")
             actions.append("Make extra loan payment")
+        if self.player.balance_sheet.debt_cents > 0:
+            actions.append("Plan debt payoff")
 
         # Asset actions
         if self.player.assets:
@@ -706,9 +892,12 @@ class Game:
         # Job actions
         if not self.player.job and self.player.age >= 16:
             actions.append("Look for a job")
-        elif self.player.job and random.random() < 0.1:  # 10% chance of job opportunity each month
+        elif self.player.job and self.rng.stream("ui").random() < 0.1:  # 10% chance of job opportunity each month
             actions.append("Look for a better job")
 
+        if self.can_rewind():
+            actions.append("Rewind one year")
+
         # Display actions
         print("\nWhat would you like to do?")
         for i, action in enumerate(actions):
@@ -747,10 +936,15 @@ class Game:
             self.view_loans()
         elif action == "Make extra loan payment":
             self.make_extra_loan_payment()
+        elif action == "Plan debt payoff":
+            self.plan_debt_payoff()
         elif action == "View assets":
             self.view_assets()
         elif action == "Look for a job" or action == "Look for a better job":
             self.look_for_job()
+        elif action == "Rewind one year":
+            months = self.rewind(12)
+            print(f"\nYou went back {months} months. It's now {self.current_month}/{self.current_year + 2023}.")
 
         # After action, show status again and get another action
         self.display_status()
@@ -826,11 +1020,11 @@ class Game:
             print("\nRecent Transactions:")
             for i, transaction in enumerate(reversed(self.player.bank_account.transaction_history[-5:])):
                 if transaction["type"] == "deposit":
-                    print(f"  Deposit: +${transaction['amount']:.2f}")
+                    print(f"  Deposit: +${to_dollars(transaction['amount']):.2f}")
                 elif transaction["type"] == "withdrawal":
-                    print(f"  Withdrawal: -${transaction['amount']:.2f}")
+                    print(f"  Withdrawal: -${to_dollars(transaction['amount']):.2f}")
                 elif transaction["type"] == "interest":
-                    print(f"  Interest: +${transaction['amount']:.2f}")
+                    print(f"  Interest: +${to_dollars(transaction['amount']):.2f}")
 
         input("\nPress Enter to continue...")
 
@@ -982,25 +1176,29 @@ class Game:
         print(f"Current Balance: ${self.player.credit_card.balance:.2f}")
         print(f"Available Credit: ${self.player.credit_card.limit - self.player.credit_card.balance:.2f}")
 
-        # Calculate minimum payment
-        min_payment = max(25, self.player.credit_card.balance * 0.05)  # Minimum $25 or 5% of balance
-
-        if self.player.credit_card.balance > 0:
-            print(f"\nMinimum Payment Due: ${min_payment:.2f}")
-            print("Interest Rate: 18% APR on unpaid balances")
+        card = self.player.credit_card
+        if card.balance > 0:
+            min_payment = get_card_minimum_payment(card.balance_cents)  # Minimum $25 or 5% of balance
+            print(f"\nMinimum Payment Due: ${to_dollars(min_payment):.2f}")
+            print(f"Interest Rate: {card.interest_rate * 100:.0f}% APR on unpaid balances")
 
-            # Show interest that would be charged
-            monthly_interest = self.player.credit_card.balance * 0.18 / 12
-            print(f"Interest This Month (if unpaid): ${monthly_interest:.2f}")
+            # Interest is charged on the average daily balance unless the last statement is paid in full
+            print(f"Last Statement Balance: ${to_dollars(card.statement_balance_cents):.2f}")
+            if card.last_interest_cents > 0:
+                print(f"Interest Charged on Last Statement: ${to_dollars(card.last_interest_cents):.2f}")
+            if card.statement_balance_cents > 0:
+                print("Pay the statement balance in full this month to avoid interest.")
 
         # Show recent transactions
         if self.player.credit_card.transaction_history:
             print("\nRecent Transactions:")
             for i, transaction in enumerate(reversed(self.player.credit_card.transaction_history[-5:])):
                 if transaction["type"] == "charge":
-                    print(f"  Charge: +${transaction['amount']:.2f}")
+                    print(f"  Charge: +${to_dollars(transaction['amount']):.2f}")
                 elif transaction["type"] == "payment":
-                    print(f"  Payment: -${transaction['amount']:.2f}")
+                    print(f"  Payment: -${to_dollars(transaction['amount']):.2f}")
+                elif transaction["type"] == "interest":
+                    print(f"  Interest: +${to_dollars(transaction['amount']):.2f}")
 
         input("\nPress Enter to continue...")
 
@@ -1011,12 +1209,13 @@ class Game:
         print("PAY CREDIT CARD")
         print("=" * 60)
 
-        print(f"\nCurrent Credit Card Balance: ${self.player.credit_card.balance:.2f}")
+        card = self.player.credit_card
+        print(f"\nCurrent Credit Card Balance: ${card.balance:.2f}")
 
-        # Calculate minimum payment
-        min_payment = max(25, self.player.credit_card.balance * 0.05)  # Minimum $25 or 5% of balance
+        # Calculate minimum payment (in cents)
+        min_payment = get_card_minimum_payment(card.balance_cents)  # Minimum $25 or 5% of balance
 
-        print(f"Minimum Payment Due: ${min_payment:.2f}")
+        print(f"Minimum Payment Due: ${to_dollars(min_payment):.2f}")
         print(f"Your Cash: ${self.player.cash:.2f}")
 
         if self.player.bank_account:
@@ -1024,7 +1223,7 @@ class Game:
 
         # Payment options
         payment_options = ["Minimum Payment", "Full Balance"]
-        if min_payment < self.player.credit_card.balance:
+        if min_payment < card.balance_cents:
             payment_options.insert(1, "Custom Amount")
 
         payment_choice = self.get_choice("How much would you like to pay?", payment_options)
@@ -1032,24 +1231,24 @@ class Game:
         if payment_choice == "Minimum Payment":
             payment_amount = min_payment
         elif payment_choice == "Full Balance":
-            payment_amount = self.player.credit_card.balance
+            payment_amount = card.balance_cents
         else:  # Custom Amount
             payment_amount = 0
-            while payment_amount < min_payment or payment_amount > self.player.credit_card.balance:
+            while payment_amount < min_payment or payment_amount > card.balance_cents:
                 try:
-                    payment_amount = float(input(f"\nEnter payment amount (minimum ${min_payment:.2f}): $"))
+                    payment_amount = to_cents(float(input(f"\nEnter payment amount (minimum ${to_dollars(min_payment):.2f}): $")))
                     if payment_amount < min_payment:
-                        print(f"Payment must be at least the minimum payment of ${min_payment:.2f}.")
-                    elif payment_amount > self.player.credit_card.balance:
-                        print(f"Payment cannot exceed your balance of ${self.player.credit_card.balance:.2f}.")
+                        print(f"Payment must be at least the minimum payment of ${to_dollars(min_payment):.2f}.")
+                    elif payment_amount > card.balance_cents:
+                        print(f"Payment cannot exceed your balance of ${card.balance:.2f}.")
                 except ValueError:
                     print("Please enter a valid number.")
 
         # Payment method
         payment_methods = []
-        if self.player.cash >= payment_amount:
+        if self.player.cash_cents >= payment_amount:
             payment_methods.append("Cash")
-        if self.player.bank_account and self.player.bank_account.balance >= payment_amount:
+        if self.player.bank_account and self.player.bank_account.balance_cents >= payment_amount:
             payment_methods.append("Bank Account")
 
         if not payment_methods:
@@ -1060,24 +1259,21 @@ class Game:
         payment_method = self.get_choice("How would you like to pay?", payment_methods)
 
         # Process payment
-        if payment_method == "Cash":
-            self.player.cash -= payment_amount
-            self.player.credit_card.pay(payment_amount)
-            print(f"\nYou paid ${payment_amount:.2f} from your cash.")
-        else:  # Bank Account
-            self.player.bank_account.withdraw(payment_amount)
-            self.player.credit_card.pay(payment_amount)
-            print(f"\nYou paid ${payment_amount:.2f} from your bank account.")
+        if not self.make_card_payment(payment_amount, payment_method):
+            print("\nThe payment couldn't be made.")
+            input("\nPress Enter to continue...")
+            return
 
-        print(f"Your new credit card balance is ${self.player.credit_card.balance:.2f}.")
+        source = "cash" if payment_method == "Cash" else "bank account"
+        print(f"\nYou paid ${to_dollars(payment_amount):.2f} from your {source}.")
+        print(f"Your new credit card balance is ${card.balance:.2f}.")
 
         # Credit score improvement for on-time payments
-        if payment_amount >= min_payment:
-            score_increase = min(5, 850 - self.player.credit_score)  # Cap at 850
-            if score_increase > 0:
-                self.player.credit_score += score_increase
-                print(f"\nYour on-time payment has improved your credit score by {score_increase} points.")
-                print(f"Your credit score is now {self.player.credit_score}.")
+        score_increase = min(5, 850 - self.player.credit_score)  # Cap at 850
+        if score_increase > 0:
+            self.player.credit_score += score_increase
+            print(f"\nYour on-time payment has improved your credit score by {score_increase} points.")
+            print(f"Your credit score is now {self.player.credit_score}.")
 
         input("\nPress Enter to continue...")
 
@@ -1096,19 +1292,10 @@ class Game:
             print(f"Term: {loan.term_years} years")
             print(f"Monthly Payment: ${loan.monthly_payment:.2f}")
 
-            # Calculate payoff date
-            remaining_payments = loan.current_balance / loan.monthly_payment
-            remaining_months = int(remaining_payments)
-            remaining_years = remaining_months // 12
-            remaining_months %= 12
-
-            print(f"Estimated Payoff: {remaining_years} years and {remaining_months} months")
-
-            # Calculate total interest to be paid
-            total_payments = loan.monthly_payment * remaining_payments
-            total_interest = total_payments - loan.current_balance
-
-            print(f"Remaining Interest to be Paid: ${total_interest:.2f}")
+            # Payoff date and interest from the loan's amortization schedule
+            remaining_months = loan.get_payoff_months()
+            print(f"Estimated Payoff: {remaining_months // 12} years and {remaining_months % 12} months")
+            print(f"Remaining Interest to be Paid: ${to_dollars(loan.get_remaining_interest_cents()):.2f}")
 
             if i < len(self.player.loans) - 1:
                 print("\n" + "-" * 40)
@@ -1178,39 +1365,40 @@ class Game:
 
         payment_method = self.get_choice("How would you like to pay?", payment_methods)
 
+        # What the loan would cost with only regular payments
+        months_before = selected_loan.get_payoff_months()
+        interest_before = selected_loan.get_remaining_interest_cents()
+
         # Process payment
         if payment_method == "Cash":
             self.player.cash -= payment_amount
-            selected_loan.make_payment(payment_amount)
+            selected_loan.make_extra_payment(payment_amount)
             print(f"\nYou paid ${payment_amount:.2f} from your cash.")
         else:  # Bank Account
             self.player.bank_account.withdraw(payment_amount)
-            selected_loan.make_payment(payment_amount)
+            selected_loan.make_extra_payment(payment_amount)
             print(f"\nYou paid ${payment_amount:.2f} from your bank account.")
 
         print(f"Your new loan balance is ${selected_loan.current_balance:.2f}.")
 
         # Recalculate payoff date
         if selected_loan.current_balance > 0:
-            remaining_payments = selected_loan.current_balance / selected_loan.monthly_payment
-            remaining_months = int(remaining_payments)
-            remaining_years = remaining_months // 12
-            remaining_months %= 12
+            remaining_months = selected_loan.get_payoff_months()
+            months_saved = months_before - remaining_months
 
-            print(f"\nYour extra payment has shortened your loan term!")
-            print(f"New Estimated Payoff: {remaining_years} years and {remaining_months} months")
+            if months_saved > 0:
+                print(f"\nYour extra payment has shortened your loan term by {months_saved} months!")
+            print(f"New Estimated Payoff: {remaining_months // 12} years and {remaining_months % 12} months")
 
-            # Calculate interest savings
-            original_total = selected_loan.monthly_payment * (selected_loan.term_years * 12)
-            new_total = selected_loan.monthly_payment * remaining_payments + payment_amount
-            savings = original_total - new_total
+            # Interest savings: the interest left before, minus the interest left now
+            savings = interest_before - selected_loan.get_remaining_interest_cents()
 
-            print(f"You'll save approximately ${savings:.2f} in interest over the life of the loan.")
+            print(f"You'll save ${to_dollars(savings):.2f} in interest over the life of the loan.")
         else:
             print("\nCongratulations! You've paid off this loan completely!")
 
             # Remove the loan from the player's loans
-            self.player.loans.remove(selected_loan)
+            self.player.remove_loan(selected_loan)
 
             # Credit score improvement for paying off a loan
             score_increase = min(20, 850 - self.player.credit_score)  # Cap at 850
@@ -1221,6 +1409,51 @@ class Game:
 
         input("\nPress Enter to continue...")
 
+    def plan_debt_payoff(self):
+        """Compare ways of paying off all the player's debts with an extra monthly payment."""
+        self.clear_screen()
+        print("\n" + "=" * 60)
+        print("DEBT PAYOFF PLANNER")
+        print("=" * 60)
+
+        debts = get_debts(self.player)
+        print("\nYour debts:")
+        for debt in debts:
+            print(f"- {debt.name}: ${to_dollars(debt.balance_cents):.2f} at {debt.interest_rate*100:.2f}%")
+
+        extra = -1
+        while extra < 0:
+            try:
+                extra = float(input("\nHow much extra could you pay each month? $"))
+                if extra < 0:
+                    print("Please enter zero or a positive amount.")
+            except ValueError:
+                print("Please enter a valid number.")
+
+        plans = self.get_debt_payoff_plans(to_cents(extra))
+        baseline = plans[MINIMUM].total_interest
+        for strategy, plan in plans.items():
+            print(f"\n{strategy.capitalize()}:")
+            if plan.months is None:
+                print("  Never debt free at this rate.")
+                continue
+            print(f"  Debt free in {plan.months // 12} years and {plan.months % 12} months")
+            print(f"  Total interest: ${to_dollars(plan.total_interest):.2f}", end="")
+            if strategy != MINIMUM:
+                print(f" (saves ${to_dollars(baseline - plan.total_interest):.2f})", end="")
+            print()
+
+        print("\nAvalanche pays the highest interest rate first; snowball pays the smallest balance first.")
+        input("\nPress Enter to continue...")
+
+    def get_debt_payoff_plans(self, extra_cents=0, custom_order=None):
+        """
+        Plan paying off all the player's debts with each strategy (see moneySmartz.payoff),
+        with an extra monthly payment in cents. custom_order adds a custom strategy that pays
+        the debts (indexes into get_debts) in that order. Returns a dict of strategy -> PayoffPlan.
+        """
+        return compare_strategies(get_debts(self.player), extra_cents, custom_order)
+
     def view_assets(self):
         """View asset details."""
         self.clear_screen()
@@ -1257,54 +1490,15 @@ class Game:
         print("JOB SEARCH")
         print("=" * 60)
 
-        current_salary = self.player.salary if self.player.job else 0
-
         print(f"\nCurrent Job: {self.player.job if self.player.job else 'Unemployed'}")
         if self.player.job:
-            print(f"Current Salary: ${current_salary}/year")
+            print(f"Current Salary: ${self.player.salary}/year")
 
-        # Generate job options based on education and experience
-        job_options = []
+        self.choose_job()
 
-        # Base salary multiplier based on years of experience
-        experience_years = max(0, self.player.age - 18)  # Assume working age starts at 18
-        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
-
-        if self.player.education == "High School" or self.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
-            ]
-        elif self.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
-                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
-                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
-                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
-            ]
-        elif self.player.education == "College Graduate":
-            job_options = [
-                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
-                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
-                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
-                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
-            ]
-        else:  # Default/basic jobs
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-            ]
-
-        # Add some randomness to salaries (±10%)
-        for job in job_options:
-            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
-
-        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
-        if self.player.job:
-            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
+    def choose_job(self):
+        """Show the job options (see generate_job_options) and apply for the one the player picks (text mode)."""
+        job_options = self.generate_job_options()
 
         # If no jobs available after filtering
         if not job_options:
@@ -1337,34 +1531,15 @@ class Game:
         # Apply for job
         selected_job = job_options[choice-1]
 
-        # Job application success chance based on qualifications
-        base_success_chance = 0.7  # 70% base chance
-
-        # Adjust for education
-        if self.player.education == "College Graduate":
-            base_success_chance += 0.2
-        elif self.player.education == "Trade School":
-            base_success_chance += 0.1
-
-        # Adjust for experience
-        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
-
-        # Cap at 95% chance
-        success_chance = min(0.95, base_success_chance)
-
         print(f"\nYou've applied for the {selected_job['title']} position.")
         print("The hiring manager is reviewing your application...")
         time.sleep(2)  # Dramatic pause
 
-        if random.random() < success_chance:
-            print("\nCongratulations! You got the job!")
-
-            old_job = self.player.job
-            old_salary = self.player.salary
-
-            self.player.job = selected_job["title"]
-            self.player.salary = selected_job["salary"]
+        old_job = self.player.job
+        old_salary = self.player.salary
 
+        if self.apply_for_job(selected_job):
+            print("\nCongratulations! You got the job!")
             print(f"\nYou are now a {self.player.job} earning ${self.player.salary}/year.")
 
             if old_job:
@@ -1412,28 +1587,17 @@ class Game:
             print("=" * 60)
             print(f"\nYour financial journey has ended after {self.current_year} years.")
 
-        # Calculate net worth
-        cash = self.player.cash
-        bank_balance = self.player.bank_account.balance if self.player.bank_account else 0
-        credit_card_debt = self.player.credit_card.balance if self.player.credit_card else 0
-
-        loan_debt = 0
-        for loan in self.player.loans:
-            loan_debt += loan.current_balance
-
-        asset_value = 0
-        for asset in self.player.assets:
-            asset_value += asset.current_value
-
-        net_worth = cash + bank_balance - credit_card_debt - loan_debt + asset_value
+        # Final totals from the balance sheet
+        sheet = self.player.balance_sheet
+        net_worth = sheet.net_worth
 
         # Display final stats
         print("\n--- FINAL FINANCIAL SUMMARY ---")
-        print(f"Cash: ${cash:.2f}")
-        print(f"Bank Balance: ${bank_balance:.2f}")
-        print(f"Credit Card Debt: ${credit_card_debt:.2f}")
-        print(f"Loan Debt: ${loan_debt:.2f}")
-        print(f"Asset Value: ${asset_value:.2f}")
+        print(f"Cash: ${sheet.cash:.2f}")
+        print(f"Bank Balance: ${to_dollars(sheet.bank_cents):.2f}")
+        print(f"Credit Card Debt: ${to_dollars(sheet.card_debt_cents):.2f}")
+        print(f"Loan Debt: ${to_dollars(sheet.loan_debt_cents):.2f}")
+        print(f"Asset Value: ${sheet.asset_value:.2f}")
         print(f"Net Worth: ${net_worth:.2f}")
         print(f"Credit Score: {self.player.credit_score}")
 
@@ -1447,16 +1611,7 @@ class Game:
                     print(f"{member['relation']}: {member['name']}, Age {member['age'] + self.current_year}")
 
         # Financial rating
-        if net_worth >= 1000000:
-            rating = "Financial Wizard"
-        elif net_worth >= 500000:
-            rating = "Financially Secure"
-        elif net_worth >= 100000:
-            rating = "Financially Stable"
-        elif net_worth >= 0:
-            rating = "Breaking Even"
-        else:
-            rating = "In Debt"
+        rating = self.get_financial_rating(net_worth)
 
         print(f"\nFinancial Rating: {rating}")
 
@@ -1466,46 +1621,407 @@ class Game:
         self.game_over = True
         input("\nPress Enter to exit...")
 
+    def calculate_net_worth(self):
+        """Return the player's net worth (cash, bank balance and assets minus all debt) from their balance sheet."""
+        return self.player.balance_sheet.net_worth
+
+    def get_financial_rating(self, net_worth):
+        """Get the end of game financial rating for a net worth."""
+        if net_worth >= 1000000:
+            return "Financial Wizard"
+        elif net_worth >= 500000:
+            return "Financially Secure"
+        elif net_worth >= 100000:
+            return "Financially Stable"
+        elif net_worth >= 0:
+            return "Breaking Even"
+        else:
+            return "In Debt"
+
     def end_game_gui(self, reason):
         """End the game and show final stats (GUI version)."""
+        from moneySmartz.screens.base_screens import EndGameScreen
         self.game_over = True
         self.gui_manager.set_screen(EndGameScreen(self, reason))
 
     def check_life_stage_events_gui(self):
         """Check for life stage events and show appropriate screens (GUI version)."""
-        # High school graduation
-        if self.player.age == 18 and self.player.education == "High School":
+        event = self.get_life_stage_event()
+
+        if event == "high_school_graduation":
             from moneySmartz.screens.life_event_screens import HighSchoolGraduationScreen
             self.gui_manager.set_screen(HighSchoolGraduationScreen(self))
-            return True
-
-        # College graduation (if went to college)
-        elif self.player.age == 22 and self.player.education == "College (In Progress)":
+        elif event == "college_graduation":
             from moneySmartz.screens.life_event_screens import CollegeGraduationScreen
             self.gui_manager.set_screen(CollegeGraduationScreen(self))
-            return True
-
-        # First full-time job opportunity
-        elif self.player.age == 22 and not self.player.job and self.player.education != "College (In Progress)":
+        elif event == "job_opportunity":
             from moneySmartz.screens.financial_screens import JobSearchScreen
             self.gui_manager.set_screen(JobSearchScreen(self))
-            return True
-
-        # Car purchase opportunity
-        elif self.player.age == 20 and not any(a.asset_type == "Car" for a in self.player.assets):
+        elif event == "car_purchase":
             from moneySmartz.screens.life_event_screens import CarPurchaseScreen
             self.gui_manager.set_screen(CarPurchaseScreen(self))
+        elif event == "house_purchase":
+            from moneySmartz.screens.life_event_screens import HousingScreen
+            self.gui_manager.set_screen(HousingScreen(self))
+        elif event == "family_planning":
+            from moneySmartz.screens.life_event_screens import FamilyPlanningScreen
+            self.gui_manager.set_screen(FamilyPlanningScreen(self))
+        else:
+            return False
+
+        return True
+
+    def get_life_stage_event(self):
+        """
+        Return the next life stage event due for the player, or None.
+        Returns "high_school_graduation", "college_graduation", "job_opportunity",
+        "car_purchase", "house_purchase" or "family_planning". When several events
+        come due in the same month they are returned one at a time by successive calls.
+        """
+        scheduler = self.get_life_stage_scheduler()
+        scheduler.collect_due(self)
+        return scheduler.pop_event(self)
+
+    def has_pending_life_stage_event(self):
+        """Check whether a life stage event that already came due is waiting to be handled."""
+        return bool(self.get_life_stage_scheduler().pending)
+
+    def get_life_stage_scheduler(self):
+        """Return the life stage scheduler, arming it first if the player is new."""
+        if self.life_stages.player is not self.player:
+            self.life_stages.reset(self)
+        return self.life_stages
+
+    def notify_life_stage_change(self, *keys):
+        """
+        Tell the life stage scheduler that part of the player's state changed
+        ("job", "education", "assets" or "family"), re-arming triggers that wait on it.
+        """
+        scheduler = self.get_life_stage_scheduler()
+        for key in keys:
+            scheduler.notify(key, self)
+
+    def create_life_stage_triggers(self):
+        """Create the life stage triggers: the age window and conditions for each event."""
+        return [
+            # High school graduation
+            LifeStageTrigger("high_school_graduation", 18, 18,
+                             lambda game: game.player.education == "High School",
+                             ("education",)),
+            # College graduation (if went to college)
+            LifeStageTrigger("college_graduation", 22, 22,
+                             lambda game: game.player.education == "College (In Progress)",
+                             ("education",)),
+            # First full-time job opportunity
+            LifeStageTrigger("job_opportunity", 22, 22,
+                             lambda game: not game.player.job and game.player.education != "College (In Progress)",
+                             ("job", "education")),
+            # Car purchase opportunity
+            LifeStageTrigger("car_purchase", 20, 20,
+                             lambda game: not game.player.assets.has_type("Car"),
+                             ("assets",)),
+            # House purchase opportunity
+            LifeStageTrigger("house_purchase", 30, 30,
+                             lambda game: not game.player.assets.has_type("House") and game.player.job,
+                             ("assets", "job")),
+            # Family planning opportunity (10% chance each month once eligible)
+            LifeStageTrigger("family_planning", 28, None,
+                             lambda game: not game.player.family and game.player.job,
+                             ("family", "job"), chance=FAMILY_PLANNING_CHANCE, stream="family"),
+        ]
+
+    def get_month_index(self):
+        """Return the number of months since the start of the game."""
+        return self.current_year * 12 + self.current_month - 1
+
+    # Life event actions shared by the GUI screens and the headless engine
+
+    def attend_college(self):
+        """
+        Enroll in college, paying the first year upfront or taking out a student loan.
+        Returns the student loan, or None if the tuition was paid upfront.
+        """
+        annual_cost = 20000
+        loan = None
+        if not self.payments.pay(self.player, to_cents(annual_cost), order=(CASH, BANK)).fully_paid:
+            # Need a student loan
+            loan_amount = 80000  # 4 years of college
+            loan = Loan("Student", loan_amount, 0.05, 20)  # 5% interest, 20-year term
+            self.player.add_loan(loan)
+
+        self.player.education = "College (In Progress)"
+        self.notify_life_stage_change("education")
+        return loan
+
+    def attend_trade_school(self):
+        """
+        Enroll in trade school, paying upfront or taking out a student loan.
+        Returns the student loan, or None if the tuition was paid upfront.
+        """
+        cost = 10000
+        loan = None
+        if not self.payments.pay(self.player, to_cents(cost), order=(CASH, BANK)).fully_paid:
+            # Need a student loan
+            loan = Loan("Student", cost, 0.05, 10)  # 5% interest, 10-year term
+            self.player.add_loan(loan)
+
+        self.player.education = "Trade School"
+        self.notify_life_stage_change("education")
+        return loan
+
+    def start_working(self):
+        """Skip further education and start working full-time."""
+        self.player.education = "High School Graduate"
+        self.notify_life_stage_change("education")
+
+    def graduate_college(self):
+        """Graduate from college."""
+        self.player.education = "College Graduate"
+        self.notify_life_stage_change("education")
+        self.player.credit_score += 20  # Education boosts credit score
+
+    def generate_job_options(self):
+        """Generate job options based on player's education and experience."""
+        job_options = []
+
+        # Current job info
+        current_salary = self.player.salary if self.player.job else 0
+
+        # Base salary multiplier based on years of experience
+        experience_years = max(0, self.player.age - 18)  # Assume working age starts at 18
+        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
+
+        # Generate job options based on education
+        if self.player.education == "High School" or self.player.education == "High School Graduate":
+            job_options = [
+                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
+                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
+                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
+                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
+            ]
+        elif self.player.education == "Trade School":
+            job_options = [
+                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
+                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
+                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
+                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
+            ]
+        elif self.player.education == "College Graduate":
+            job_options = [
+                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
+                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
+                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
+                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
+            ]
+        else:  # Default/basic jobs
+            job_options = [
+                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
+                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
+                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
+            ]
+
+        # Add some randomness to salaries (±10%)
+        for job in job_options:
+            job["salary"] = int(job["salary"] * self.rng.stream("jobs").uniform(0.9, 1.1))
+
+        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
+        if self.player.job:
+            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
+
+        return job_options
+
+    def apply_for_job(self, job):
+        """
+        Apply for a job.
+        Returns True and updates the player's job and salary if the application succeeds.
+        """
+        # Job application success chance based on qualifications
+        base_success_chance = 0.7  # 70% base chance
+
+        # Adjust for education
+        if self.player.education == "College Graduate":
+            base_success_chance += 0.2
+        elif self.player.education == "Trade School":
+            base_success_chance += 0.1
+
+        # Adjust for experience
+        experience_years = max(0, self.player.age - 18)
+        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
+
+        # Cap at 95% chance
+        success_chance = min(0.95, base_success_chance)
+
+        if self.rng.stream("jobs").random() < success_chance:
+            self.player.job = job["title"]
+            self.notify_life_stage_change("job")
+            self.player.salary = job["salary"]
             return True
+        return False
 
-        # House purchase opportunity
-        elif self.player.age == 30 and not any(a.asset_type == "House" for a in self.player.assets) and self.player.job:
-            self.gui_manager.set_screen(HousingScreen(self))
+    def calculate_credit_limit(self):
+        """Calculate the credit limit offered to the player based on income and credit score."""
+        base_limit = min(self.player.salary * 0.2, 5000)  # 20% of salary or $5000, whichever is lower
+
+        # Adjust based on credit score
+        if self.player.credit_score >= 750:
+            return base_limit * 1.5
+        elif self.player.credit_score >= 700:
+            return base_limit * 1.2
+        elif self.player.credit_score >= 650:
+            return base_limit
+        elif self.player.credit_score >= 600:
+            return base_limit * 0.8
+        else:
+            return base_limit * 0.5
+
+    def open_credit_card(self):
+        """Open a credit card for the player. Returns the credit limit."""
+        credit_limit = self.calculate_credit_limit()
+        self.player.credit_card = Card("Credit", credit_limit)
+        return credit_limit
+
+    def pay_with_method(self, amount, payment_method):
+        """
+        Pay an amount in cents from the source a payment method names ("Cash" or "Bank Account").
+        Nothing is taken unless the source covers it all. Returns True if it was paid.
+        """
+        source = CASH if payment_method == "Cash" else BANK
+        return self.payments.pay(self.player, amount, order=(source,)).fully_paid
+
+    def make_card_payment(self, amount, payment_method):
+        """
+        Pay an amount in cents off the credit card with a payment method ("Cash" or "Bank Account").
+        The money is only taken if the card accepts the payment (more than nothing and no more
+        than the balance). Returns True if it was paid.
+        """
+        card = self.player.credit_card
+        if not 0 < amount <= card.balance_cents:
+            return False
+        if not self.pay_with_method(amount, payment_method):
+            return False
+        card.pay_cents(amount)
+        return True
+
+    def get_loan_rate(self, tiers):
+        """Return the interest rate of the best (minimum credit score, rate) tier the player's credit score qualifies for."""
+        for min_score, interest_rate in tiers:
+            if self.player.credit_score >= min_score:
+                return interest_rate
+        return tiers[-1][1]
+
+    def get_auto_loan_rate(self):
+        """Return the auto loan interest rate offered to the player, based on their credit score."""
+        return self.get_loan_rate(AUTO_LOAN_RATES)
+
+    def get_mortgage_rate(self):
+        """Return the mortgage interest rate offered to the player, based on their credit score."""
+        return self.get_loan_rate(MORTGAGE_RATES)
+
+    def get_car_payment_options(self, car):
+        """Get the payment methods available for a car."""
+        payment_options = ["Cash"]
+
+        if self.player.bank_account and self.player.bank_account.balance >= car['value']:
+            payment_options.append("Bank Account")
+
+        payment_options.append("Auto Loan")
+        return payment_options
+
+    def purchase_car(self, car, payment_method):
+        """
+        Buy a car with the given payment method and add it to the player's assets.
+        Returns the auto loan, or None if the car was paid for upfront.
+        """
+        loan = None
+        # Pay up front through the payment router; an auto loan covers the price otherwise
+        # (also when the cash or bank account can't cover it)
+        if payment_method not in ("Cash", "Bank Account") or not self.pay_with_method(to_cents(car['value']), payment_method):
+            # Determine loan terms based on credit score
+            interest_rate = self.get_auto_loan_rate()
+
+            loan = Loan("Auto", car['value'], interest_rate, 5)  # 5-year auto loan
+            self.player.add_loan(loan)
+
+        self.player.add_asset(Asset("Car", car['name'], car['value']))
+        self.notify_life_stage_change("assets")
+        return loan
+
+    def get_down_payment_options(self, house, mortgage=True):
+        """
+        Get the payment methods that can cover the down payment on a house
+        (or its full price, when buying without a mortgage).
+        """
+        payment_options = []
+        down_payment = house['value'] * 0.2 if mortgage else house['value']
+
+        if self.player.cash >= down_payment:
+            payment_options.append("Cash")
+
+        if self.player.bank_account and self.player.bank_account.balance >= down_payment:
+            payment_options.append("Bank Account")
+
+        return payment_options
+
+    def purchase_house(self, house, payment_method, mortgage=True):
+        """
+        Buy a house with a 20% down payment and a 30-year mortgage, or pay the full price
+        up front if mortgage is False.
+        The down payment (or full price) is made with the given payment method.
+        Returns False (and buys nothing) if the payment method can't cover it.
+        """
+        # Calculate down payment (20% is standard)
+        down_payment = house['value'] * 0.2 if mortgage else house['value']
+        loan_amount = house['value'] - down_payment
+
+        # Process down payment
+        if not self.pay_with_method(to_cents(down_payment), payment_method):
+            return False
+
+        if not mortgage:
+            self.player.add_asset(Asset("House", house['name'], house['value']))
+            self.notify_life_stage_change("assets")
             return True
 
-        # Family planning opportunity
-        elif self.player.age >= 28 and not self.player.family and self.player.job:
-            if random.random() < 0.1:  # 10% chance each year after 28
-                self.gui_manager.set_screen(FamilyPlanningScreen(self))
-                return True
+        # Create mortgage
+        interest_rate = self.get_mortgage_rate()
 
-        return False
+        loan = Loan("Mortgage", loan_amount, interest_rate, 30)  # 30-year mortgage
+        self.player.add_loan(loan)
+
+        self.player.add_asset(Asset("House", house['name'], house['value']))
+        self.notify_life_stage_change("assets")
+        return True
+
+    def generate_family_profile(self):
+        """Roll the details of a potential spouse and children."""
+        rng = self.rng.stream("family")
+
+        spouse_age = self.player.age - rng.randint(-3, 3)  # Spouse age is close to player age
+        spouse_has_job = rng.random() < 0.7  # 70% chance of spouse having a job
+
+        if spouse_has_job:
+            spouse_income = int(self.player.salary * rng.uniform(0.5, 1.5))  # Spouse income relative to player
+        else:
+            spouse_income = 0
+
+        return {
+            "spouse_age": spouse_age,
+            "spouse_has_job": spouse_has_job,
+            "spouse_income": spouse_income,
+            "num_children": rng.randint(1, 3)  # Random number of children
+        }
+
+    def start_family(self, profile):
+        """Get married, adding the spouse's income to the family income."""
+        self.player.family.append({"relation": "Spouse", "age": profile["spouse_age"]})
+        self.notify_life_stage_change("family")
+
+        if profile["spouse_has_job"]:
+            self.player.salary += profile["spouse_income"]
+
+    def have_children(self, num_children):
+        """Add newborn children to the family."""
+        for i in range(num_children):
+            child_name = f"Child {i+1}"  # Placeholder name
+            child_age = 0  # Newborn
+            self.player.family.append({"relation": "Child", "name": child_name, "age": child_age})
@@ -0,0 +1,365 @@
+"""
+The financial ledger for Money Smartz.
+
+Every transaction on the player's bank account, credit card and loans is an
+entry in one append-only Ledger, stored as typed array columns: the game month
+(and day of the month) it happened in, the account it belongs to, its kind and
+its amount in cents. An entry takes about 40 bytes: 18 for the columns and its
+place in the account's row index, and 22 for its place in its EntryIndex (row,
+month and two running totals), against 200+ for the dicts each account used to keep.
+
+Each account and kind also has an EntryIndex: the sorted months of its entries
+and running totals of their amounts (and of their amounts weighted by day).
+Questions like "interest earned in year Y", "card charges in the last 12 months",
+"payments on this loan between two months" or "the card's average daily balance
+this month" are answered in O(log n) from them, however long the game has run.
+
+Accounts see their own entries through LedgerView, a read-only list-like view
+that indexes into the columns without copying them, so existing code can keep
+reading account.transaction_history as a list of {"type", "amount"} dicts.
+A loan payment is recorded as two entries (the interest and the principal),
+an extra payment on a loan as a single principal entry.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Entry kinds
+DEPOSIT = 0
+WITHDRAWAL = 1
+INTEREST = 2
+CHARGE = 3
+PAYMENT = 4
+LOAN_INTEREST = 5
+LOAN_PRINCIPAL = 6
+
+KIND_NAMES = ("deposit", "withdrawal", "interest", "charge", "payment", "loan_interest", "loan_principal")
+
+MAX_MONTH = 0xFFFF  # Largest month index a ledger can hold
+MONTH_DAYS = 30     # Days in a ledger month (a credit card statement cycle)
+
+def get_year_range(year):
+    """Return the (first, last) month indexes of a game year."""
+    return year * 12, year * 12 + 11
+
+class EntryIndex:
+    """
+    The entries of one kind on one account: their row numbers and months (both sorted,
+    since the ledger only grows) and the running totals of their amounts and of their
+    amounts times their day of the month, so either total over any range of months is
+    two binary searches and a subtraction.
+    by_amount is built on demand for amount queries (see Ledger.sum_above).
+    """
+    __slots__ = ("rows", "months", "totals", "day_totals", "by_amount")
+
+    def __init__(self):
+        self.rows = array("I")
+        self.months = array("H")
+        self.totals = array("q", [0])      # totals[i] is the sum of the first i amounts
+        self.day_totals = array("q", [0])  # day_totals[i] is the sum of the first i amounts times their days
+        self.by_amount = None              # (sorted amounts, running totals from the largest down)
+
+    def get_range(self, first_month, last_month):
+        """Return the (start, stop) positions of the entries from first_month to last_month (inclusive)."""
+        return bisect_left(self.months, first_month), bisect_right(self.months, last_month)
+
+    def truncate(self, length):
+        """Drop the entries in rows from length on."""
+        count = bisect_left(self.rows, length)
+        if count < len(self.rows):
+            del self.rows[count:]
+            del self.months[count:]
+            del self.totals[count + 1:]
+            del self.day_totals[count + 1:]
+            self.by_amount = None
+
+class Ledger:
+    """
+    An append-only ledger of the entries of every account, in typed array columns.
+    month_index and day are the game month and day of the month (from 0 to MONTH_DAYS - 1)
+    stamped on new entries; the game keeps them current, so the entries are in month order.
+
+    Besides the columns, the ledger keeps each account's row numbers and an EntryIndex
+    per account and kind, so totals by account, kind and month range take O(log n).
+    """
+    def __init__(self):
+        self.months = array("H")    # Game month index of each entry
+        self.days = array("B")      # Day of the month of each entry
+        self.accounts = array("H")  # Account id of each entry
+        self.kinds = array("B")     # Kind code of each entry
+        self.amounts = array("q")   # Amount of each entry, in cents
+        self.account_rows = []      # Account id -> array of its entries' row numbers
+        self.indexes = {}           # (account id, kind) -> EntryIndex
+        self.month_index = 0
+        self.day = 0
+
+    def open_account(self):
+        """Open a new account in the ledger and return its id."""
+        self.account_rows.append(array("I"))
+        return len(self.account_rows) - 1
+
+    def record(self, account_id, kind, amount):
+        """Append an entry to an account."""
+        row = len(self.amounts)
+        self.account_rows[account_id].append(row)
+        self.months.append(self.month_index)
+        self.days.append(self.day)
+        self.accounts.append(account_id)
+        self.kinds.append(kind)
+        self.amounts.append(amount)
+
+        index = self.indexes.get((account_id, kind))
+        if index is None:
+            index = self.indexes[(account_id, kind)] = EntryIndex()
+        index.rows.append(row)
+        index.months.append(self.month_index)
+        index.totals.append(index.totals[-1] + amount)
+        index.day_totals.append(index.day_totals[-1] + amount * self.day)
+        index.by_amount = None
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def get_entry(self, row):
+        """Return the entry in a row as a dict with its type, amount, month and day."""
+        return {"type": KIND_NAMES[self.kinds[row]], "amount": self.amounts[row], "month": self.months[row],
+                "day": self.days[row]}
+
+    def get_indexes(self, kind=None, account_id=None):
+        """Return the EntryIndexes matching a kind and account (None for any)."""
+        if kind is not None and account_id is not None:
+            index = self.indexes.get((account_id, kind))
+            return [index] if index is not None else []
+        return [index for (index_account, index_kind), index in self.indexes.items()
+                if (kind is None or index_kind == kind) and (account_id is None or index_account == account_id)]
+
+    def sum_amounts(self, kind=None, account_id=None, first_month=0, last_month=None):
+        """
+        Add up the amounts of the entries matching a kind and account (None for any)
+        from first_month to last_month (inclusive, None for no limit).
+        """
+        if last_month is None:
+            last_month = MAX_MONTH
+
+        total = 0
+        for index in self.get_indexes(kind, account_id):
+            start, stop = index.get_range(first_month, last_month)
+            total += index.totals[stop] - index.totals[start]
+        return total
+
+    def sum_day_weighted(self, kind=None, account_id=None, first_month=0, last_month=None):
+        """
+        Add up amount x day of the month of the entries matching a kind and account
+        (None for any) from first_month to last_month (inclusive, None for no limit).
+        With sum_amounts, this gives a balance's average over the days of a month.
+        """
+        if last_month is None:
+            last_month = MAX_MONTH
+
+        total = 0
+        for index in self.get_indexes(kind, account_id):
+            start, stop = index.get_range(first_month, last_month)
+            total += index.day_totals[stop] - index.day_totals[start]
+        return total
+
+    def count(self, kind=None, account_id=None, first_month=0, last_month=None):
+        """Count the entries matching a kind and account (None for any) from first_month to last_month."""
+        if last_month is None:
+            last_month = MAX_MONTH
+
+        count = 0
+        for index in self.get_indexes(kind, account_id):
+            start, stop = index.get_range(first_month, last_month)
+            count += stop - start
+        return count
+
+    def sum_above(self, account_id, kind, min_amount):
+        """
+        Count and add up an account's entries of a kind with an amount above min_amount (in cents).
+        Returns a (count, total) tuple. The entries are sorted by amount on the first query
+        after new ones are recorded; later queries are a binary search.
+        """
+        index = self.indexes.get((account_id, kind))
+        if index is None:
+            return 0, 0
+
+        if index.by_amount is None:
+            amounts = self.amounts
+            ordered = array("q", sorted(amounts[row] for row in index.rows))
+            totals = array("q", [0]) * (len(ordered) + 1)  # totals[i] is the sum of ordered[i:]
+            for i in range(len(ordered) - 1, -1, -1):
+                totals[i] = totals[i + 1] + ordered[i]
+            index.by_amount = (ordered, totals)
+
+        ordered, totals = index.by_amount
+        start = bisect_right(ordered, min_amount)
+        return len(ordered) - start, totals[start]
+
+    def get_rows(self, account_id, kind=None, first_month=0, last_month=None):
+        """
+        Return the row numbers of an account's entries (of a kind, or of any kind if None)
+        from first_month to last_month (inclusive, None for no limit), in order.
+        """
+        if last_month is None:
+            last_month = MAX_MONTH
+
+        if kind is not None:
+            index = self.indexes.get((account_id, kind))
+            if index is None:
+                return array("I")
+            start, stop = index.get_range(first_month, last_month)
+            return index.rows[start:stop]
+
+        # The ledger is in month order, so the month range is a range of rows
+        rows = self.account_rows[account_id]
+        first_row = bisect_left(self.months, first_month)
+        last_row = bisect_right(self.months, last_month)
+        return rows[bisect_left(rows, first_row):bisect_left(rows, last_row)]
+
+    def get_state(self):
+        """Capture the ledger's length (see set_state); entries are never changed once written."""
+        return (len(self.amounts), len(self.account_rows), self.month_index, self.day)
+
+    def set_state(self, state):
+        """Drop the entries and accounts added since get_state captured the state."""
+        length, account_count, self.month_index, self.day = state
+        del self.months[length:]
+        del self.days[length:]
+        del self.accounts[length:]
+        del self.kinds[length:]
+        del self.amounts[length:]
+        del self.account_rows[account_count:]
+        for rows in self.account_rows:
+            if rows and rows[-1] >= length:
+                del rows[bisect_left(rows, length):]
+
+        for key in list(self.indexes):
+            if key[0] >= account_count:
+                del self.indexes[key]
+            else:
+                self.indexes[key].truncate(length)
+
+class LedgerView:
+    """
+    A read-only view of one account's entries, usable like a list of entry dicts.
+    Each entry dict is built when it's read; nothing is copied up front.
+    rows limits the view to some of the entries (see Ledger.get_rows).
+    """
+    def __init__(self, ledger, account_id, rows=None):
+        self.ledger = ledger
+        self.rows = ledger.account_rows[account_id] if rows is None else rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.ledger.get_entry(row) for row in self.rows[index]]
+        return self.ledger.get_entry(self.rows[index])
+
+    def __iter__(self):
+        get_entry = self.ledger.get_entry
+        return (get_entry(row) for row in self.rows)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+class LoanPaymentView(LedgerView):
+    """
+    A read-only view of a loan's payments, usable like a list of
+    {"amount", "interest", "principal"} dicts. Each payment is a pair of ledger
+    entries (the interest, then the principal); an extra payment is a principal
+    entry on its own and isn't listed.
+    """
+    def __init__(self, ledger, account_id):
+        index = ledger.indexes.get((account_id, LOAN_INTEREST))
+        super().__init__(ledger, account_id, index.rows if index is not None else array("I"))
+        self.account_rows = ledger.account_rows[account_id]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.get_payment(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("payment index out of range")
+        return self.get_payment(index)
+
+    def __iter__(self):
+        return (self.get_payment(i) for i in range(len(self)))
+
+    def get_payment(self, index):
+        """Return one payment as a dict."""
+        amounts = self.ledger.amounts
+        row = self.rows[index]
+        interest = amounts[row]
+        # The payment's principal is the loan's next entry after its interest
+        principal = amounts[self.account_rows[bisect_right(self.account_rows, row)]]
+        return {"amount": interest + principal, "interest": interest, "principal": principal}
+
+class LedgerAccount:
+    """
+    Base for models with entries in a Ledger (bank accounts, cards and loans).
+    An account records into its owner's ledger once attached to it (see Player);
+    before that, it keeps a small ledger of its own, whose entries move over on attach.
+    """
+    def __init__(self):
+        self.ledger = None
+        self.account_id = None
+
+    def attach_ledger(self, ledger):
+        """Move the account (and any entries it already has) into a ledger."""
+        if ledger is self.ledger:
+            return
+
+        # The entries move over as of the ledger's current month, keeping it in month order
+        account_id = ledger.open_account()
+        if self.ledger is not None:
+            old = self.ledger
+            for row in old.account_rows[self.account_id]:
+                ledger.record(account_id, old.kinds[row], old.amounts[row])
+
+        self.ledger = ledger
+        self.account_id = account_id
+
+    def record(self, kind, amount):
+        """Record an entry for the account."""
+        if self.ledger is None:
+            self.attach_ledger(Ledger())
+        self.ledger.record(self.account_id, kind, amount)
+
+    @property
+    def transaction_history(self):
+        """The account's entries, as a read-only list-like view of entry dicts."""
+        if self.ledger is None:
+            return ()
+        return LedgerView(self.ledger, self.account_id)
+
+    def get_entries(self, kind=None, first_month=0, last_month=None):
+        """Return a view of the account's entries of a kind (None for any) from first_month to last_month."""
+        if self.ledger is None:
+            return ()
+        return LedgerView(self.ledger, self.account_id, self.ledger.get_rows(self.account_id, kind, first_month, last_month))
+
+    def get_total(self, kind=None, first_month=0, last_month=None):
+        """Add up the account's entries of a kind (None for any) from first_month to last_month, in cents."""
+        if self.ledger is None:
+            return 0
+        return self.ledger.sum_amounts(kind, self.account_id, first_month, last_month)
+
+    def get_day_weighted_total(self, kind=None, first_month=0, last_month=None):
+        """Add up amount x day of the account's entries of a kind (None for any) from first_month to last_month."""
+        if self.ledger is None:
+            return 0
+        return self.ledger.sum_day_weighted(kind, self.account_id, first_month, last_month)
+
+    def get_count(self, kind=None, first_month=0, last_month=None):
+        """Count the account's entries of a kind (None for any) from first_month to last_month."""
+        if self.ledger is None:
+            return 0
+        return self.ledger.count(kind, self.account_id, first_month, last_month)
+
+    def get_total_above(self, kind, min_amount):
+        """Count and add up the account's entries of a kind above min_amount (in cents). Returns (count, total)."""
+        if self.ledger is None:
+            return 0, 0
+        return self.ledger.sum_above(self.account_id, kind, min_amount)
@@ -0,0 +1,145 @@
+"""
+Vectorized loan comparisons for Money Smartz.
+
+Compares a whole grid of loan offers (price x interest rate x term x down
+payment) in one call. Each column of the grid is a NumPy array, and the monthly
+payment, total interest and affordability of every offer are computed with
+array operations instead of one Loan per offer:
+
+- the payment uses Loan.calculate_payment's formula, rounded to the cent;
+- the total interest plays all the offers' payments forward together, month by
+  month, with the same cent rounding as Loan.make_payment, so it matches what
+  the loan would really cost in the game (and its AmortizationSchedule);
+- an offer is affordable when its payment fits within a share of the player's
+  monthly income and they have the money for the down payment.
+
+Requires numpy.
+"""
+import numpy as np
+from moneySmartz.constants import (
+    AUTO_LOAN_RATES, MORTGAGE_RATES, AUTO_LOAN_TERMS, AUTO_LOAN_DOWN_PAYMENTS, MORTGAGE_TERMS,
+    MORTGAGE_DOWN_PAYMENTS, AUTO_LOAN_MAX_SHARE, MORTGAGE_MAX_SHARE
+)
+from moneySmartz.cohort import to_cents, round_cents
+
+class LoanComparison:
+    """
+    The offers of a loan grid, as flat column arrays with one entry per offer.
+    price, principal, down_payment, payment and total_interest are in cents; rate is the
+    annual interest rate, term in years and down the down payment as a share of the price.
+    payment_share is the payment as a share of monthly income (inf without income).
+    """
+    def __init__(self, prices, rates, terms, downs, salary=0, liquid_cents=None, max_share=0.28):
+        # Every combination of the inputs, flattened
+        price, rate, term, down = np.meshgrid(
+            np.asarray(prices, dtype=np.float64),
+            np.asarray(rates, dtype=np.float64),
+            np.asarray(terms, dtype=np.int64),
+            np.asarray(downs, dtype=np.float64),
+            indexing="ij"
+        )
+        self.shape = price.shape
+        self.price = to_cents(price.ravel())
+        self.rate = rate.ravel()
+        self.term = term.ravel()
+        self.down = down.ravel()
+
+        self.down_payment = round_cents(self.price * self.down)
+        self.principal = self.price - self.down_payment
+        self.payment = get_payments(self.principal, self.rate, self.term)
+        self.total_interest = get_total_interest(self.principal, self.rate, self.payment)
+
+        monthly_income = salary / 12
+        if monthly_income > 0:
+            self.payment_share = self.payment / 100 / monthly_income
+        else:
+            self.payment_share = np.full(self.payment.shape, np.inf)
+        self.affordable = self.payment_share <= max_share
+        if liquid_cents is not None:
+            self.affordable &= self.down_payment <= liquid_cents
+
+    def __len__(self):
+        return len(self.payment)
+
+    def get_offer(self, index):
+        """Return one offer as a dict."""
+        return {
+            "price": int(self.price[index]),
+            "rate": float(self.rate[index]),
+            "term": int(self.term[index]),
+            "down": float(self.down[index]),
+            "down_payment": int(self.down_payment[index]),
+            "principal": int(self.principal[index]),
+            "payment": int(self.payment[index]),
+            "total_interest": int(self.total_interest[index]),
+            "payment_share": float(self.payment_share[index]),
+            "affordable": bool(self.affordable[index])
+        }
+
+    def get_offers(self, mask=None):
+        """Return the offers (all of them, or those selected by a boolean mask) as a list of dicts."""
+        indexes = range(len(self)) if mask is None else np.flatnonzero(mask)
+        return [self.get_offer(index) for index in indexes]
+
+    def get_cheapest(self, mask=None):
+        """
+        Return the affordable offer (among those selected by a mask) with the least total
+        interest, or None if none of them is affordable.
+        """
+        candidates = self.affordable if mask is None else self.affordable & mask
+        if not candidates.any():
+            return None
+        return self.get_offer(np.argmin(np.where(candidates, self.total_interest, np.iinfo(np.int64).max)))
+
+def get_payments(principal, rate, term):
+    """Vectorized Loan.calculate_payment: the monthly payment in cents of each loan."""
+    r = rate / 12       # Monthly interest rate
+    n = term * 12       # Total number of payments
+    growth = (1 + r) ** n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = np.where(r == 0, principal / n, (principal * r * growth) / (growth - 1))
+    return round_cents(payment)
+
+def get_total_interest(principal, rate, payment):
+    """
+    Play every loan's regular payments forward together, with Loan.make_payment's rules,
+    and return the total interest paid on each, in cents.
+    A loan whose payment doesn't cover its interest stops after 100 years.
+    """
+    balance = principal.copy()
+    total = np.zeros(balance.shape, dtype=np.int64)
+    for _ in range(1200):
+        active = balance > 0
+        if not active.any():
+            break
+        interest = np.where(active, round_cents(balance * rate / 12), 0)
+        amount = np.minimum(payment, balance + interest)
+        principal_paid = np.clip(amount - interest, 0, balance)
+        interest = np.where(amount - interest < 0, amount, interest)
+        balance -= np.where(active, principal_paid, 0)
+        total += np.where(active, interest, 0)
+    return total
+
+def compare_auto_loans(game, cars):
+    """Compare auto loan offers for some cars: every rate tier, term and down payment."""
+    return LoanComparison(
+        [car["value"] for car in cars],
+        [rate for _, rate in AUTO_LOAN_RATES],
+        AUTO_LOAN_TERMS,
+        AUTO_LOAN_DOWN_PAYMENTS,
+        game.player.salary,
+        game.player.balance_sheet.liquid_cents,
+        AUTO_LOAN_MAX_SHARE
+    )
+
+def compare_mortgages(game, houses):
+    """Compare mortgage offers for some houses: every rate tier, term and down payment."""
+    return LoanComparison(
+        [house["value"] for house in houses],
+        [rate for _, rate in MORTGAGE_RATES],
+        MORTGAGE_TERMS,
+        MORTGAGE_DOWN_PAYMENTS,
+        game.player.salary,
+        game.player.balance_sheet.liquid_cents,
+        MORTGAGE_MAX_SHARE
+    )
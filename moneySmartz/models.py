@@ -1,9 +1,95 @@
 import random
+from moneySmartz.constants import CREDIT_CARD_APR
+from moneySmartz.money import to_cents, to_dollars, apply_rate, monthly_interest, round_cents
+from moneySmartz.amortization import AmortizationSchedule
+from moneySmartz.ledger import (Ledger, LedgerAccount, LoanPaymentView, DEPOSIT, WITHDRAWAL, INTEREST,
+                                CHARGE, PAYMENT, LOAN_INTEREST, LOAN_PRINCIPAL, MONTH_DAYS)
+
+class BalanceSheet:
+    """
+    Running totals of a player's finances, kept in step by the bank account, credit card
+    and loans as they change, so that reading the player's debt or net worth is O(1)
+    instead of a scan over every loan and asset. The asset value comes from the player's
+    AssetRegistry, which keeps its own totals.
+    Money totals are stored in cents; the asset value is in dollars, like Asset.current_value.
+    """
+    def __init__(self, player):
+        self.player = player
+        self.bank_cents = 0
+        self.card_debt_cents = 0
+        self.loan_debt_cents = 0
+
+    def track(self, obj):
+        """Start keeping the totals in step with a bank account, credit card or loan."""
+        obj.sheet = self
+        self.adjust(obj, 1)
+
+    def untrack(self, obj):
+        """Stop keeping the totals in step with an object, taking its amount out of them."""
+        self.adjust(obj, -1)
+        obj.sheet = None
+
+    def adjust(self, obj, sign):
+        """Add (sign 1) or take away (sign -1) an object's amount to or from the totals."""
+        if isinstance(obj, BankAccount):
+            self.bank_cents += sign * obj.balance_cents
+        elif isinstance(obj, Card):
+            self.card_debt_cents += sign * obj.balance_cents
+        else:
+            self.loan_debt_cents += sign * obj.current_balance_cents
+
+    def rebuild(self):
+        """Recompute every total from scratch."""
+        player = self.player
+        self.bank_cents = player.bank_account.balance_cents if player.bank_account else 0
+        self.card_debt_cents = player.credit_card.balance_cents if player.credit_card else 0
+        self.loan_debt_cents = sum(loan.current_balance_cents for loan in player.loans)
+        player.assets.reset(tuple(player.assets))
+
+    @property
+    def asset_value(self):
+        """The current value of every asset, in dollars."""
+        return self.player.assets.total_value
+
+    @property
+    def cash(self):
+        """Cash on hand, in dollars."""
+        return self.player.cash
+
+    @property
+    def liquid_cents(self):
+        """Cash plus the bank balance, in cents."""
+        return self.player.cash_cents + self.bank_cents
+
+    @property
+    def liquid_assets(self):
+        """Cash plus the bank balance, in dollars."""
+        return to_dollars(self.liquid_cents)
+
+    @property
+    def debt_cents(self):
+        """Credit card and loan debt, in cents."""
+        return self.card_debt_cents + self.loan_debt_cents
+
+    @property
+    def total_debt(self):
+        """Credit card and loan debt, in dollars."""
+        return to_dollars(self.debt_cents)
+
+    @property
+    def net_worth(self):
+        """Cash, bank balance and assets minus all debt, in dollars."""
+        return to_dollars(self.liquid_cents - self.debt_cents) + self.asset_value
 
 class Player:
     """
     Represents the player character in the game.
     Tracks personal and financial information.
+    Cash is stored in cents (cash_cents); the cash property reads and writes it in dollars.
+    balance_sheet keeps running totals of the player's finances, so loans are added and
+    removed with add_loan and remove_loan rather than on the list directly. assets is an
+    AssetRegistry (add_asset adds to it). ledger holds the transactions of the player's
+    bank account, credit card and loans, which are attached to it as they're added.
     """
     def __init__(self, name):
         self.name = name
@@ -11,147 +97,445 @@ class Player:
         self.education = "High School"
         self.job = None
         self.salary = 0
-        self.cash = 100  # Start with $100 cash
-        self.bank_account = None
+        self.cash_cents = 10000  # Start with $100 cash
+        self._bank_account = None
         self.debit_card = None
-        self.credit_card = None
+        self._credit_card = None
         self.credit_score = 650  # Average starting credit score
         self.loans = []
-        self.assets = []
+        self.assets = AssetRegistry()
         self.family = []  # List of family members (spouse, children)
+        self.balance_sheet = BalanceSheet(self)
+        self.ledger = Ledger()
+
+    @property
+    def cash(self):
+        """Cash on hand, in dollars."""
+        return to_dollars(self.cash_cents)
+
+    @cash.setter
+    def cash(self, dollars):
+        self.cash_cents = to_cents(dollars)
+
+    @property
+    def bank_account(self):
+        """The player's bank account (None until they open one)."""
+        return self._bank_account
+
+    @bank_account.setter
+    def bank_account(self, account):
+        if self._bank_account is not None:
+            self.balance_sheet.untrack(self._bank_account)
+        self._bank_account = account
+        if account is not None:
+            self.balance_sheet.track(account)
+            account.attach_ledger(self.ledger)
+
+    @property
+    def credit_card(self):
+        """The player's credit card (None until they get one)."""
+        return self._credit_card
 
-class BankAccount:
+    @credit_card.setter
+    def credit_card(self, card):
+        if self._credit_card is not None:
+            self.balance_sheet.untrack(self._credit_card)
+        self._credit_card = card
+        if card is not None:
+            self.balance_sheet.track(card)
+            card.attach_ledger(self.ledger)
+
+    def add_loan(self, loan):
+        """Take out a loan."""
+        self.loans.append(loan)
+        self.balance_sheet.track(loan)
+        loan.attach_ledger(self.ledger)
+
+    def remove_loan(self, loan):
+        """Remove a (paid off) loan."""
+        self.loans.remove(loan)
+        self.balance_sheet.untrack(loan)
+
+    def add_asset(self, asset):
+        """Add an asset the player bought."""
+        self.assets.add(asset)
+
+class BankAccount(LedgerAccount):
     """
     Represents a bank account that can hold money and earn interest.
+    The balance and transaction amounts are stored in cents.
+    sheet is the owner's BalanceSheet, kept in step whenever the balance changes.
+    Transactions are recorded in the owner's Ledger (see LedgerAccount).
     """
     def __init__(self, account_type="Checking"):
+        super().__init__()
         self.account_type = account_type
-        self.balance = 0
+        self.sheet = None
+        self._balance_cents = 0
         self.interest_rate = 0.01 if account_type == "Savings" else 0.0
-        self.transaction_history = []
+
+    @property
+    def balance_cents(self):
+        """The account balance, in cents."""
+        return self._balance_cents
+
+    @balance_cents.setter
+    def balance_cents(self, cents):
+        if self.sheet is not None:
+            self.sheet.bank_cents += cents - self._balance_cents
+        self._balance_cents = cents
+
+    @property
+    def balance(self):
+        """The account balance, in dollars."""
+        return to_dollars(self.balance_cents)
+
+    @balance.setter
+    def balance(self, dollars):
+        self.balance_cents = to_cents(dollars)
 
     def deposit(self, amount):
-        """Deposit money into the account."""
-        if amount > 0:
-            self.balance += amount
-            self.transaction_history.append({"type": "deposit", "amount": amount})
+        """Deposit money (in dollars) into the account."""
+        return self.deposit_cents(to_cents(amount))
+
+    def deposit_cents(self, cents):
+        """Deposit an amount in cents into the account."""
+        if cents > 0:
+            self.balance_cents += cents
+            self.record(DEPOSIT, cents)
             return True
         return False
 
     def withdraw(self, amount):
-        """Withdraw money from the account if sufficient funds are available."""
-        if 0 < amount <= self.balance:
-            self.balance -= amount
-            self.transaction_history.append({"type": "withdrawal", "amount": amount})
+        """Withdraw money (in dollars) from the account if sufficient funds are available."""
+        return self.withdraw_cents(to_cents(amount))
+
+    def withdraw_cents(self, cents):
+        """Withdraw an amount in cents from the account if sufficient funds are available."""
+        if 0 < cents <= self.balance_cents:
+            self.balance_cents -= cents
+            self.record(WITHDRAWAL, cents)
             return True
         return False
 
     def apply_interest(self):
-        """Apply interest to the account balance (for savings accounts)."""
-        if self.account_type == "Savings" and self.balance > 0:
-            interest = self.balance * self.interest_rate
-            self.balance += interest
-            self.transaction_history.append({"type": "interest", "amount": interest})
+        """
+        Apply interest to the account balance (for savings accounts).
+        Returns the interest in cents, rounded to the nearest cent.
+        """
+        if self.account_type == "Savings" and self.balance_cents > 0:
+            interest = apply_rate(self.balance_cents, self.interest_rate)
+            self.balance_cents += interest
+            self.record(INTEREST, interest)
             return interest
         return 0
 
-class Card:
+class Card(LedgerAccount):
     """
     Represents a payment card (debit or credit).
+    The limit, balance and transaction amounts are stored in cents.
+    sheet is the owner's BalanceSheet (for a credit card), kept in step whenever the balance changes.
+    Transactions are recorded in the owner's Ledger (see LedgerAccount).
+
+    A credit card's statement cycle is a game month (see close_statement): interest_rate is
+    its APR, statement_balance_cents the balance on the last statement and
+    last_interest_cents the interest charged when it closed.
     """
-    def __init__(self, card_type, limit=0):
+    def __init__(self, card_type, limit=0, interest_rate=CREDIT_CARD_APR):
+        super().__init__()
         self.card_type = card_type
-        self.limit = limit
-        self.balance = 0
-        self.transaction_history = []
+        self.sheet = None
+        self.limit_cents = to_cents(limit)
+        self._balance_cents = 0
+        self.interest_rate = interest_rate
+        self.statement_balance_cents = 0
+        self.last_interest_cents = 0
+
+    @property
+    def balance_cents(self):
+        """The card balance, in cents."""
+        return self._balance_cents
+
+    @balance_cents.setter
+    def balance_cents(self, cents):
+        if self.sheet is not None:
+            self.sheet.card_debt_cents += cents - self._balance_cents
+        self._balance_cents = cents
+
+    @property
+    def limit(self):
+        """The credit limit, in dollars."""
+        return to_dollars(self.limit_cents)
+
+    @limit.setter
+    def limit(self, dollars):
+        self.limit_cents = to_cents(dollars)
+
+    @property
+    def balance(self):
+        """The card balance, in dollars."""
+        return to_dollars(self.balance_cents)
+
+    @balance.setter
+    def balance(self, dollars):
+        self.balance_cents = to_cents(dollars)
 
     def charge(self, amount):
         """
-        Charge an amount to the card.
+        Charge an amount (in dollars) to the card.
         For debit cards, this is a placeholder as they use the bank account directly.
         For credit cards, this adds to the balance if within the limit.
         """
-        if amount <= 0:
+        return self.charge_cents(to_cents(amount))
+
+    def charge_cents(self, cents):
+        """Charge an amount in cents to the card (see charge)."""
+        if cents <= 0:
             return False
             
         if self.card_type == "Credit":
-            if self.balance + amount <= self.limit:
-                self.balance += amount
-                self.transaction_history.append({"type": "charge", "amount": amount})
+            if self.balance_cents + cents <= self.limit_cents:
+                self.balance_cents += cents
+                self.record(CHARGE, cents)
                 return True
             return False
         return True  # Debit cards don't track balance here
 
     def pay(self, amount):
-        """Pay off some of the credit card balance."""
-        if self.card_type == "Credit" and 0 < amount <= self.balance:
-            self.balance -= amount
-            self.transaction_history.append({"type": "payment", "amount": amount})
+        """Pay off some (in dollars) of the credit card balance."""
+        return self.pay_cents(to_cents(amount))
+
+    def pay_cents(self, cents):
+        """Pay off an amount in cents of the credit card balance."""
+        if self.card_type == "Credit" and 0 < cents <= self.balance_cents:
+            self.balance_cents -= cents
+            self.record(PAYMENT, cents)
             return True
         return False
 
-class Loan:
+    def get_average_daily_balance_cents(self, month_index):
+        """
+        Return the card's average daily balance (in cents) over the statement cycle of a game month.
+        Only valid until the next month's entries are recorded: the balance at the start of the
+        cycle is worked out back from the current balance.
+        Each entry counts for the days from its own to the end of the cycle, so with the
+        ledger's running totals this is O(log n), however long the card has been held.
+        """
+        charged = self.get_total(CHARGE, month_index, month_index) + self.get_total(INTEREST, month_index, month_index)
+        paid = self.get_total(PAYMENT, month_index, month_index)
+        weighted = (self.get_day_weighted_total(CHARGE, month_index, month_index)
+                    + self.get_day_weighted_total(INTEREST, month_index, month_index)
+                    - self.get_day_weighted_total(PAYMENT, month_index, month_index))
+
+        # Balance-days: the opening balance for the whole cycle, each entry from its day on
+        opening = self.balance_cents - (charged - paid)
+        return round_cents((opening * MONTH_DAYS + (charged - paid) * MONTH_DAYS - weighted) / MONTH_DAYS)
+
+    def close_statement(self, month_index):
+        """
+        Close the statement cycle of a game month and charge its interest.
+        There's a grace period: if the previous statement was paid in full during the cycle
+        (before its due date), there's no interest. Otherwise the interest is a month's worth
+        of the APR on the cycle's average daily balance. Returns the interest in cents.
+        """
+        if self.card_type != "Credit":
+            return 0
+
+        interest = 0
+        if self.get_total(PAYMENT, month_index, month_index) < self.statement_balance_cents:
+            interest = monthly_interest(max(0, self.get_average_daily_balance_cents(month_index)), self.interest_rate)
+
+        if interest > 0:
+            self.balance_cents += interest
+            self.record(INTEREST, interest)
+
+        self.statement_balance_cents = self.balance_cents
+        self.last_interest_cents = interest
+        return interest
+
+class Loan(LedgerAccount):
     """
     Represents a loan with principal, interest rate, and term.
+    Amounts (the balance, the monthly payment and the payment history) are stored in cents;
+    each month's interest is rounded to the nearest cent.
+    sheet is the owner's BalanceSheet, kept in step whenever the balance changes.
+    Each payment is recorded in the owner's Ledger as its interest and its principal.
+    schedule is the loan's AmortizationSchedule (see get_schedule), built from its balance
+    after schedule_start payments.
     """
     def __init__(self, loan_type, amount, interest_rate, term_years):
+        super().__init__()
         self.loan_type = loan_type
-        self.original_amount = amount
-        self.current_balance = amount
+        self.sheet = None
+        self.original_amount_cents = to_cents(amount)
+        self._current_balance_cents = self.original_amount_cents
         self.interest_rate = interest_rate
         self.term_years = term_years
-        self.monthly_payment = self.calculate_payment()
-        self.payment_history = []
+        self.monthly_payment_cents = self.calculate_payment()
+        self.schedule = None
+        self.schedule_start = 0
+
+    @property
+    def original_amount(self):
+        """The amount borrowed, in dollars."""
+        return to_dollars(self.original_amount_cents)
+
+    @property
+    def current_balance_cents(self):
+        """The balance still owed, in cents."""
+        return self._current_balance_cents
+
+    @current_balance_cents.setter
+    def current_balance_cents(self, cents):
+        if self.sheet is not None:
+            self.sheet.loan_debt_cents += cents - self._current_balance_cents
+        self._current_balance_cents = cents
+
+    @property
+    def current_balance(self):
+        """The balance still owed, in dollars."""
+        return to_dollars(self.current_balance_cents)
+
+    @current_balance.setter
+    def current_balance(self, dollars):
+        self.current_balance_cents = to_cents(dollars)
+
+    @property
+    def payment_history(self):
+        """The payments made, as a read-only list-like view of {"amount", "interest", "principal"} dicts."""
+        if self.ledger is None:
+            return ()
+        return LoanPaymentView(self.ledger, self.account_id)
+
+    @property
+    def monthly_payment(self):
+        """The regular monthly payment, in dollars."""
+        return to_dollars(self.monthly_payment_cents)
 
     def calculate_payment(self):
-        """Calculate the monthly payment for the loan."""
+        """Calculate the monthly payment for the loan, in cents (rounded to the nearest cent)."""
         r = self.interest_rate / 12  # Monthly interest rate
         n = self.term_years * 12     # Total number of payments
         if r == 0:  # Handle zero interest case
-            return self.original_amount / n
-        return (self.original_amount * r * (1 + r) ** n) / ((1 + r) ** n - 1)
+            return round_cents(self.original_amount_cents / n)
+        return round_cents((self.original_amount_cents * r * (1 + r) ** n) / ((1 + r) ** n - 1))
+
+    def get_schedule(self):
+        """
+        Return the loan's AmortizationSchedule and how many of its payments have been made,
+        as a (schedule, position) pair. The schedule is only rebuilt (from the current balance)
+        when the loan has left it: after an extra payment, or a rewind.
+        """
+        payments = len(self.payment_history)
+        schedule = self.schedule
+        position = payments - self.schedule_start
+        if (schedule is None or not 0 <= position <= schedule.payoff_months
+                or schedule.balances[position] != self.current_balance_cents):
+            schedule = self.schedule = AmortizationSchedule(self.current_balance_cents, self.interest_rate,
+                                                            self.monthly_payment_cents)
+            self.schedule_start = payments
+            position = 0
+        return schedule, position
+
+    def get_payoff_months(self):
+        """Return the number of regular payments left until the loan is paid off."""
+        schedule, position = self.get_schedule()
+        return schedule.payoff_months - position
+
+    def get_remaining_interest_cents(self):
+        """Return the interest still to pay with regular payments, in cents."""
+        schedule, position = self.get_schedule()
+        return schedule.get_remaining_interest(position)
+
+    def get_balance_after_cents(self, months):
+        """Return the balance after a number of regular payments from now, in cents."""
+        schedule, position = self.get_schedule()
+        return schedule.get_balance(position + months)
+
+    def get_amount_due_cents(self):
+        """Return this month's payment in cents: the regular payment, or just what's owed on the final payment."""
+        if self.current_balance_cents <= 0:
+            return 0
+        return min(self.monthly_payment_cents,
+                   self.current_balance_cents + monthly_interest(self.current_balance_cents, self.interest_rate))
 
     def make_payment(self, amount):
-        """Make a payment on the loan."""
+        """Make a payment (in dollars) on the loan."""
+        return self.make_payment_cents(to_cents(amount))
+
+    def make_payment_cents(self, amount):
+        """Make a payment in cents on the loan."""
         if amount <= 0:
             return False
             
         # Apply payment to interest first, then principal
-        interest_payment = self.current_balance * (self.interest_rate / 12)
-        principal_payment = min(amount - interest_payment, self.current_balance)
+        interest_payment = monthly_interest(self.current_balance_cents, self.interest_rate)
+        principal_payment = min(amount - interest_payment, self.current_balance_cents)
         
         if principal_payment < 0:
             # If payment doesn't cover interest, all goes to interest
             interest_payment = amount
             principal_payment = 0
             
-        self.current_balance -= principal_payment
-        
-        if self.current_balance < 0.01:  # Handle small floating-point errors
-            self.current_balance = 0
-            
-        self.payment_history.append({
-            "amount": amount,
-            "interest": interest_payment,
-            "principal": principal_payment
-        })
+        self.current_balance_cents -= principal_payment
+        self.record(LOAN_INTEREST, interest_payment)
+        self.record(LOAN_PRINCIPAL, principal_payment)
         
         return True
 
+    def make_extra_payment(self, amount):
+        """Make an extra payment (in dollars) on the loan's principal."""
+        return to_dollars(self.make_extra_payment_cents(to_cents(amount)))
+
+    def make_extra_payment_cents(self, amount):
+        """
+        Make an extra payment in cents, all of it on the principal (the month's interest
+        is paid by the regular payment). Returns the amount applied, at most the balance.
+        """
+        principal_payment = min(amount, self.current_balance_cents)
+        if principal_payment <= 0:
+            return 0
+
+        self.current_balance_cents -= principal_payment
+        self.record(LOAN_PRINCIPAL, principal_payment)
+        self.schedule = None  # The balance has left the schedule
+        return principal_payment
+
 class Asset:
     """
     Represents an asset owned by the player (car, house, etc.).
+    registry is the owner's AssetRegistry, kept in step whenever the value changes,
+    and asset_id the asset's id in it.
     """
     def __init__(self, asset_type, name, value, condition="Good"):
         self.asset_type = asset_type
         self.name = name
+        self.registry = None
+        self.asset_id = None
         self.purchase_value = value
-        self.current_value = value
+        self._current_value = value
         self.condition = condition
         self.age = 0  # Years since purchase
 
-    def age_asset(self):
-        """Age the asset by one year, affecting its value and condition."""
+    @property
+    def current_value(self):
+        """The asset's current value, in dollars."""
+        return self._current_value
+
+    @current_value.setter
+    def current_value(self, value):
+        if self.registry is not None:
+            self.registry.adjust_value(self.asset_type, value - self._current_value)
+        self._current_value = value
+
+    def age_asset(self, rng=None):
+        """
+        Age the asset by one year, affecting its value and condition.
+        rng is the random stream used for house appreciation (defaults to the random module).
+        """
+        if rng is None:
+            rng = random
+
         self.age += 1
         
         # Update condition based on age
@@ -165,10 +549,117 @@ class Asset:
             self.current_value *= 0.85  # 15% depreciation per year
         elif self.asset_type == "House":
             # Houses might appreciate
-            appreciation = random.uniform(-0.05, 0.1)  # -5% to +10%
+            appreciation = rng.uniform(-0.05, 0.1)  # -5% to +10%
             self.current_value *= (1 + appreciation)
 
     def repair(self, cost):
         """Repair the asset to improve its condition."""
         self.condition = "Good"
-        return cost
\ No newline at end of file
+        return cost
+
+class AssetRegistry:
+    """
+    The assets a player owns, indexed by id and by type.
+    Iterating gives the assets in the order they were added. Checking whether the player
+    owns an asset of a type and reading the value of a type (or of every asset) are O(1),
+    and age_type ages every asset of a type in one call.
+    """
+    def __init__(self):
+        self.by_id = {}        # Asset id -> asset, in the order they were added
+        self.by_type = {}      # Asset type -> {asset id: asset}
+        self.type_values = {}  # Asset type -> total current value, in dollars
+        self.total_value = 0   # Current value of every asset, in dollars
+        self.next_id = 1
+
+    def add(self, asset):
+        """Add an asset, giving it the next id. Returns the id."""
+        asset.asset_id = self.next_id
+        self.next_id += 1
+        asset.registry = self
+
+        self.by_id[asset.asset_id] = asset
+        self.by_type.setdefault(asset.asset_type, {})[asset.asset_id] = asset
+        self.adjust_value(asset.asset_type, asset.current_value)
+        return asset.asset_id
+
+    def remove(self, asset):
+        """Remove an asset (when it's sold or written off)."""
+        del self.by_id[asset.asset_id]
+        self.adjust_value(asset.asset_type, -asset.current_value)
+        asset.registry = None
+
+        of_type = self.by_type[asset.asset_type]
+        del of_type[asset.asset_id]
+        if not of_type:
+            # Drop the type's total too, rather than leave rounding dust behind
+            del self.by_type[asset.asset_type]
+            del self.type_values[asset.asset_type]
+        if not self.by_id:
+            self.total_value = 0
+
+    def reset(self, assets):
+        """Replace the contents with the given assets (keeping their ids) and recompute the totals."""
+        self.by_id = {}
+        self.by_type = {}
+        self.type_values = {}
+        self.total_value = 0
+        for asset in assets:
+            asset.registry = self
+            self.by_id[asset.asset_id] = asset
+            self.by_type.setdefault(asset.asset_type, {})[asset.asset_id] = asset
+            self.adjust_value(asset.asset_type, asset.current_value)
+        self.next_id = max(self.by_id, default=0) + 1
+
+    def get_state(self):
+        """Capture the registry's contents and totals (see set_state)."""
+        return (tuple(self.by_id.values()), dict(self.type_values), self.total_value, self.next_id)
+
+    def set_state(self, state):
+        """
+        Restore contents and totals captured with get_state. The totals are restored as
+        they were rather than added up again, so they match to the last bit.
+        """
+        assets, type_values, self.total_value, self.next_id = state
+        self.by_id = {}
+        self.by_type = {}
+        for asset in assets:
+            asset.registry = self
+            self.by_id[asset.asset_id] = asset
+            self.by_type.setdefault(asset.asset_type, {})[asset.asset_id] = asset
+        self.type_values = dict(type_values)
+
+    def adjust_value(self, asset_type, change):
+        """Add a change in value (in dollars) to the totals."""
+        self.type_values[asset_type] = self.type_values.get(asset_type, 0) + change
+        self.total_value += change
+
+    def get(self, asset_id):
+        """Return the asset with an id, or None."""
+        return self.by_id.get(asset_id)
+
+    def has_type(self, asset_type):
+        """Check whether the player owns an asset of a type (e.g. "Car")."""
+        return asset_type in self.by_type
+
+    def get_type(self, asset_type):
+        """Return the assets of a type, in the order they were added."""
+        return list(self.by_type.get(asset_type, {}).values())
+
+    def get_types(self):
+        """Return the asset types the player owns, in the order they were first added."""
+        return list(self.by_type)
+
+    def get_type_value(self, asset_type):
+        """Return the current value of every asset of a type, in dollars."""
+        return self.type_values.get(asset_type, 0)
+
+    def age_type(self, asset_type, rng=None):
+        """Age every asset of a type by one year (see Asset.age_asset)."""
+        for asset in self.by_type.get(asset_type, {}).values():
+            asset.age_asset(rng)
+
+    def __iter__(self):
+        return iter(self.by_id.values())
+
+    def __len__(self):
+        return len(self.by_id)
@@ -0,0 +1,32 @@
+"""
+Fixed-point money helpers for Money Smartz.
+
+Balances are stored as whole cents in Python ints, so adding and subtracting
+them is exact and fast. Fractional cents only appear when a rate is applied
+(interest, inflation, the salary split); round_cents turns those back into
+whole cents, rounding to the nearest cent with halves going to the even cent.
+That is the same rule as numpy.rint, so the cohort simulator's int64 arrays
+give bit-identical results to the game's models.
+"""
+
+CENTS_PER_DOLLAR = 100
+
+def to_cents(dollars):
+    """Convert a dollar amount to whole cents (rounded to the nearest cent)."""
+    return round(dollars * CENTS_PER_DOLLAR)
+
+def to_dollars(cents):
+    """Convert cents to a dollar amount for display."""
+    return cents / CENTS_PER_DOLLAR
+
+def round_cents(value):
+    """Round a fractional number of cents to a whole cent (halves go to the even cent)."""
+    return round(value)
+
+def apply_rate(cents, rate):
+    """Return rate times an amount in cents, rounded to a whole cent."""
+    return round(cents * rate)
+
+def monthly_interest(cents, annual_rate):
+    """Return one month's interest on a balance in cents at an annual rate, rounded to a whole cent."""
+    return round(cents * annual_rate / 12)
@@ -0,0 +1,151 @@
+"""
+Monte Carlo lifetime runner for Money Smartz.
+
+Runs many independent lifetimes with the headless SimulationEngine, spread across
+a pool of worker processes, and collects a compact summary of each run. The
+distributions are used to tune event odds and salary tables.
+
+Run from the command line with:
+    python -m moneySmartz.montecarlo 100000
+"""
+import argparse
+import os
+import statistics
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from moneySmartz.engine import SimulationEngine, DecisionPolicy
+from moneySmartz.notifications import MISSED_PAYMENT, UNAFFORDABLE_EXPENSE
+
+def simulate_lifetime(seed, policy=None, time_stages=False):
+    """
+    Simulate one lifetime from age 16 to retirement.
+    Returns a summary dict with the seed, final net worth, credit score,
+    debt-free age, financial rating and the number of missed payments and
+    unaffordable months. With time_stages, the summary also
+    holds the wall time spent in each stage of the monthly tick.
+    """
+    engine = SimulationEngine(policy=policy if policy is not None else DecisionPolicy(), seed=seed)
+    engine.start()
+    game = engine.game
+    player = game.player
+
+    # Age from which the player stayed free of loan and credit card debt
+    debt_free_age = player.age
+
+    while not game.game_over:
+        engine.advance_month()
+
+        if player.balance_sheet.debt_cents > 0:
+            debt_free_age = None
+        elif debt_free_age is None:
+            debt_free_age = player.age
+
+    net_worth = game.calculate_net_worth()
+
+    result = {
+        "seed": seed,
+        "net_worth": net_worth,
+        "credit_score": player.credit_score,
+        "debt_free_age": debt_free_age,
+        "rating": game.get_financial_rating(net_worth),
+        "missed_payments": game.notifications.counts[MISSED_PAYMENT],
+        "unaffordable_expenses": game.notifications.counts[UNAFFORDABLE_EXPENSE]
+    }
+
+    if time_stages:
+        result["stage_timings"] = {name: timing["total_time"] for name, timing in game.monthly_tick.get_timings().items()}
+
+    return result
+
+def _silence_worker():
+    """Discard the game's console output inside worker processes."""
+    sys.stdout = open(os.devnull, "w")
+
+def run_monte_carlo(num_runs, base_seed=0, policy=None, max_workers=None, chunksize=None, time_stages=False):
+    """
+    Run num_runs independent lifetimes across a process pool.
+    Run i uses seed base_seed + i, so a batch is reproducible.
+    The policy must be picklable (an instance of a module-level class).
+    Returns the list of per-run summaries in seed order.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    # Hand out work in large chunks so inter-process overhead stays small
+    if chunksize is None:
+        chunksize = max(1, num_runs // (max_workers * 4))
+
+    seeds = range(base_seed, base_seed + num_runs)
+    worker = partial(simulate_lifetime, policy=policy, time_stages=time_stages)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_silence_worker) as executor:
+        return list(executor.map(worker, seeds, chunksize=chunksize))
+
+def summarize_results(results):
+    """Summarize a batch of runs: net worth percentiles, credit scores, debt-free ages, missed payments and ratings."""
+    net_worths = sorted(result["net_worth"] for result in results)
+    credit_scores = [result["credit_score"] for result in results]
+    debt_free_ages = [result["debt_free_age"] for result in results if result["debt_free_age"] is not None]
+
+    def percentile(values, fraction):
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    summary = {
+        "runs": len(results),
+        "net_worth": {
+            "mean": statistics.fmean(net_worths),
+            "p10": percentile(net_worths, 0.1),
+            "median": percentile(net_worths, 0.5),
+            "p90": percentile(net_worths, 0.9)
+        },
+        "credit_score_mean": statistics.fmean(credit_scores),
+        "debt_free_rate": len(debt_free_ages) / len(results),
+        "debt_free_age_median": statistics.median(debt_free_ages) if debt_free_ages else None,
+        "missed_payments_mean": statistics.fmean(result["missed_payments"] for result in results),
+        "unaffordable_expenses_mean": statistics.fmean(result["unaffordable_expenses"] for result in results),
+        "ratings": dict(Counter(result["rating"] for result in results))
+    }
+
+    # Total wall time per tick stage, when the runs were timed
+    if results and "stage_timings" in results[0]:
+        stage_timings = Counter()
+        for result in results:
+            stage_timings.update(result["stage_timings"])
+        summary["stage_timings"] = dict(stage_timings)
+
+    return summary
+
+def main():
+    """Run a Monte Carlo batch from the command line and print the summary."""
+    parser = argparse.ArgumentParser(description="Run Money Smartz lifetimes in parallel.")
+    parser.add_argument("runs", type=int, help="number of lifetimes to simulate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first run")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--time-stages", action="store_true", help="report the time spent in each stage of the monthly tick")
+    args = parser.parse_args()
+
+    results = run_monte_carlo(args.runs, base_seed=args.seed, max_workers=args.workers, time_stages=args.time_stages)
+    summary = summarize_results(results)
+
+    print(f"Runs: {summary['runs']}")
+    print("Net Worth: mean ${mean:.2f}, p10 ${p10:.2f}, median ${median:.2f}, p90 ${p90:.2f}".format(**summary["net_worth"]))
+    print(f"Average Credit Score: {summary['credit_score_mean']:.1f}")
+    print(f"Debt-Free at Retirement: {summary['debt_free_rate']*100:.1f}%")
+    if summary["debt_free_age_median"] is not None:
+        print(f"Median Debt-Free Age: {summary['debt_free_age_median']}")
+    print(f"Average Missed Payments: {summary['missed_payments_mean']:.1f}")
+    print(f"Average Unaffordable Expenses: {summary['unaffordable_expenses_mean']:.1f}")
+    print("\nFinancial Ratings:")
+    for rating, count in sorted(summary["ratings"].items(), key=lambda item: -item[1]):
+        print(f"  {rating}: {count} ({count / summary['runs'] * 100:.1f}%)")
+
+    if "stage_timings" in summary:
+        total_time = sum(summary["stage_timings"].values()) or 1
+        print("\nMonthly Tick Stages (total across workers):")
+        for name, stage_time in summary["stage_timings"].items():
+            print(f"  {name}: {stage_time:.3f}s ({stage_time / total_time * 100:.1f}%)")
+
+if __name__ == "__main__":
+    main()
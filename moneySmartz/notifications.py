@@ -0,0 +1,81 @@
+"""
+Notifications for Money Smartz.
+
+The simulation reports things the player should know about (missed payments
+and expenses they couldn't afford, with the credit score hit they caused, and
+credit card interest) by
+posting them to the game's NotificationQueue instead of printing them. Each
+front end decides what to do with them: the GUI shows them as toasts, the text
+mode prints them, and headless batches only count them or ignore them.
+"""
+from collections import deque
+
+# Notification kinds
+MISSED_PAYMENT = "missed_payment"
+UNAFFORDABLE_EXPENSE = "unaffordable_expense"
+CARD_INTEREST = "card_interest"
+
+KINDS = (MISSED_PAYMENT, UNAFFORDABLE_EXPENSE, CARD_INTEREST)
+
+MESSAGES = {
+    MISSED_PAYMENT: "You missed a payment on your {subject}. Your credit score has been affected.",
+    UNAFFORDABLE_EXPENSE: "You couldn't afford your {subject} this month!",
+    CARD_INTEREST: "You were charged {subject} in interest on your credit card balance."
+}
+
+# Queue modes
+KEEP = "keep"        # Keep the latest notifications for the front end to drain
+COUNT = "count"      # Only count them (headless batches)
+DISCARD = "discard"  # Ignore them
+
+class Notification:
+    """
+    Something that happened to the player: its kind, what it was about (e.g. "Auto loan")
+    and the change it caused to the credit score.
+    """
+    __slots__ = ("kind", "subject", "credit_change")
+
+    def __init__(self, kind, subject, credit_change=0):
+        self.kind = kind
+        self.subject = subject
+        self.credit_change = credit_change
+
+    @property
+    def message(self):
+        """The text shown to the player."""
+        return MESSAGES[self.kind].format(subject=self.subject)
+
+class NotificationQueue:
+    """
+    A bounded queue of notifications.
+    When more than maxlen notifications are waiting, the oldest are dropped (and counted
+    in dropped). counts and credit_change keep running totals in every mode but DISCARD.
+    """
+    def __init__(self, maxlen=50, mode=KEEP):
+        self.notifications = deque(maxlen=maxlen)
+        self.mode = mode
+        self.counts = dict.fromkeys(KINDS, 0)
+        self.credit_change = 0  # Total credit score change from posted notifications
+        self.dropped = 0
+
+    def post(self, kind, subject, credit_change=0):
+        """Post a notification. The Notification itself is only built in KEEP mode."""
+        if self.mode == DISCARD:
+            return
+
+        self.counts[kind] += 1
+        self.credit_change += credit_change
+
+        if self.mode == KEEP:
+            if len(self.notifications) == self.notifications.maxlen:
+                self.dropped += 1
+            self.notifications.append(Notification(kind, subject, credit_change))
+
+    def drain(self):
+        """Remove and return the waiting notifications, oldest first."""
+        notifications = list(self.notifications)
+        self.notifications.clear()
+        return notifications
+
+    def __len__(self):
+        return len(self.notifications)
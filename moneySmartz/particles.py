@@ -0,0 +1,76 @@
+"""
+Background particles for Money Smartz screens.
+
+CoinParticles draws the floating dollar coins behind the title screen. The
+coins are drawn once, at startup, into a small sprite atlas (one row per size,
+one column per transparency). Each particle then only keeps its position,
+velocity and sprite in compact array columns, moves a little every frame and
+is drawn from the atlas: the whole field is a single Surface.blits call, with
+no surfaces, fonts or glyphs created while drawing.
+"""
+import random
+from array import array
+import pygame
+from moneySmartz.constants import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, TITLE_PARTICLES
+from moneySmartz.ui import get_font, render_text
+
+COIN_SIZES = (10, 14, 18, 22, 26, 30)  # Coin diameters in the atlas, in pixels
+COIN_ALPHAS = (20, 40, 60, 80, 100)    # Coin transparencies in the atlas
+COIN_COLOR = (0, 200, 0)
+
+def build_coin_atlas(sizes=COIN_SIZES, alphas=COIN_ALPHAS):
+    """
+    Draw every coin sprite into one atlas surface.
+    Returns (atlas, areas), where areas[i] is the rect of sprite i in the atlas
+    (sprite i has size sizes[i // len(alphas)] and alpha alphas[i % len(alphas)]).
+    """
+    cell = max(sizes)
+    atlas = pygame.Surface((cell * len(alphas), cell * len(sizes)), pygame.SRCALPHA)
+    areas = []
+    for row, size in enumerate(sizes):
+        text = render_text(get_font(size), "$", WHITE)
+        for column, alpha in enumerate(alphas):
+            area = pygame.Rect(column * cell, row * cell, size, size)
+            pygame.draw.circle(atlas, COIN_COLOR + (alpha,), area.center, size // 2)
+            atlas.blit(text, text.get_rect(center=area.center))
+            areas.append(area)
+    return atlas, areas
+
+class CoinParticles:
+    """
+    A field of coins drifting up the screen, wrapping around its edges.
+    xs, ys, vxs and vys are the particles' positions and velocities (pixels per frame),
+    sprites the index of each one's sprite in the atlas.
+    """
+    def __init__(self, count=TITLE_PARTICLES, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, seed=None):
+        self.width = width
+        self.height = height
+        self.atlas, self.areas = build_coin_atlas()
+
+        rng = random.Random(seed)
+        self.xs = array("f", (rng.uniform(0, width) for _ in range(count)))
+        self.ys = array("f", (rng.uniform(0, height) for _ in range(count)))
+        self.vxs = array("f", (rng.uniform(-0.3, 0.3) for _ in range(count)))
+        self.vys = array("f", (rng.uniform(-1.2, -0.3) for _ in range(count)))
+        self.sprites = array("B", (rng.randrange(len(self.areas)) for _ in range(count)))
+
+    def __len__(self):
+        return len(self.xs)
+
+    def update(self):
+        """Move every particle by its velocity, wrapping around the edges."""
+        margin = max(COIN_SIZES)
+        width = self.width + margin
+        height = self.height + margin
+        xs, ys, vxs, vys = self.xs, self.ys, self.vxs, self.vys
+        for i in range(len(xs)):
+            xs[i] = (xs[i] + vxs[i] + margin) % width - margin
+            ys[i] = (ys[i] + vys[i] + margin) % height - margin
+
+    def draw(self, surface):
+        """Draw every particle with one batched blit from the atlas."""
+        atlas, areas = self.atlas, self.areas
+        surface.blits(
+            [(atlas, (int(x), int(y)), areas[sprite]) for x, y, sprite in zip(self.xs, self.ys, self.sprites)],
+            doreturn=False
+        )
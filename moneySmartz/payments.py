@@ -0,0 +1,235 @@
+"""
+Payment routing for Money Smartz.
+
+Every bill the player pays (loan payments, the credit card minimum, living
+expenses, random event costs and tuition) falls back through the same chain of
+sources: cash, then the bank account, then the credit card, and finally a
+credit score penalty. The PaymentRouter implements that chain once, with a
+configurable source order, optional partial payments and a structured result.
+All amounts handled here are in cents (see moneySmartz.money).
+"""
+from moneySmartz.money import apply_rate
+from moneySmartz.ledger import WITHDRAWAL, CHARGE, PAYMENT
+
+# Payment sources
+CASH = "cash"
+BANK = "bank"
+CREDIT_CARD = "credit_card"
+
+DEFAULT_ORDER = (CASH, BANK, CREDIT_CARD)
+
+class PaymentResult:
+    """
+    The outcome of routing one payment (amounts in cents).
+    parts lists the (source, amount) pairs the payment was drawn from, in order;
+    shortfall is the amount that couldn't be paid and penalty is the credit score
+    penalty applied because of it.
+    """
+    __slots__ = ("name", "amount", "parts", "paid", "shortfall", "fully_paid", "penalty")
+
+    def __init__(self, name, amount):
+        self.name = name
+        self.amount = amount
+        self.parts = []
+        self.paid = 0
+        self.shortfall = amount
+        self.fully_paid = False
+        self.penalty = 0
+
+    def finish(self, remaining):
+        """Record what was left unpaid once every source has been tried."""
+        self.shortfall = max(0, remaining)
+        self.paid = self.amount - self.shortfall
+        self.fully_paid = self.shortfall == 0
+
+    @property
+    def source(self):
+        """The source that paid (the first one for a split payment), or None if nothing was paid."""
+        return self.parts[0][0] if self.parts else None
+
+class Obligation:
+    """
+    A bill (in cents) to be settled by PaymentRouter.settle.
+    order overrides the router's source order and penalty is the credit score
+    penalty for missing it. A card_payment obligation pays down the credit card;
+    if its amount is None, the card's minimum payment is used, worked out from the
+    card balance at the moment the obligation is settled.
+    """
+    __slots__ = ("name", "amount", "order", "penalty", "card_payment")
+
+    def __init__(self, name, amount, order=None, penalty=0, card_payment=False):
+        self.name = name
+        self.amount = amount
+        self.order = order
+        self.penalty = penalty
+        self.card_payment = card_payment
+
+def get_card_minimum_payment(balance):
+    """Minimum credit card payment in cents: 5% of the balance, at least $25, but never more than is owed."""
+    return min(max(2500, apply_rate(balance, 0.05)), balance)
+
+class PaymentRouter:
+    """
+    Routes payments through the player's money sources.
+    By default a payment is taken whole from the first source in order that can
+    cover it; with allow_partial, each source pays what it can until the bill is covered.
+    """
+    def __init__(self, order=DEFAULT_ORDER, allow_partial=False):
+        self.order = tuple(order)
+        self.allow_partial = allow_partial
+
+    def pay(self, player, amount, order=None, penalty=0, allow_partial=None, name=None):
+        """
+        Pay a single bill (in cents) for the player.
+        Returns a PaymentResult; if the bill isn't fully paid the penalty is taken off the credit score.
+        """
+        if order is None:
+            order = self.order
+        if allow_partial is None:
+            allow_partial = self.allow_partial
+
+        result = PaymentResult(name, amount)
+        remaining = amount
+
+        for source in order:
+            if remaining <= 0:
+                break
+
+            available = self.get_available(player, source)
+            if self.covers(player, source, available, remaining):
+                part = remaining
+            elif allow_partial and available > 0:
+                part = available
+            else:
+                continue
+
+            if source == CASH:
+                player.cash_cents -= part
+            elif source == BANK:
+                player.bank_account.withdraw_cents(part)
+            else:
+                player.credit_card.charge_cents(part)
+
+            result.parts.append((source, part))
+            remaining -= part
+
+        result.finish(remaining)
+        if not result.fully_paid and penalty:
+            player.credit_score -= penalty
+            result.penalty = penalty
+
+        return result
+
+    @staticmethod
+    def covers(player, source, available, amount):
+        """Check whether a source can cover amount (the card is checked against its limit, as Card.charge does)."""
+        if source == CREDIT_CARD:
+            return player.credit_card is not None and player.credit_card.balance_cents + amount <= player.credit_card.limit_cents
+        return available >= amount
+
+    @staticmethod
+    def get_available(player, source):
+        """How much the player can pay from a source right now, in cents."""
+        if source == CASH:
+            return player.cash_cents
+        if source == BANK:
+            return player.bank_account.balance_cents if player.bank_account else 0
+        if source == CREDIT_CARD:
+            card = player.credit_card
+            return card.limit_cents - card.balance_cents if card else 0
+        raise ValueError(f"Unknown payment source: {source!r}")
+
+    def settle(self, player, obligations, allow_partial=None):
+        """
+        Settle a list of Obligations in order, in one pass.
+        Balances are kept in local variables and written back (with their transaction
+        history) once at the end, and no PaymentResult is built per bill, which is
+        cheaper than routing each bill with pay.
+        Returns the amount left unpaid on each obligation, in the same order
+        (0 for a bill that was paid in full).
+        """
+        if allow_partial is None:
+            allow_partial = self.allow_partial
+
+        cash = player.cash_cents
+        account = player.bank_account
+        bank = account.balance_cents if account else 0
+        card = player.credit_card
+        card_balance = card.balance_cents if card else 0
+        card_limit = card.limit_cents if card else 0
+        bank_log = []  # Withdrawal amounts
+        card_log = []  # (kind, amount) pairs
+        penalty_total = 0
+        shortfalls = []
+        default_order = self.order
+
+        for obligation in obligations:
+            amount = obligation.amount
+            if amount is None and obligation.card_payment:
+                amount = get_card_minimum_payment(card_balance)
+
+            if amount <= 0:
+                shortfalls.append(0)
+                continue
+
+            order = obligation.order or default_order
+            if order[0] == CASH and cash >= amount:
+                # Common case: the bill is paid in full from cash
+                cash -= amount
+                remaining = 0
+            else:
+                remaining = amount
+                for source in order:
+                    if remaining <= 0:
+                        break
+
+                    if source == CASH:
+                        available = cash
+                        covered = cash >= remaining
+                    elif source == BANK:
+                        available = bank if account else 0
+                        covered = account is not None and bank >= remaining
+                    else:
+                        available = card_limit - card_balance if card else 0
+                        covered = card is not None and card_balance + remaining <= card_limit
+
+                    if covered:
+                        part = remaining
+                    elif allow_partial and available > 0:
+                        part = available
+                    else:
+                        continue
+
+                    if source == CASH:
+                        cash -= part
+                    elif source == BANK:
+                        bank -= part
+                        bank_log.append(part)
+                    else:
+                        card_balance += part
+                        card_log.append((CHARGE, part))
+
+                    remaining -= part
+
+            if remaining > 0:
+                shortfalls.append(remaining)
+                penalty_total += obligation.penalty
+            else:
+                shortfalls.append(0)
+                if obligation.card_payment:
+                    card_balance -= amount
+                    card_log.append((PAYMENT, amount))
+
+        # Write the balances back once
+        player.cash_cents = cash
+        player.credit_score -= penalty_total
+        if account:
+            account.balance_cents = bank
+            for amount in bank_log:
+                account.record(WITHDRAWAL, amount)
+        if card:
+            card.balance_cents = card_balance
+            for kind, amount in card_log:
+                card.record(kind, amount)
+
+        return shortfalls
@@ -0,0 +1,150 @@
+"""
+Debt payoff planning for Money Smartz.
+
+Plays the player's debts (every loan with a balance, plus the credit card)
+forward month by month under a repayment strategy and reports how long it
+takes to be debt free and how much interest it costs:
+
+- "minimum": only the regular payments (the loans' monthly payments and the
+  card minimum), the baseline the others are compared against;
+- "avalanche": the regular payments plus an extra amount each month, which goes
+  to the debt with the highest interest rate first;
+- "snowball": the same budget, with the extra going to the smallest balance first;
+- "custom": the same budget, with the extra going to the debts in an order the
+  player picks.
+
+In the last three, the budget stays the same as debts are paid off, so the
+payments freed up roll over to the next debt in line. Everything is in whole
+cents with the game's rounding, and a plan is a plain loop over a handful of
+debts, so a screen can replan all the strategies every time an extra payment
+slider moves.
+"""
+from array import array
+from moneySmartz.money import monthly_interest
+from moneySmartz.payments import get_card_minimum_payment
+
+# Strategies
+MINIMUM = "minimum"
+AVALANCHE = "avalanche"
+SNOWBALL = "snowball"
+CUSTOM = "custom"
+
+STRATEGIES = (MINIMUM, AVALANCHE, SNOWBALL)
+
+MAX_MONTHS = 1200  # Give up on plans that don't pay the debts off within 100 years
+
+class Debt:
+    """
+    One debt to pay off: its name, balance (in cents), annual interest rate and
+    regular monthly payment (in cents). A card's regular payment is its minimum,
+    which goes down with the balance, so it's worked out each month instead.
+    """
+    def __init__(self, name, balance_cents, interest_rate, payment_cents=0, card=False):
+        self.name = name
+        self.balance_cents = balance_cents
+        self.interest_rate = interest_rate
+        self.payment_cents = payment_cents
+        self.card = card
+
+    def get_payment_cents(self, balance):
+        """Return the regular payment due on a balance, in cents."""
+        if self.card:
+            return get_card_minimum_payment(balance)
+        return min(self.payment_cents, balance)
+
+class PayoffPlan:
+    """
+    The result of playing a strategy out.
+    months is the number of months until every debt is paid off (None if that takes more
+    than MAX_MONTHS), payoff_months the month each debt is paid off in (in the order of
+    the debts), total_interest the interest paid in cents and balances the total balance
+    at the start of each month, in cents (balances[0] is today's total).
+    """
+    def __init__(self, strategy, extra_cents, months, payoff_months, total_interest, balances):
+        self.strategy = strategy
+        self.extra_cents = extra_cents
+        self.months = months
+        self.payoff_months = payoff_months
+        self.total_interest = total_interest
+        self.balances = balances
+
+def get_debts(player):
+    """Return the player's debts: each loan with a balance, and the credit card if it carries one."""
+    debts = [
+        Debt(f"{loan.loan_type} loan", loan.current_balance_cents, loan.interest_rate, loan.monthly_payment_cents)
+        for loan in player.loans if loan.current_balance_cents > 0
+    ]
+    if player.credit_card and player.credit_card.balance_cents > 0:
+        debts.append(Debt("Credit card", player.credit_card.balance_cents, player.credit_card.interest_rate, card=True))
+    return debts
+
+def get_order(debts, strategy, custom_order=None):
+    """
+    Return the indexes of the debts in the order a strategy sends extra payments to them
+    (None for the minimum strategy). custom_order lists the indexes for the custom strategy.
+    """
+    indexes = range(len(debts))
+    if strategy == AVALANCHE:
+        return sorted(indexes, key=lambda i: (-debts[i].interest_rate, debts[i].balance_cents))
+    if strategy == SNOWBALL:
+        return sorted(indexes, key=lambda i: (debts[i].balance_cents, -debts[i].interest_rate))
+    if strategy == CUSTOM:
+        return list(custom_order)
+    return None
+
+def plan_payoff(debts, strategy, extra_cents=0, custom_order=None):
+    """
+    Play the debts forward under a strategy with an extra payment (in cents) each month.
+    Returns a PayoffPlan.
+    """
+    order = get_order(debts, strategy, custom_order)
+    balances = [debt.balance_cents for debt in debts]
+    payoff_months = [0 if balance <= 0 else None for balance in balances]
+
+    # Everything but the minimum strategy pays a fixed budget: today's regular payments plus the extra
+    budget = sum(debt.get_payment_cents(balance) for debt, balance in zip(debts, balances)) + extra_cents
+
+    totals = array("q", [sum(balances)])
+    total_interest = 0
+    month = 0
+    while totals[-1] > 0 and month < MAX_MONTHS:
+        month += 1
+
+        # Interest, then the regular payments
+        paid = 0
+        for i, debt in enumerate(debts):
+            balance = balances[i]
+            if balance <= 0:
+                continue
+            interest = monthly_interest(balance, debt.interest_rate)
+            total_interest += interest
+            balance += interest
+            payment = debt.get_payment_cents(balance)
+            balances[i] = balance - payment
+            paid += payment
+
+        # What's left of the budget goes to the debts in the strategy's order
+        if order is not None:
+            left = budget - paid
+            for i in order:
+                if left <= 0:
+                    break
+                payment = min(left, balances[i])
+                balances[i] -= payment
+                left -= payment
+
+        for i, balance in enumerate(balances):
+            if balance <= 0 and payoff_months[i] is None:
+                payoff_months[i] = month
+        totals.append(sum(balances))
+
+    months = month if totals[-1] <= 0 else None
+    return PayoffPlan(strategy, extra_cents, months, payoff_months, total_interest, totals)
+
+def compare_strategies(debts, extra_cents=0, custom_order=None):
+    """
+    Plan every strategy (and the custom one, if an order is given) with the same extra payment.
+    Returns a dict of strategy -> PayoffPlan.
+    """
+    strategies = STRATEGIES + ((CUSTOM,) if custom_order is not None else ())
+    return {strategy: plan_payoff(debts, strategy, extra_cents, custom_order) for strategy in strategies}
@@ -0,0 +1,110 @@
+"""
+Seeded random number streams for Money Smartz.
+
+Each subsystem (events, jobs, housing, family, UI) draws from its own stream,
+derived from a single game seed. Runs are reproducible from the seed, a UI
+redraw can't shift the numbers the simulation sees, and worker processes given
+different seeds get uncorrelated streams.
+"""
+import hashlib
+import random
+
+class Stream(random.Random):
+    """
+    A random.Random that counts changes to its state (draws, seeding and setstate),
+    so a captured state can be reused for as long as the stream hasn't moved.
+    """
+    version = 0
+
+    def seed(self, *args, **kwargs):
+        super().seed(*args, **kwargs)
+        self.version += 1
+
+    def setstate(self, state):
+        super().setstate(state)
+        self.version += 1
+
+    def random(self):
+        self.version += 1
+        return super().random()
+
+    def getrandbits(self, k):
+        self.version += 1
+        return super().getrandbits(k)
+
+class RNGRegistry:
+    """
+    A registry of independent random.Random streams, one per subsystem.
+    """
+    STREAMS = ("events", "jobs", "housing", "family", "ui")
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(64)
+        self.seed = seed
+        self.streams = {}
+        self.pushed_back = {}  # Values handed back with push_back, by stream name
+        self.captured = {}  # Stream name -> (version, state) from the last get_state
+
+    def stream(self, name):
+        """Get the random stream for a subsystem, creating it on first use."""
+        rng = self.streams.get(name)
+        if rng is None:
+            rng = Stream(self.derive_seed(name))
+            self.streams[name] = rng
+        return rng
+
+    def random(self, name):
+        """Draw a float in [0, 1) from a stream, returning a pushed back value first if there is one."""
+        if name in self.pushed_back:
+            return self.pushed_back.pop(name)
+        return self.stream(name).random()
+
+    def push_back(self, name, value):
+        """Hand back a value drawn with random() so the next draw from that stream returns it again."""
+        self.pushed_back[name] = value
+
+    def derive_seed(self, name):
+        """Derive the seed of a named stream from the registry seed."""
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode()).digest()
+        return int.from_bytes(digest[:8], "big")
+
+    def spawn(self, key):
+        """Create a child registry (for a worker or branch) whose streams don't overlap with this one."""
+        return RNGRegistry(self.derive_seed(f"spawn:{key}"))
+
+    def reseed(self, seed):
+        """
+        Start every stream over from a new registry seed.
+        Streams are reseeded in place, so code holding on to a stream keeps working.
+        """
+        self.seed = seed
+        for name, rng in self.streams.items():
+            rng.seed(self.derive_seed(name))
+        self.pushed_back = {}
+
+    def get_state(self):
+        """
+        Capture the state of every stream created so far, including pushed back values.
+        The state of a stream that hasn't moved since the last call is shared rather than taken again.
+        """
+        streams = {}
+        for name, rng in self.streams.items():
+            captured = self.captured.get(name)
+            if captured is None or captured[0] != rng.version:
+                captured = (rng.version, rng.getstate())
+                self.captured[name] = captured
+            streams[name] = captured[1]
+        return {"streams": streams, "pushed_back": dict(self.pushed_back)}
+
+    def set_state(self, state):
+        """
+        Restore stream states captured with get_state.
+        Streams first used after the state was captured start over from their seeds.
+        """
+        for name, rng in self.streams.items():
+            if name not in state["streams"]:
+                rng.seed(self.derive_seed(name))
+        for name, rng_state in state["streams"].items():
+            self.stream(name).setstate(rng_state)
+        self.pushed_back = dict(state["pushed_back"])
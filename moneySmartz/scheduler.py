@@ -0,0 +1,151 @@
+"""
+Life stage event scheduler for Money Smartz.
+
+Life stage triggers are kept in a heap keyed by the game month in which they
+next come due, so a month with nothing due costs O(1) instead of re-checking
+every condition. A trigger whose conditions aren't met when it comes due waits
+until the game reports a change to the state it depends on (job, education,
+assets or family) and is then re-armed. Events that come due in the same month
+are queued instead of dropped.
+"""
+import heapq
+import math
+from collections import deque
+
+class LifeStageTrigger:
+    """
+    A life stage event and the conditions under which it fires.
+    The event can happen from first_age up to last_age (None for no limit) while
+    condition(game) holds. depends_on names the parts of the player's state that
+    re-arm the trigger when they change. A trigger with a chance fires in each
+    eligible month with that probability, drawn from the named RNG stream.
+    """
+    def __init__(self, name, first_age, last_age, condition, depends_on, chance=None, stream=None):
+        self.name = name
+        self.first_age = first_age
+        self.last_age = last_age
+        self.condition = condition
+        self.depends_on = depends_on
+        self.chance = chance
+        self.stream = stream
+
+class LifeStageScheduler:
+    """
+    Keeps life stage triggers in a heap of (due month, order, name) entries.
+    Months are counted from the start of the game (see Game.get_month_index).
+    """
+    def __init__(self, triggers):
+        self.triggers = {trigger.name: trigger for trigger in triggers}
+        self.player = None
+        self.heap = []
+        self.armed = set()    # Names of triggers currently in the heap
+        self.waiting = {}     # State key -> names of triggers waiting on it
+        self.pending = deque()  # Events that came due, in the order they'll be delivered
+        self.order = 0  # Next arming number (keeps same-month events in arming order)
+
+    def reset(self, game):
+        """Arm every trigger for the game's current player."""
+        self.player = game.player
+        self.heap = []
+        self.armed = set()
+        self.waiting = {}
+        self.pending.clear()
+
+        for name in self.triggers:
+            self.arm(name, game)
+
+    def arm(self, name, game):
+        """Schedule a trigger for the first month from next month on in which it can fire."""
+        if name in self.armed:
+            return
+
+        trigger = self.triggers[name]
+        age = game.player.age
+        due = game.get_month_index() + 1
+
+        if trigger.last_age is not None:
+            # Ages rise each January, so find the month the player is last_age at the latest
+            months_left = (trigger.last_age - age) * 12 + (12 - game.current_month)
+            if months_left < 1:
+                return  # The trigger's window has passed
+        if trigger.first_age > age:
+            due = game.get_month_index() + (trigger.first_age - age - 1) * 12 + (13 - game.current_month)
+
+        if trigger.chance is not None:
+            # Skip ahead by the number of eligible months that would miss (geometric distribution)
+            roll = game.rng.random(trigger.stream)
+            due += int(math.log(1 - roll) / math.log(1 - trigger.chance))
+
+        self.armed.add(name)
+        heapq.heappush(self.heap, (due, self.order, name))
+        self.order += 1
+
+    def park(self, name):
+        """Hold a trigger whose condition failed until a state it depends on changes."""
+        for key in self.triggers[name].depends_on:
+            self.waiting.setdefault(key, set()).add(name)
+
+    def notify(self, key, game):
+        """Re-arm the triggers waiting on a changed part of the player's state."""
+        names = self.waiting.pop(key, None)
+        if not names:
+            return
+
+        for name in sorted(names):
+            for waiting in self.waiting.values():
+                waiting.discard(name)
+            self.arm(name, game)
+
+    def get_state(self):
+        """Capture the scheduler's queues (see set_state)."""
+        return {
+            "player": self.player,
+            "heap": list(self.heap),
+            "armed": set(self.armed),
+            "waiting": {key: set(names) for key, names in self.waiting.items()},
+            "pending": list(self.pending),
+            "order": self.order
+        }
+
+    def set_state(self, state):
+        """Restore queues captured with get_state."""
+        self.player = state["player"]
+        self.heap = list(state["heap"])
+        self.armed = set(state["armed"])
+        self.waiting = {key: set(names) for key, names in state["waiting"].items()}
+        self.pending = deque(state["pending"])
+        self.order = state["order"]
+
+    def next_due(self):
+        """Return the month index of the next trigger, or None if nothing is scheduled."""
+        return self.heap[0][0] if self.heap else None
+
+    def collect_due(self, game):
+        """Move the triggers due this month into the pending queue (or park them if their condition fails)."""
+        now = game.get_month_index()
+        while self.heap and self.heap[0][0] <= now:
+            _, _, name = heapq.heappop(self.heap)
+            self.armed.discard(name)
+
+            trigger = self.triggers[name]
+            if trigger.last_age is not None and game.player.age > trigger.last_age:
+                continue  # The trigger's window has passed
+
+            if trigger.condition(game):
+                self.pending.append(name)
+            else:
+                self.park(name)
+
+    def pop_event(self, game):
+        """
+        Return the next pending life stage event whose condition still holds, or None.
+        A delivered trigger is re-armed so it can fire again while its condition holds.
+        """
+        while self.pending:
+            name = self.pending.popleft()
+            if self.triggers[name].condition(game):
+                self.arm(name, game)
+                return name
+            self.park(name)
+
+        return None
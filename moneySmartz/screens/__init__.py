@@ -26,6 +26,8 @@ from moneySmartz.screens.financial_screens import (
     PayCreditCardScreen,
     LoanDetailsScreen,
     ExtraLoanPaymentScreen,
+    LoanComparisonScreen,
+    DebtPayoffScreen,
     AssetDetailsScreen,
     JobSearchScreen
 )
@@ -39,7 +41,8 @@ from moneySmartz.screens.life_event_screens import (
     CollegeGraduationScreen,
     CarPurchaseScreen,
     HousingScreen,
-    FamilyPlanningScreen
+    FamilyPlanningScreen,
+    WhatIfScreen
 )
 
 # Random event screens
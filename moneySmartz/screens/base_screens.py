@@ -1,8 +1,9 @@
 import pygame
-import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
+from moneySmartz.ui import Screen, Button, TextInput, get_font, render_text
+from moneySmartz.money import to_dollars
+from moneySmartz.particles import CoinParticles
 
 class TitleScreen(Screen):
     """
@@ -12,8 +13,8 @@ class TitleScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-        self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        self.title_font = get_font(FONT_TITLE)
+        self.subtitle_font = get_font(FONT_LARGE)
 
         # Buttons
         start_button = Button(
@@ -36,6 +37,7 @@ class TitleScreen(Screen):
 
         # Background
         self.bg_color = LIGHT_BLUE
+        self.particles = CoinParticles()
 
         # Logo/Title animation
         self.title_y = -100
@@ -55,8 +57,15 @@ class TitleScreen(Screen):
         """Quit the game."""
         self.game.gui_manager.running = False
 
+    def is_animating(self):
+        """The coins float behind the title the whole time."""
+        return True
+
     def update(self):
         """Update the title animation."""
+        self.particles.update()
+        self.mark_dirty()
+
         # Move title down to target position
         if self.title_y < self.title_target_y:
             self.title_y += self.title_speed
@@ -75,30 +84,18 @@ class TitleScreen(Screen):
         surface.fill(self.bg_color)
 
         # Draw money-themed background elements
-        for i in range(20):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT)
-            size = random.randint(10, 30)
-            alpha = random.randint(20, 100)
-
-            dollar_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-            pygame.draw.circle(dollar_surface, (0, 200, 0, alpha), (size//2, size//2), size//2)
-
-            font = pygame.font.SysFont('Arial', size)
-            text = font.render("$", True, WHITE)
-            text_rect = text.get_rect(center=(size//2, size//2))
-            dollar_surface.blit(text, text_rect)
-
-            surface.blit(dollar_surface, (x, y))
+        self.particles.draw(surface)
 
         # Title
-        title_surface = self.title_font.render("MONEY SMARTZ", True, GREEN)
+        title_surface = render_text(self.title_font, "MONEY SMARTZ", GREEN)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y))
         surface.blit(title_surface, title_rect)
 
         # Subtitle with fade-in
-        subtitle_surface = self.subtitle_font.render("Financial Life Simulator", True, (0, 100, 0))
-        subtitle_surface.set_alpha(self.subtitle_alpha)
+        subtitle_surface = render_text(self.subtitle_font, "Financial Life Simulator", (0, 100, 0))
+        if self.subtitle_alpha < 255:
+            subtitle_surface = subtitle_surface.copy()  # The cached surface is shared, so fade a copy
+            subtitle_surface.set_alpha(self.subtitle_alpha)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, self.title_y + 60))
         surface.blit(subtitle_surface, subtitle_rect)
 
@@ -114,7 +111,7 @@ class NameInputScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        self.title_font = get_font(FONT_LARGE)
 
         # Text input
         self.name_input = TextInput(
@@ -169,7 +166,7 @@ class NameInputScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Enter Your Name", True, BLACK)
+        title_surface = render_text(self.title_font, "Enter Your Name", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
         surface.blit(title_surface, title_rect)
 
@@ -188,8 +185,8 @@ class IntroScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         open_account_button = Button(
@@ -229,7 +226,7 @@ class IntroScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render(f"Welcome, {self.game.player.name}!", True, BLACK)
+        title_surface = render_text(self.title_font, f"Welcome, {self.game.player.name}!", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -245,7 +242,7 @@ class IntroScreen(Screen):
         ]
 
         for i, line in enumerate(intro_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -261,8 +258,8 @@ class DebitCardScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         get_card_button = Button(
@@ -301,7 +298,7 @@ class DebitCardScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Congratulations!", True, BLACK)
+        title_surface = render_text(self.title_font, "Congratulations!", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -311,15 +308,15 @@ class DebitCardScreen(Screen):
         pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
 
         # Card text
-        card_title = self.text_font.render("CHECKING ACCOUNT", True, WHITE)
+        card_title = render_text(self.text_font, "CHECKING ACCOUNT", WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
         surface.blit(card_title, card_title_rect)
 
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, WHITE)
         card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
         surface.blit(card_name, card_name_rect)
 
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", WHITE)
         card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 260))
         surface.blit(card_number, card_number_rect)
 
@@ -334,7 +331,7 @@ class DebitCardScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 350 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -351,41 +348,28 @@ class EndGameScreen(Screen):
         self.reason = reason
 
         # Fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_TITLE)
-        self.subtitle_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-
-        # Calculate final stats
-        self.cash = self.game.player.cash
-        self.bank_balance = self.game.player.bank_account.balance if self.game.player.bank_account else 0
-        self.credit_card_debt = self.game.player.credit_card.balance if self.game.player.credit_card else 0
-
-        self.loan_debt = 0
-        for loan in self.game.player.loans:
-            self.loan_debt += loan.current_balance
-
-        self.asset_value = 0
-        for asset in self.game.player.assets:
-            self.asset_value += asset.current_value
-
-        self.net_worth = self.cash + self.bank_balance - self.credit_card_debt - self.loan_debt + self.asset_value
+        self.title_font = get_font(FONT_TITLE)
+        self.subtitle_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
+        # Final stats, from the balance sheet
+        sheet = self.game.player.balance_sheet
+        self.cash = sheet.cash
+        self.bank_balance = to_dollars(sheet.bank_cents)
+        self.credit_card_debt = to_dollars(sheet.card_debt_cents)
+        self.loan_debt = to_dollars(sheet.loan_debt_cents)
+        self.asset_value = sheet.asset_value
+        self.net_worth = sheet.net_worth
 
         # Financial rating
-        if self.net_worth >= 1000000:
-            self.rating = "Financial Wizard"
-            self.rating_color = GREEN
-        elif self.net_worth >= 500000:
-            self.rating = "Financially Secure"
-            self.rating_color = LIGHT_GREEN
-        elif self.net_worth >= 100000:
-            self.rating = "Financially Stable"
-            self.rating_color = BLUE
-        elif self.net_worth >= 0:
-            self.rating = "Breaking Even"
-            self.rating_color = YELLOW
-        else:
-            self.rating = "In Debt"
-            self.rating_color = RED
+        self.rating = self.game.get_financial_rating(self.net_worth)
+        self.rating_color = {
+            "Financial Wizard": GREEN,
+            "Financially Secure": LIGHT_GREEN,
+            "Financially Stable": BLUE,
+            "Breaking Even": YELLOW,
+            "In Debt": RED
+        }[self.rating]
 
         # Buttons
         quit_button = Button(
@@ -405,7 +389,7 @@ class EndGameScreen(Screen):
     def draw_text(self, surface, text, x, y, center=False, is_title=False):
         """Helper method to draw text."""
         font = self.title_font if is_title else self.text_font
-        text_surface = font.render(text, True, BLACK)
+        text_surface = render_text(font, text, BLACK)
         if center:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
@@ -425,16 +409,16 @@ class EndGameScreen(Screen):
             title = "GAME OVER"
             subtitle = f"Your financial journey has ended after {self.game.current_year} years."
 
-        title_surface = self.title_font.render(title, True, BLUE)
+        title_surface = render_text(self.title_font, title, BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
         surface.blit(title_surface, title_rect)
 
-        subtitle_surface = self.subtitle_font.render(subtitle, True, BLACK)
+        subtitle_surface = render_text(self.subtitle_font, subtitle, BLACK)
         subtitle_rect = subtitle_surface.get_rect(center=(SCREEN_WIDTH // 2, 110))
         surface.blit(subtitle_surface, subtitle_rect)
 
         # Financial summary
-        summary_title = self.subtitle_font.render("FINAL FINANCIAL SUMMARY", True, BLACK)
+        summary_title = render_text(self.subtitle_font, "FINAL FINANCIAL SUMMARY", BLACK)
         summary_rect = summary_title.get_rect(center=(SCREEN_WIDTH // 2, 170))
         surface.blit(summary_title, summary_rect)
 
@@ -449,13 +433,13 @@ class EndGameScreen(Screen):
         ]
 
         for i, item in enumerate(summary_items):
-            text_surface = self.text_font.render(item, True, BLACK)
+            text_surface = render_text(self.text_font, item, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 210 + i * 30))
             surface.blit(text_surface, text_rect)
 
         # Family summary
         if self.game.player.family:
-            family_title = self.subtitle_font.render("FAMILY", True, BLACK)
+            family_title = render_text(self.subtitle_font, "FAMILY", BLACK)
             family_rect = family_title.get_rect(center=(SCREEN_WIDTH // 2, 430))
             surface.blit(family_title, family_rect)
 
@@ -466,22 +450,22 @@ class EndGameScreen(Screen):
                 else:
                     text = f"{member['relation']}: {member['name']}, Age {member['age'] + self.game.current_year}"
 
-                text_surface = self.text_font.render(text, True, BLACK)
+                text_surface = render_text(self.text_font, text, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
                 surface.blit(text_surface, text_rect)
                 y_pos += 30
 
         # Financial rating
-        rating_title = self.subtitle_font.render("Financial Rating:", True, BLACK)
+        rating_title = render_text(self.subtitle_font, "Financial Rating:", BLACK)
         rating_rect = rating_title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 180))
         surface.blit(rating_title, rating_rect)
 
-        rating_text = self.title_font.render(self.rating, True, self.rating_color)
+        rating_text = render_text(self.title_font, self.rating, self.rating_color)
         rating_text_rect = rating_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 140))
         surface.blit(rating_text, rating_text_rect)
 
         # Thank you message
-        thanks_text = self.text_font.render("Thank you for playing MONEY SMARTZ!", True, BLACK)
+        thanks_text = render_text(self.text_font, "Thank you for playing MONEY SMARTZ!", BLACK)
         thanks_rect = thanks_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 110))
         surface.blit(thanks_text, thanks_rect)
 
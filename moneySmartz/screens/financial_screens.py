@@ -1,9 +1,11 @@
 import pygame
-import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
+from moneySmartz.ui import Screen, Button, TextInput, Slider, get_font, render_text
 from moneySmartz.models import BankAccount, Card, Loan, Asset
+from moneySmartz.money import to_cents, to_dollars
+from moneySmartz.payoff import get_debts, compare_strategies, MINIMUM, AVALANCHE, SNOWBALL, CUSTOM
+from moneySmartz.ledger import DEPOSIT, WITHDRAWAL, INTEREST, get_year_range
 
 class BankAccountScreen(Screen):
     """
@@ -13,8 +15,8 @@ class BankAccountScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Account type selection
         self.selected_account_type = "Checking"
@@ -121,7 +123,7 @@ class BankAccountScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Open a Bank Account", True, BLACK)
+        title_surface = render_text(self.title_font, "Open a Bank Account", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -136,7 +138,7 @@ class BankAccountScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -155,13 +157,21 @@ class BankDetailsScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
+        self.small_font = get_font(FONT_SMALL)
 
         # Transaction history scroll
         self.scroll_position = 0
         self.max_visible_transactions = 10
 
+        # Transaction history filters
+        self.kind_filters = [("All", None), ("Deposits", DEPOSIT), ("Withdrawals", WITHDRAWAL), ("Interest", INTEREST)]
+        self.period_filters = ["All Time", "This Year", "Last 12 Months"]
+        self.selected_kind = 0
+        self.selected_period = 0
+
         # Buttons
         back_button = Button(
             SCREEN_WIDTH // 2 - 100,
@@ -189,6 +199,72 @@ class BankDetailsScreen(Screen):
 
         self.buttons = [back_button, scroll_up_button, scroll_down_button]
 
+        # Filter buttons
+        self.kind_buttons = []
+        for i, (label, _) in enumerate(self.kind_filters):
+            self.kind_buttons.append(Button(
+                100 + i * 105,
+                275,
+                100, 30,
+                label,
+                color=BLUE if i == self.selected_kind else GRAY,
+                font_size=FONT_SMALL,
+                action=lambda i=i: self.select_kind(i)
+            ))
+
+        self.period_buttons = []
+        for i, label in enumerate(self.period_filters):
+            self.period_buttons.append(Button(
+                534 + i * 130,
+                275,
+                125, 30,
+                label,
+                color=BLUE if i == self.selected_period else GRAY,
+                font_size=FONT_SMALL,
+                action=lambda i=i: self.select_period(i)
+            ))
+
+        self.buttons += self.kind_buttons + self.period_buttons
+
+        self.refresh_transactions()
+
+    def get_period_months(self):
+        """Return the (first, last) month indexes of the selected period (last is None for no limit)."""
+        period = self.period_filters[self.selected_period]
+        if period == "This Year":
+            return get_year_range(self.game.current_year)
+        if period == "Last 12 Months":
+            now = self.game.get_month_index()
+            return now - 11, now
+        return 0, None
+
+    def refresh_transactions(self):
+        """Look up the transactions and totals for the selected filters (a few binary searches in the ledger)."""
+        account = self.game.player.bank_account
+        kind = self.kind_filters[self.selected_kind][1]
+        first_month, last_month = self.get_period_months()
+
+        self.transactions = account.get_entries(kind, first_month, last_month)
+        self.totals = {
+            kind: account.get_total(kind, first_month, last_month)
+            for kind in (DEPOSIT, WITHDRAWAL, INTEREST)
+        }
+        self.scroll_position = 0
+
+    def select_kind(self, index):
+        """Show only one kind of transaction (or all of them)."""
+        self.selected_kind = index
+        for i, button in enumerate(self.kind_buttons):
+            button.color = BLUE if i == index else GRAY
+        self.refresh_transactions()
+
+    def select_period(self, index):
+        """Show only the transactions of one period."""
+        self.selected_period = index
+        for i, button in enumerate(self.period_buttons):
+            button.color = BLUE if i == index else GRAY
+        self.refresh_transactions()
+
     def scroll_up(self):
         """Scroll transaction history up."""
         if self.scroll_position > 0:
@@ -196,7 +272,7 @@ class BankDetailsScreen(Screen):
 
     def scroll_down(self):
         """Scroll transaction history down."""
-        if self.scroll_position < max(0, len(self.game.player.bank_account.transaction_history) - self.max_visible_transactions):
+        if self.scroll_position < max(0, len(self.transactions) - self.max_visible_transactions):
             self.scroll_position += 1
 
     def go_back(self):
@@ -210,7 +286,7 @@ class BankDetailsScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Bank Account Details", True, BLACK)
+        title_surface = render_text(self.title_font, "Bank Account Details", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
 
@@ -235,47 +311,57 @@ class BankDetailsScreen(Screen):
             info_lines.append("You have a debit card linked to this account.")
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 100 + i * 30))
             surface.blit(text_surface, text_rect)
 
         # Transaction history
-        history_title = self.title_font.render("Transaction History", True, BLACK)
+        history_title = render_text(self.title_font, "Transaction History", BLACK)
         history_rect = history_title.get_rect(center=(SCREEN_WIDTH // 2, 250))
         surface.blit(history_title, history_rect)
 
+        # Totals for the selected period
+        summary = (f"{len(self.transactions)} shown   "
+                   f"Deposits: +${to_dollars(self.totals[DEPOSIT]):.2f}   "
+                   f"Withdrawals: -${to_dollars(self.totals[WITHDRAWAL]):.2f}   "
+                   f"Interest: +${to_dollars(self.totals[INTEREST]):.2f}")
+        summary_surface = render_text(self.small_font, summary, BLACK)
+        summary_rect = summary_surface.get_rect(center=(SCREEN_WIDTH // 2, 322))
+        surface.blit(summary_surface, summary_rect)
+
         # Draw transaction list
-        if self.game.player.bank_account.transaction_history:
+        if self.transactions:
             # Draw scrollable area background
-            scroll_area = pygame.Rect(100, 280, SCREEN_WIDTH - 200, 300)
+            scroll_area = pygame.Rect(100, 340, SCREEN_WIDTH - 200, 300)
             pygame.draw.rect(surface, LIGHT_GRAY, scroll_area)
             pygame.draw.rect(surface, BLACK, scroll_area, 2)  # Border
 
             # Get visible transactions
-            visible_transactions = self.game.player.bank_account.transaction_history[
+            visible_transactions = self.transactions[
                 self.scroll_position:self.scroll_position + self.max_visible_transactions
             ]
 
             for i, transaction in enumerate(visible_transactions):
                 if transaction["type"] == "deposit":
-                    text = f"Deposit: +${transaction['amount']:.2f}"
+                    text = f"Deposit: +${to_dollars(transaction['amount']):.2f}"
                     color = GREEN
                 elif transaction["type"] == "withdrawal":
-                    text = f"Withdrawal: -${transaction['amount']:.2f}"
+                    text = f"Withdrawal: -${to_dollars(transaction['amount']):.2f}"
                     color = RED
                 elif transaction["type"] == "interest":
-                    text = f"Interest: +${transaction['amount']:.2f}"
+                    text = f"Interest: +${to_dollars(transaction['amount']):.2f}"
                     color = BLUE
                 else:
-                    text = f"{transaction['type']}: ${transaction['amount']:.2f}"
+                    text = f"{transaction['type']}: ${to_dollars(transaction['amount']):.2f}"
                     color = BLACK
 
-                text_surface = self.text_font.render(text, True, color)
-                text_rect = text_surface.get_rect(midleft=(120, 300 + i * 30))
+                text_surface = render_text(self.text_font, text, color)
+                text_rect = text_surface.get_rect(midleft=(120, 355 + i * 30))
                 surface.blit(text_surface, text_rect)
         else:
-            no_transactions = self.text_font.render("No transactions yet.", True, BLACK)
-            no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 320))
+            message = "No matching transactions." if self.game.player.bank_account.transaction_history else "No transactions yet."
+            no_transactions = render_text(self.text_font, message, BLACK)
+            no_transactions_rect = no_transactions.get_rect(center=(SCREEN_WIDTH // 2, 380))
             surface.blit(no_transactions, no_transactions_rect)
 
         # Draw buttons
@@ -290,8 +376,8 @@ class DepositScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -368,7 +454,7 @@ class DepositScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Deposit to Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Deposit to Bank", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -381,7 +467,7 @@ class DepositScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -390,7 +476,7 @@ class DepositScreen(Screen):
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
 
@@ -406,8 +492,8 @@ class WithdrawScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Amount input
         self.amount_input = TextInput(
@@ -484,7 +570,7 @@ class WithdrawScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Withdraw from Bank", True, BLACK)
+        title_surface = render_text(self.title_font, "Withdraw from Bank", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -497,7 +583,7 @@ class WithdrawScreen(Screen):
         ]
 
         for i, line in enumerate(info_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -506,7 +592,7 @@ class WithdrawScreen(Screen):
 
         # Draw status message
         if self.status_message:
-            status_surface = self.text_font.render(self.status_message, True, self.status_color)
+            status_surface = render_text(self.text_font, self.status_message, self.status_color)
             status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
             surface.blit(status_surface, status_rect)
 
@@ -522,8 +608,8 @@ class GetDebitCardScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         get_card_button = Button(
@@ -561,7 +647,7 @@ class GetDebitCardScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Get a Debit Card", True, BLACK)
+        title_surface = render_text(self.title_font, "Get a Debit Card", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -571,15 +657,15 @@ class GetDebitCardScreen(Screen):
         pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
 
         # Card text
-        card_title = self.text_font.render("DEBIT", True, WHITE)
+        card_title = render_text(self.text_font, "DEBIT", WHITE)
         card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
         surface.blit(card_title, card_title_rect)
 
-        card_name = self.text_font.render(self.game.player.name, True, WHITE)
+        card_name = render_text(self.text_font, self.game.player.name, WHITE)
         card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 220))
         surface.blit(card_name, card_name_rect)
 
-        card_number = self.text_font.render("**** **** **** 1234", True, WHITE)
+        card_number = render_text(self.text_font, "**** **** **** 1234", WHITE)
         card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 260))
         surface.blit(card_number, card_number_rect)
 
@@ -592,7 +678,7 @@ class GetDebitCardScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 350 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -609,9 +695,9 @@ class CreditCardScreen(Screen):
     """
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont('Arial', FONT_MEDIUM)
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE, bold=True)
-        self.small_font = pygame.font.SysFont('Arial', FONT_SMALL)
+        self.font = get_font(FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE, bold=True)
+        self.small_font = get_font(FONT_SMALL)
         self.message = ""
         self.message_color = BLACK
         self.approved = False
@@ -664,23 +750,8 @@ class CreditCardScreen(Screen):
             self.buttons.append(apply_button)
 
     def apply_for_card(self):
-        # Calculate credit limit based on income and credit score
-        base_limit = min(self.game.player.salary * 0.2, 5000)  # 20% of salary or $5000, whichever is lower
-
-        # Adjust based on credit score
-        if self.game.player.credit_score >= 750:
-            self.credit_limit = base_limit * 1.5
-        elif self.game.player.credit_score >= 700:
-            self.credit_limit = base_limit * 1.2
-        elif self.game.player.credit_score >= 650:
-            self.credit_limit = base_limit
-        elif self.game.player.credit_score >= 600:
-            self.credit_limit = base_limit * 0.8
-        else:
-            self.credit_limit = base_limit * 0.5
-
-        # Approve the card
-        self.game.player.credit_card = Card("Credit", self.credit_limit)
+        # Approve the card with a limit based on income and credit score
+        self.credit_limit = self.game.open_credit_card()
         self.approved = True
 
         # Update message
@@ -712,17 +783,17 @@ class CreditCardScreen(Screen):
         header_rect = pygame.Rect(0, 0, SCREEN_WIDTH, 80)
         pygame.draw.rect(surface, PURPLE, header_rect)
 
-        header_text = self.title_font.render("CREDIT CARD APPLICATION", True, WHITE)
+        header_text = render_text(self.title_font, "CREDIT CARD APPLICATION", WHITE)
         header_rect = header_text.get_rect(center=(SCREEN_WIDTH // 2, 40))
         surface.blit(header_text, header_rect)
 
         # Draw player info
         info_y = 100
-        credit_score_text = self.font.render(f"Your Credit Score: {self.game.player.credit_score}", True, BLACK)
+        credit_score_text = render_text(self.font, f"Your Credit Score: {self.game.player.credit_score}", BLACK)
         surface.blit(credit_score_text, (50, info_y))
 
         if self.game.player.job:
-            income_text = self.font.render(f"Annual Income: ${self.game.player.salary}", True, BLACK)
+            income_text = render_text(self.font, f"Annual Income: ${self.game.player.salary}", BLACK)
             surface.blit(income_text, (50, info_y + 30))
 
         # Draw message
@@ -740,7 +811,7 @@ class CreditCardScreen(Screen):
             message_lines.append(' '.join(current_line))
 
         for i, line in enumerate(message_lines):
-            message_text = self.font.render(line, True, self.message_color)
+            message_text = render_text(self.font, line, self.message_color)
             message_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, 180 + i * 30))
             surface.blit(message_text, message_rect)
 
@@ -751,19 +822,19 @@ class CreditCardScreen(Screen):
             pygame.draw.rect(surface, BLACK, card_rect, 2)  # Border
 
             # Card text
-            card_title = self.font.render("CREDIT CARD", True, WHITE)
+            card_title = render_text(self.font, "CREDIT CARD", WHITE)
             card_title_rect = card_title.get_rect(center=(SCREEN_WIDTH // 2, 280))
             surface.blit(card_title, card_title_rect)
 
-            card_name = self.font.render(self.game.player.name, True, WHITE)
+            card_name = render_text(self.font, self.game.player.name, WHITE)
             card_name_rect = card_name.get_rect(center=(SCREEN_WIDTH // 2, 320))
             surface.blit(card_name, card_name_rect)
 
-            card_number = self.font.render("**** **** **** 1234", True, WHITE)
+            card_number = render_text(self.font, "**** **** **** 1234", WHITE)
             card_number_rect = card_number.get_rect(center=(SCREEN_WIDTH // 2, 350))
             surface.blit(card_number, card_number_rect)
 
-            limit_text = self.small_font.render(f"Credit Limit: ${self.credit_limit:.2f}", True, WHITE)
+            limit_text = render_text(self.small_font, f"Credit Limit: ${self.credit_limit:.2f}", WHITE)
             limit_rect = limit_text.get_rect(center=(SCREEN_WIDTH // 2, 380))
             surface.blit(limit_text, limit_rect)
 
@@ -773,10 +844,15 @@ class CreditCardScreen(Screen):
 
 class CreditCardDetailsScreen(Screen):
     """
-    Screen for viewing credit card details.
+    Screen for viewing credit card details: the balance, the last statement and the
+    interest it cost, and the recent transactions.
     """
     def __init__(self, game):
         super().__init__(game)
+
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
         self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
 
     def go_back(self):
@@ -785,7 +861,43 @@ class CreditCardDetailsScreen(Screen):
 
     def draw(self, surface):
         surface.fill(WHITE)
-        # This would be implemented with credit card details display
+
+        # Title
+        title_surface = render_text(self.title_font, "Credit Card Details", BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        surface.blit(title_surface, title_rect)
+
+        card = self.game.player.credit_card
+        lines = [
+            (f"Balance: ${card.balance:.2f} of ${card.limit:.2f}", BLACK),
+            (f"Available Credit: ${card.limit - card.balance:.2f}", BLACK),
+            (f"Interest Rate: {card.interest_rate*100:.0f}% APR on the average daily balance", BLACK),
+            (f"Last Statement Balance: ${to_dollars(card.statement_balance_cents):.2f}", BLACK)
+        ]
+        if card.last_interest_cents > 0:
+            lines.append((f"Interest Charged on Last Statement: ${to_dollars(card.last_interest_cents):.2f}", RED))
+        if card.statement_balance_cents > 0:
+            lines.append(("Pay the statement balance in full this month to avoid interest.", RED))
+        elif card.balance_cents > 0:
+            lines.append(("Your last statement is paid off, so new purchases are interest free this month.", GREEN))
+
+        for i, (line, color) in enumerate(lines):
+            text_surface = render_text(self.text_font, line, color)
+            text_rect = text_surface.get_rect(midleft=(60, 110 + i * 30))
+            surface.blit(text_surface, text_rect)
+
+        # Recent transactions
+        y = 130 + len(lines) * 30
+        header_surface = render_text(self.text_font, "Recent Transactions:", BLACK)
+        surface.blit(header_surface, header_surface.get_rect(midleft=(60, y)))
+        for i, transaction in enumerate(reversed(card.transaction_history[-5:])):
+            sign = "-" if transaction["type"] == "payment" else "+"
+            line = f"{transaction['type'].capitalize()}: {sign}${to_dollars(transaction['amount']):.2f}"
+            text_surface = render_text(self.text_font, line, GREEN if sign == "-" else RED)
+            surface.blit(text_surface, text_surface.get_rect(midleft=(80, y + 30 + i * 30)))
+
+        for button in self.buttons:
+            button.draw(surface)
 
 class PayCreditCardScreen(Screen):
     """
@@ -806,9 +918,15 @@ class PayCreditCardScreen(Screen):
 class LoanDetailsScreen(Screen):
     """
     Screen for viewing loan details.
+    The payoff figures come from each loan's amortization schedule, which is only
+    computed once, so they're cheap to look up every frame.
     """
     def __init__(self, game):
         super().__init__(game)
+
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+
         self.buttons = [Button(SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 80, 200, 50, "Back", action=self.go_back)]
 
     def go_back(self):
@@ -817,7 +935,38 @@ class LoanDetailsScreen(Screen):
 
     def draw(self, surface):
         surface.fill(WHITE)
-        # This would be implemented with loan details display
+
+        # Title
+        title_surface = render_text(self.title_font, "Loan Details", BLACK)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        surface.blit(title_surface, title_rect)
+
+        if not self.game.player.loans:
+            no_loans = render_text(self.text_font, "You don't have any loans.", BLACK)
+            no_loans_rect = no_loans.get_rect(center=(SCREEN_WIDTH // 2, 150))
+            surface.blit(no_loans, no_loans_rect)
+
+        for i, loan in enumerate(self.game.player.loans):
+            remaining_months = loan.get_payoff_months()
+            lines = [
+                (f"{loan.loan_type} Loan: ${loan.current_balance:.2f} of ${loan.original_amount:.2f} left "
+                 f"at {loan.interest_rate*100:.2f}%", BLACK),
+                (f"Monthly Payment: ${loan.monthly_payment:.2f}   "
+                 f"Paid off in {remaining_months // 12} years and {remaining_months % 12} months", BLACK),
+                (f"Interest Left to Pay: ${to_dollars(loan.get_remaining_interest_cents()):.2f}   "
+                 f"Balance in 1 Year: ${to_dollars(loan.get_balance_after_cents(12)):.2f}", RED)
+            ]
+            if loan.current_balance_cents <= 0:
+                lines = [lines[0], ("Paid off!", GREEN)]
+
+            y = 110 + i * 120
+            for j, (line, color) in enumerate(lines):
+                text_surface = render_text(self.text_font, line, color)
+                text_rect = text_surface.get_rect(midleft=(60, y + j * 30))
+                surface.blit(text_surface, text_rect)
+
+        for button in self.buttons:
+            button.draw(surface)
 
 class ExtraLoanPaymentScreen(Screen):
     """
@@ -835,6 +984,284 @@ class ExtraLoanPaymentScreen(Screen):
         surface.fill(WHITE)
         # This would be implemented with extra loan payment logic
 
+class LoanComparisonScreen(Screen):
+    """
+    Screen comparing the loan offers for a car or a house: every interest rate tier,
+    term and down payment, with the monthly payment, total interest and whether the
+    player can afford it. The whole grid is computed at once (see moneySmartz.loancompare);
+    the rate buttons only pick which slice of it is shown.
+    """
+    def __init__(self, game, item, mortgage, back_screen):
+        super().__init__(game)
+        from moneySmartz.loancompare import compare_auto_loans, compare_mortgages
+
+        # Title
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
+
+        self.item = item
+        self.mortgage = mortgage
+        self.back_screen = back_screen
+
+        if mortgage:
+            self.comparison = compare_mortgages(game, [item])
+            self.player_rate = game.get_mortgage_rate()
+        else:
+            self.comparison = compare_auto_loans(game, [item])
+            self.player_rate = game.get_auto_loan_rate()
+
+        self.rates = sorted(set(self.comparison.rate.tolist()))
+        self.selected_rate = self.player_rate
+
+        self.create_buttons()
+
+    def create_buttons(self):
+        """Create the rate tier buttons and the back button."""
+        self.buttons = []
+
+        width = 160
+        left = SCREEN_WIDTH // 2 - (len(self.rates) * (width + 10) - 10) // 2
+        for i, rate in enumerate(self.rates):
+            label = f"{rate*100:.1f}%" + (" (yours)" if rate == self.player_rate else "")
+            rate_button = Button(
+                left + i * (width + 10),
+                120,
+                width, 35,
+                label,
+                color=BLUE if rate == self.selected_rate else GRAY,
+                font_size=FONT_SMALL,
+                action=lambda r=rate: self.select_rate(r)
+            )
+            self.buttons.append(rate_button)
+
+        # Back button
+        back_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT - 80,
+            200, 50,
+            "Back",
+            action=self.go_back
+        )
+        self.buttons.append(back_button)
+
+    def select_rate(self, rate):
+        """Show the offers at another interest rate."""
+        self.selected_rate = rate
+        self.create_buttons()
+
+    def go_back(self):
+        """Return to the purchase screen."""
+        self.game.gui_manager.set_screen(self.back_screen)
+
+    def draw(self, surface):
+        """Draw the offers at the selected rate."""
+        surface.fill(WHITE)
+
+        # Title
+        kind = "MORTGAGE" if self.mortgage else "AUTO LOAN"
+        title_surface = render_text(self.title_font, f"{kind} OFFERS: {self.item['name']}", BLUE)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
+        surface.blit(title_surface, title_rect)
+
+        intro = (f"Price: ${self.item['value']}   Your salary: ${self.game.player.salary:.2f}/year   "
+                 f"Cash and bank: ${self.game.player.balance_sheet.liquid_assets:.2f}")
+        intro_surface = render_text(self.small_font, intro, BLACK)
+        surface.blit(intro_surface, intro_surface.get_rect(center=(SCREEN_WIDTH // 2, 92)))
+
+        # Offers at the selected rate
+        comparison = self.comparison
+        mask = comparison.rate == self.selected_rate
+        cheapest = comparison.get_cheapest(mask)
+
+        columns = [("Term", 90), ("Down Payment", 210), ("Monthly", 390), ("Total Interest", 560),
+                   ("% of Income", 730), ("Affordable", 880)]
+        for label, x in columns:
+            header_surface = render_text(self.small_font, label, DARK_GRAY)
+            surface.blit(header_surface, header_surface.get_rect(center=(x, 185)))
+
+        for row, offer in enumerate(comparison.get_offers(mask)):
+            if cheapest is not None and offer == cheapest:
+                color = GREEN
+            elif offer["affordable"]:
+                color = BLACK
+            else:
+                color = RED
+
+            share = f"{offer['payment_share']*100:.1f}%" if offer["payment_share"] != float("inf") else "-"
+            cells = [
+                f"{offer['term']} years",
+                f"{offer['down']*100:.0f}% (${to_dollars(offer['down_payment']):.0f})",
+                f"${to_dollars(offer['payment']):.2f}",
+                f"${to_dollars(offer['total_interest']):.2f}",
+                share,
+                "Yes" if offer["affordable"] else "No"
+            ]
+            y = 212 + row * 27
+            for (_, x), cell in zip(columns, cells):
+                cell_surface = render_text(self.small_font, cell, color)
+                surface.blit(cell_surface, cell_surface.get_rect(center=(x, y)))
+
+        if cheapest is not None:
+            note = "The affordable offer with the least interest is shown in green."
+        else:
+            note = "None of these offers fits your budget."
+        note_surface = render_text(self.small_font, note, DARK_GRAY)
+        surface.blit(note_surface, note_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 110)))
+
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
+
+class DebtPayoffScreen(Screen):
+    """
+    Screen for planning how to pay off all the player's debts.
+    Drag the slider to set an extra monthly payment: every strategy is replanned
+    (see moneySmartz.payoff) and the chart of total debt over time redrawn right away.
+    "Pay First" moves a debt to the front of the custom strategy's order.
+    """
+    STRATEGY_COLORS = {MINIMUM: DARK_GRAY, AVALANCHE: BLUE, SNOWBALL: GREEN, CUSTOM: ORANGE}
+
+    def __init__(self, game):
+        super().__init__(game)
+
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
+
+        self.debts = get_debts(game.player)
+        self.custom_order = list(range(len(self.debts)))
+
+        # Extra payment slider, in dollars (up to half the monthly income, and at least $500)
+        maximum = max(500, int(game.player.salary / 12 * 0.5) // 100 * 100)
+        self.slider = Slider(300, 235, SCREEN_WIDTH - 400, 20, 0, maximum, step=25)
+
+        self.chart_rect = pygame.Rect(100, 390, SCREEN_WIDTH - 160, 260)
+
+        self.create_buttons()
+        self.replan()
+
+    def create_buttons(self):
+        """Create the Pay First buttons and the back button."""
+        self.buttons = []
+
+        for i, debt in enumerate(self.debts):
+            first_button = Button(
+                SCREEN_WIDTH - 200,
+                80 + i * 28,
+                120, 24,
+                "Pay First",
+                color=ORANGE if self.custom_order[0] == i else GRAY,
+                font_size=FONT_SMALL,
+                action=lambda i=i: self.pay_first(i)
+            )
+            self.buttons.append(first_button)
+
+        back_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT - 80,
+            200, 50,
+            "Back",
+            action=self.go_back
+        )
+        self.buttons.append(back_button)
+
+    def replan(self):
+        """Plan every strategy for the slider's extra payment."""
+        self.plans = compare_strategies(self.debts, to_cents(self.slider.value), self.custom_order)
+
+    def pay_first(self, index):
+        """Move a debt to the front of the custom order."""
+        self.custom_order.remove(index)
+        self.custom_order.insert(0, index)
+        self.create_buttons()
+        self.replan()
+
+    def go_back(self):
+        """Go back to the game screen."""
+        from moneySmartz.screens.game_screen import GameScreen
+        self.game.gui_manager.set_screen(GameScreen(self.game))
+
+    def handle_events(self, events):
+        """Handle pygame events."""
+        super().handle_events(events)
+        if self.slider.update(events):
+            self.replan()
+            self.mark_dirty()  # The label, the plans and the chart all change
+
+    def draw(self, surface):
+        """Draw the debts, the plans and the chart."""
+        surface.fill(WHITE)
+
+        title_surface = render_text(self.title_font, "Debt Payoff Planner", BLACK)
+        surface.blit(title_surface, title_surface.get_rect(center=(SCREEN_WIDTH // 2, 40)))
+
+        if not self.debts:
+            text_surface = render_text(self.text_font, "You're debt free!", GREEN)
+            surface.blit(text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150)))
+            for button in self.buttons:
+                button.draw(surface)
+            return
+
+        # Debts
+        for i, debt in enumerate(self.debts):
+            line = f"{debt.name}: ${to_dollars(debt.balance_cents):.2f} at {debt.interest_rate*100:.2f}%"
+            text_surface = render_text(self.small_font, line, BLACK)
+            surface.blit(text_surface, text_surface.get_rect(midleft=(60, 92 + i * 28)))
+
+        # Slider
+        label_surface = render_text(self.text_font, f"Extra: ${self.slider.value}/month", BLACK)
+        surface.blit(label_surface, label_surface.get_rect(midleft=(60, self.slider.rect.centery)))
+        self.slider.draw(surface)
+
+        # Plans
+        baseline = self.plans[MINIMUM].total_interest
+        for row, (strategy, plan) in enumerate(self.plans.items()):
+            if plan.months is None:
+                line = f"{strategy.capitalize()}: never debt free at this rate"
+            else:
+                line = (f"{strategy.capitalize()}: debt free in {plan.months // 12} years {plan.months % 12} months, "
+                        f"interest ${to_dollars(plan.total_interest):.2f}")
+                if strategy != MINIMUM:
+                    line += f" (saves ${to_dollars(baseline - plan.total_interest):.2f})"
+            text_surface = render_text(self.small_font, line, self.STRATEGY_COLORS[strategy])
+            surface.blit(text_surface, text_surface.get_rect(midleft=(60, 285 + row * 24)))
+
+        self.draw_chart(surface)
+
+        for button in self.buttons:
+            button.draw(surface)
+
+    def draw_chart(self, surface):
+        """Draw each plan's total debt over time."""
+        rect = self.chart_rect
+        pygame.draw.rect(surface, LIGHT_GRAY, rect)
+        pygame.draw.rect(surface, BLACK, rect, 2)  # Border
+
+        months = max(len(plan.balances) - 1 for plan in self.plans.values())
+        top = max(max(plan.balances) for plan in self.plans.values())
+        if months == 0 or top <= 0:
+            return
+
+        for strategy, plan in self.plans.items():
+            balances = plan.balances
+            # One point per pixel column at most
+            stride = max(1, len(balances) // rect.width)
+            points = [
+                (rect.left + rect.width * month // months, rect.bottom - int(rect.height * balances[month] / top))
+                for month in range(0, len(balances), stride)
+            ]
+            points.append((rect.left + rect.width * (len(balances) - 1) // months, rect.bottom - int(rect.height * balances[-1] / top)))
+            pygame.draw.lines(surface, self.STRATEGY_COLORS[strategy], False, points, 2)
+
+        # Axis labels
+        top_surface = render_text(self.small_font, f"${to_dollars(top):.0f}", DARK_GRAY)
+        surface.blit(top_surface, top_surface.get_rect(topright=(rect.left - 5, rect.top)))
+        end_surface = render_text(self.small_font, f"{months // 12} years", DARK_GRAY)
+        surface.blit(end_surface, end_surface.get_rect(topright=(rect.right, rect.bottom + 4)))
+        start_surface = render_text(self.small_font, "Now", DARK_GRAY)
+        surface.blit(start_surface, start_surface.get_rect(topleft=(rect.left, rect.bottom + 4)))
+
 class AssetDetailsScreen(Screen):
     """
     Screen for viewing asset details.
@@ -859,8 +1286,8 @@ class JobSearchScreen(Screen):
         super().__init__(game)
 
         # Title and fonts
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Generate job options based on education and experience
         self.job_options = self.generate_job_options()
@@ -888,80 +1315,14 @@ class JobSearchScreen(Screen):
 
     def generate_job_options(self):
         """Generate job options based on player's education and experience."""
-        job_options = []
-
-        # Current job info
-        current_salary = self.game.player.salary if self.game.player.job else 0
-
-        # Base salary multiplier based on years of experience
-        experience_years = max(0, self.game.player.age - 18)  # Assume working age starts at 18
-        experience_multiplier = 1.0 + (experience_years * 0.03)  # 3% increase per year of experience
-
-        # Generate job options based on education
-        if self.game.player.education == "High School" or self.game.player.education == "High School Graduate":
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-                {"title": "Office Clerk", "salary": int(30000 * experience_multiplier)},
-            ]
-        elif self.game.player.education == "Trade School":
-            job_options = [
-                {"title": "Electrician", "salary": int(45000 * experience_multiplier)},
-                {"title": "Plumber", "salary": int(48000 * experience_multiplier)},
-                {"title": "HVAC Technician", "salary": int(50000 * experience_multiplier)},
-                {"title": "Automotive Mechanic", "salary": int(42000 * experience_multiplier)},
-            ]
-        elif self.game.player.education == "College Graduate":
-            job_options = [
-                {"title": "Accountant", "salary": int(60000 * experience_multiplier)},
-                {"title": "Marketing Manager", "salary": int(65000 * experience_multiplier)},
-                {"title": "Software Developer", "salary": int(75000 * experience_multiplier)},
-                {"title": "Financial Analyst", "salary": int(70000 * experience_multiplier)},
-            ]
-        else:  # Default/basic jobs
-            job_options = [
-                {"title": "Retail Associate", "salary": int(25000 * experience_multiplier)},
-                {"title": "Food Service Worker", "salary": int(22000 * experience_multiplier)},
-                {"title": "Warehouse Worker", "salary": int(28000 * experience_multiplier)},
-            ]
-
-        # Add some randomness to salaries (±10%)
-        for job in job_options:
-            job["salary"] = int(job["salary"] * random.uniform(0.9, 1.1))
-
-        # Filter out jobs that don't offer at least 5% more than current salary (if employed)
-        if self.game.player.job:
-            job_options = [job for job in job_options if job["salary"] >= current_salary * 1.05]
-
-        return job_options
+        return self.game.generate_job_options()
 
     def apply_for_job(self, job):
         """Apply for the selected job."""
-        # Job application success chance based on qualifications
-        base_success_chance = 0.7  # 70% base chance
-
-        # Adjust for education
-        if self.game.player.education == "College Graduate":
-            base_success_chance += 0.2
-        elif self.game.player.education == "Trade School":
-            base_success_chance += 0.1
-
-        # Adjust for experience
-        experience_years = max(0, self.game.player.age - 18)
-        base_success_chance += min(0.2, experience_years * 0.01)  # Up to 20% bonus for experience
-
-        # Cap at 95% chance
-        success_chance = min(0.95, base_success_chance)
-
-        # Determine if application is successful
-        if random.random() < success_chance:
-            old_job = self.game.player.job
-            old_salary = self.game.player.salary
-
-            self.game.player.job = job["title"]
-            self.game.player.salary = job["salary"]
+        old_job = self.game.player.job
+        old_salary = self.game.player.salary
 
+        if self.game.apply_for_job(job):
             if old_job:
                 salary_increase = self.game.player.salary - old_salary
                 percent_increase = (salary_increase / old_salary) * 100
@@ -988,39 +1349,39 @@ class JobSearchScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("Job Search", True, BLACK)
+        title_surface = render_text(self.title_font, "Job Search", BLACK)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 50))
         surface.blit(title_surface, title_rect)
 
         # Current job info
         current_job_text = f"Current Job: {self.game.player.job if self.game.player.job else 'Unemployed'}"
-        current_job_surface = self.text_font.render(current_job_text, True, BLACK)
+        current_job_surface = render_text(self.text_font, current_job_text, BLACK)
         current_job_rect = current_job_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
         surface.blit(current_job_surface, current_job_rect)
 
         if self.game.player.job:
             salary_text = f"Current Salary: ${self.game.player.salary}/year"
-            salary_surface = self.text_font.render(salary_text, True, BLACK)
+            salary_surface = render_text(self.text_font, salary_text, BLACK)
             salary_rect = salary_surface.get_rect(center=(SCREEN_WIDTH // 2, 130))
             surface.blit(salary_surface, salary_rect)
 
         # Available jobs or no jobs message
         if self.job_options:
-            jobs_title = self.text_font.render("Available Job Opportunities:", True, BLACK)
+            jobs_title = render_text(self.text_font, "Available Job Opportunities:", BLACK)
             jobs_title_rect = jobs_title.get_rect(center=(SCREEN_WIDTH // 2, 180))
             surface.blit(jobs_title, jobs_title_rect)
 
-            jobs_subtitle = self.text_font.render("Click on a job to apply", True, BLACK)
+            jobs_subtitle = render_text(self.text_font, "Click on a job to apply", BLACK)
             jobs_subtitle_rect = jobs_subtitle.get_rect(center=(SCREEN_WIDTH // 2, 210))
             surface.blit(jobs_subtitle, jobs_subtitle_rect)
         else:
             no_jobs_text = "No better job opportunities available at this time."
-            no_jobs_surface = self.text_font.render(no_jobs_text, True, BLACK)
+            no_jobs_surface = render_text(self.text_font, no_jobs_text, BLACK)
             no_jobs_rect = no_jobs_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
             surface.blit(no_jobs_surface, no_jobs_rect)
 
             advice_text = "Keep building your skills and try again later!"
-            advice_surface = self.text_font.render(advice_text, True, BLACK)
+            advice_surface = render_text(self.text_font, advice_text, BLACK)
             advice_rect = advice_surface.get_rect(center=(SCREEN_WIDTH // 2, 230))
             surface.blit(advice_surface, advice_rect)
 
@@ -1041,7 +1402,7 @@ class JobSearchScreen(Screen):
                 lines.append(' '.join(current_line))
 
             for i, line in enumerate(lines):
-                status_surface = self.text_font.render(line, True, self.status_color)
+                status_surface = render_text(self.text_font, line, self.status_color)
                 status_rect = status_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 150 + i * 30))
                 surface.blit(status_surface, status_rect)
 
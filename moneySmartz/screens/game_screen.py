@@ -1,8 +1,7 @@
 import pygame
-import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button
+from moneySmartz.ui import Screen, Button, get_font, render_text
 
 class GameScreen(Screen):
     """
@@ -27,6 +26,27 @@ class GameScreen(Screen):
         )
         self.buttons.append(continue_button)
 
+        # Fast forward button (skips ahead to the next month where something happens)
+        fast_forward_button = Button(
+            SCREEN_WIDTH - 220, 
+            SCREEN_HEIGHT - 120,
+            200, 50,
+            "Fast Forward",
+            action=self.fast_forward
+        )
+        self.buttons.append(fast_forward_button)
+
+        # Rewind button (goes back a year to try again)
+        if self.game.can_rewind():
+            rewind_button = Button(
+                SCREEN_WIDTH - 220, 
+                SCREEN_HEIGHT - 180,
+                200, 50,
+                "Rewind 1 Year",
+                action=self.rewind
+            )
+            self.buttons.append(rewind_button)
+
         # Banking buttons
         if not self.game.player.bank_account:
             bank_button = Button(
@@ -125,6 +145,17 @@ class GameScreen(Screen):
             )
             self.buttons.append(pay_loan_button)
 
+        # Debt payoff planner
+        if self.game.player.balance_sheet.debt_cents > 0:
+            plan_debt_button = Button(
+                460, 
+                SCREEN_HEIGHT - 150,
+                200, 50,
+                "Plan Debt Payoff",
+                action=self.plan_debt_payoff
+            )
+            self.buttons.append(plan_debt_button)
+
         # Asset buttons
         if self.game.player.assets:
             view_assets_button = Button(
@@ -146,7 +177,7 @@ class GameScreen(Screen):
                 action=self.look_for_job
             )
             self.buttons.append(job_button)
-        elif self.game.player.job and random.random() < 0.1:  # 10% chance of job opportunity each month
+        elif self.game.player.job and self.game.rng.stream("ui").random() < 0.1:  # 10% chance of job opportunity each month
             better_job_button = Button(
                 460, 
                 SCREEN_HEIGHT - 210,
@@ -158,27 +189,22 @@ class GameScreen(Screen):
 
     def continue_to_next_month(self):
         """Continue to the next month."""
-        # Increment month
-        self.game.current_month += 1
-        if self.game.current_month > 12:
-            self.game.current_month = 1
-            self.game.current_year += 1
-            self.game.player.age += 1
-
-            # Apply interest to savings
-            if self.game.player.bank_account and self.game.player.bank_account.account_type == "Savings":
-                self.game.player.bank_account.apply_interest()
-
-            # Age assets
-            for asset in self.game.player.assets:
-                asset.age_asset()
-
-        # Process monthly finances
-        self.game.process_monthly_finances()
-
-        # Random events
-        if random.random() < 0.3:  # 30% chance of an event each month
-            self.game.trigger_random_event()
+        # Show any life stage event still queued from this month before moving on
+        if self.game.has_pending_life_stage_event():
+            if self.game.check_life_stage_events_gui():
+                return
+
+        # Calendar, finances and random events
+        report = self.game.advance_month()
+
+        # Random events (life stage events stay queued until the player continues)
+        if report["random_event"]:
+            from moneySmartz.screens.random_event_screens import RandomEventScreen
+            random_event = report["random_event"]
+            self.game.gui_manager.set_screen(RandomEventScreen(
+                self.game, random_event["event"], random_event["cash_effect"], random_event["message"]
+            ))
+            return
 
         # Life stage events based on age
         life_event_triggered = self.game.check_life_stage_events_gui()
@@ -192,6 +218,21 @@ class GameScreen(Screen):
                 # Refresh buttons (in case player status changed)
                 self.create_buttons()
 
+    def fast_forward(self):
+        """Skip the quiet months and continue to the next month where something happens."""
+        months, reason = self.game.fast_forward()
+
+        if reason in ("random_event", "life_event", "retirement"):
+            self.continue_to_next_month()
+        else:
+            # Stopped on a missed payment - refresh buttons (in case player status changed)
+            self.create_buttons()
+
+    def rewind(self):
+        """Go back a year (or as far as the history goes) and refresh the screen."""
+        self.game.rewind(12)
+        self.create_buttons()
+
     def open_bank_account(self):
         """Open a bank account screen."""
         from moneySmartz.screens.financial_screens import BankAccountScreen
@@ -242,6 +283,11 @@ class GameScreen(Screen):
         from moneySmartz.screens.financial_screens import ExtraLoanPaymentScreen
         self.game.gui_manager.set_screen(ExtraLoanPaymentScreen(self.game))
 
+    def plan_debt_payoff(self):
+        """Plan paying off the player's debts."""
+        from moneySmartz.screens.financial_screens import DebtPayoffScreen
+        self.game.gui_manager.set_screen(DebtPayoffScreen(self.game))
+
     def view_assets(self):
         """View asset details."""
         from moneySmartz.screens.financial_screens import AssetDetailsScreen
@@ -261,17 +307,17 @@ class GameScreen(Screen):
         pygame.draw.rect(surface, BLUE, (0, 0, SCREEN_WIDTH, 80))
 
         # Title
-        title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        title_surface = title_font.render(f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", True, WHITE)
+        title_font = get_font(FONT_LARGE)
+        title_surface = render_text(title_font, f"MONTH: {self.game.current_month}/YEAR: {self.game.current_year + 2023}", WHITE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 25))
         surface.blit(title_surface, title_rect)
 
-        age_surface = title_font.render(f"AGE: {self.game.player.age}", True, WHITE)
+        age_surface = render_text(title_font, f"AGE: {self.game.player.age}", WHITE)
         age_rect = age_surface.get_rect(center=(SCREEN_WIDTH // 2, 55))
         surface.blit(age_surface, age_rect)
 
         # Player info section
-        info_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        info_font = get_font(FONT_MEDIUM)
 
         # Name and education
         self.draw_text(surface, f"Name: {self.game.player.name}", 20, 100)
@@ -322,20 +368,8 @@ class GameScreen(Screen):
                     family_text = f"{member['relation']}: {member['name']}, Age {member['age'] + self.game.current_year}"
                 self.draw_text(surface, family_text, 720, 130 + i * 30)
 
-        # Calculate and display net worth
-        cash = self.game.player.cash
-        bank_balance = self.game.player.bank_account.balance if self.game.player.bank_account else 0
-        credit_card_debt = self.game.player.credit_card.balance if self.game.player.credit_card else 0
-
-        loan_debt = 0
-        for loan in self.game.player.loans:
-            loan_debt += loan.current_balance
-
-        asset_value = 0
-        for asset in self.game.player.assets:
-            asset_value += asset.current_value
-
-        net_worth = cash + bank_balance - credit_card_debt - loan_debt + asset_value
+        # Display net worth (kept up to date by the balance sheet, so there's nothing to add up here)
+        net_worth = self.game.player.balance_sheet.net_worth
 
         # Net worth with color based on value
         if net_worth >= 0:
@@ -343,9 +377,9 @@ class GameScreen(Screen):
         else:
             net_worth_color = RED
 
-        net_worth_font = pygame.font.SysFont('Arial', FONT_LARGE)
+        net_worth_font = get_font(FONT_LARGE)
         net_worth_text = f"NET WORTH: ${net_worth:.2f}"
-        net_worth_surface = net_worth_font.render(net_worth_text, True, net_worth_color)
+        net_worth_surface = render_text(net_worth_font, net_worth_text, net_worth_color)
         net_worth_rect = net_worth_surface.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 330))
         surface.blit(net_worth_surface, net_worth_rect)
 
@@ -355,6 +389,6 @@ class GameScreen(Screen):
 
     def draw_text(self, surface, text, x, y, is_title=False):
         """Helper method to draw text."""
-        font = pygame.font.SysFont('Arial', FONT_LARGE if is_title else FONT_MEDIUM)
-        text_surface = font.render(text, True, BLACK)
+        font = get_font(FONT_LARGE if is_title else FONT_MEDIUM)
+        text_surface = render_text(font, text, BLACK)
         surface.blit(text_surface, (x, y))
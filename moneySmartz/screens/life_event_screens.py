@@ -1,9 +1,7 @@
 import pygame
-import random
 from pygame.locals import *
 from moneySmartz.constants import *
-from moneySmartz.ui import Screen, Button, TextInput
-from moneySmartz.models import Loan, Asset, Card
+from moneySmartz.ui import Screen, Button, TextInput, get_font, render_text
 
 class HighSchoolGraduationScreen(Screen):
     """
@@ -13,8 +11,8 @@ class HighSchoolGraduationScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         college_button = Button(
@@ -45,19 +43,7 @@ class HighSchoolGraduationScreen(Screen):
 
     def go_to_college(self):
         """Choose to go to college."""
-        # Check if player can afford college
-        annual_cost = 20000
-        if self.game.player.cash >= annual_cost:
-            self.game.player.cash -= annual_cost
-        elif self.game.player.bank_account and self.game.player.bank_account.balance >= annual_cost:
-            self.game.player.bank_account.withdraw(annual_cost)
-        else:
-            # Need a student loan
-            loan_amount = 80000  # 4 years of college
-            loan = Loan("Student", loan_amount, 0.05, 20)  # 5% interest, 20-year term
-            self.game.player.loans.append(loan)
-
-        self.game.player.education = "College (In Progress)"
+        self.game.attend_college()
 
         # Return to game screen
         from moneySmartz.screens.game_screen import GameScreen
@@ -65,18 +51,7 @@ class HighSchoolGraduationScreen(Screen):
 
     def go_to_trade_school(self):
         """Choose to go to trade school."""
-        # Check if player can afford trade school
-        cost = 10000
-        if self.game.player.cash >= cost:
-            self.game.player.cash -= cost
-        elif self.game.player.bank_account and self.game.player.bank_account.balance >= cost:
-            self.game.player.bank_account.withdraw(cost)
-        else:
-            # Need a student loan
-            loan = Loan("Student", cost, 0.05, 10)  # 5% interest, 10-year term
-            self.game.player.loans.append(loan)
-
-        self.game.player.education = "Trade School"
+        self.game.attend_trade_school()
 
         # Return to game screen
         from moneySmartz.screens.game_screen import GameScreen
@@ -84,7 +59,7 @@ class HighSchoolGraduationScreen(Screen):
 
     def start_working(self):
         """Choose to start working full-time."""
-        self.game.player.education = "High School Graduate"
+        self.game.start_working()
 
         # Go to job search screen
         from moneySmartz.screens.financial_screens import JobSearchScreen
@@ -96,7 +71,7 @@ class HighSchoolGraduationScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("HIGH SCHOOL GRADUATION", True, BLUE)
+        title_surface = render_text(self.title_font, "HIGH SCHOOL GRADUATION", BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -135,7 +110,7 @@ class HighSchoolGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -151,8 +126,8 @@ class CollegeGraduationScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Buttons
         continue_button = Button(
@@ -167,11 +142,8 @@ class CollegeGraduationScreen(Screen):
 
     def continue_to_job_search(self):
         """Continue to job search after graduation."""
-        # Update education status
-        self.game.player.education = "College Graduate"
-
-        # Boost credit score
-        self.game.player.credit_score += 20  # Education boosts credit score
+        # Update education status and boost credit score
+        self.game.graduate_college()
 
         # Go to job search screen
         from moneySmartz.screens.financial_screens import JobSearchScreen
@@ -183,7 +155,7 @@ class CollegeGraduationScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("COLLEGE GRADUATION", True, BLUE)
+        title_surface = render_text(self.title_font, "COLLEGE GRADUATION", BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -218,7 +190,7 @@ class CollegeGraduationScreen(Screen):
         ]
 
         for i, line in enumerate(text_lines):
-            text_surface = self.text_font.render(line, True, BLACK)
+            text_surface = render_text(self.text_font, line, BLACK)
             text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 250 + i * 30))
             surface.blit(text_surface, text_rect)
 
@@ -234,16 +206,11 @@ class CarPurchaseScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # Car options
-        self.car_options = [
-            {"name": "Used Economy Car", "value": 5000},
-            {"name": "New Economy Car", "value": 18000},
-            {"name": "Used Luxury Car", "value": 15000},
-            {"name": "New Luxury Car", "value": 35000},
-        ]
+        self.car_options = CAR_OPTIONS
 
         # Selected car
         self.selected_car = None
@@ -273,6 +240,16 @@ class CarPurchaseScreen(Screen):
                 )
                 self.buttons.append(car_button)
 
+            # What-if comparison button
+            compare_button = Button(
+                SCREEN_WIDTH // 2 - 150,
+                SCREEN_HEIGHT - 160,
+                300, 50,
+                "Compare Luxury vs Economy",
+                action=self.compare_cars
+            )
+            self.buttons.append(compare_button)
+
             # Skip button
             skip_button = Button(
                 SCREEN_WIDTH // 2 - 100,
@@ -285,12 +262,7 @@ class CarPurchaseScreen(Screen):
 
         elif self.state == 1:
             # Payment method buttons
-            payment_options = ["Cash"]
-
-            if self.game.player.bank_account and self.game.player.bank_account.balance >= self.selected_car['value']:
-                payment_options.append("Bank Account")
-
-            payment_options.append("Auto Loan")
+            payment_options = self.game.get_car_payment_options(self.selected_car)
 
             for i, method in enumerate(payment_options):
                 method_button = Button(
@@ -302,6 +274,16 @@ class CarPurchaseScreen(Screen):
                 )
                 self.buttons.append(method_button)
 
+            # Loan offer comparison button
+            offers_button = Button(
+                SCREEN_WIDTH // 2 - 150,
+                SCREEN_HEIGHT - 160,
+                300, 50,
+                "Compare Loan Offers",
+                action=self.compare_loan_offers
+            )
+            self.buttons.append(offers_button)
+
             # Back button
             back_button = Button(
                 SCREEN_WIDTH // 2 - 100,
@@ -338,30 +320,31 @@ class CarPurchaseScreen(Screen):
         """Select a payment method."""
         self.payment_method = method
 
-        # Process payment
-        if method == "Cash" and self.game.player.cash >= self.selected_car['value']:
-            self.game.player.cash -= self.selected_car['value']
-        elif method == "Bank Account":
-            self.game.player.bank_account.withdraw(self.selected_car['value'])
-        else:  # Auto Loan
-            # Determine loan terms based on credit score
-            if self.game.player.credit_score >= 700:
-                interest_rate = 0.03  # 3%
-            elif self.game.player.credit_score >= 650:
-                interest_rate = 0.05  # 5%
-            else:
-                interest_rate = 0.08  # 8%
-
-            loan = Loan("Auto", self.selected_car['value'], interest_rate, 5)  # 5-year auto loan
-            self.game.player.loans.append(loan)
-
-        # Add car to assets
-        self.game.player.assets.append(Asset("Car", self.selected_car['name'], self.selected_car['value']))
+        # Process payment and add car to assets
+        self.game.purchase_car(self.selected_car, method)
 
         # Move to confirmation
         self.state = 2
         self.create_car_buttons()
 
+    def compare_loan_offers(self):
+        """Compare the auto loan offers for the selected car."""
+        from moneySmartz.screens.financial_screens import LoanComparisonScreen
+        self.game.gui_manager.set_screen(LoanComparisonScreen(self.game, self.selected_car, False, self))
+
+    def compare_cars(self):
+        """Compare the futures of buying the New Luxury Car and the Used Economy Car."""
+        from moneySmartz.whatif import get_car_branches
+        branches = get_car_branches(self.game)
+        self.game.gui_manager.set_screen(WhatIfScreen(self.game, "LUXURY VS ECONOMY CAR", branches, self, self.choose_branch))
+
+    def choose_branch(self, branch):
+        """Buy the car of a what-if branch the way it was simulated."""
+        car, method = branch.args
+        self.selected_car = car
+        self.select_payment_method(method)
+        self.game.gui_manager.set_screen(self)
+
     def skip_purchase(self):
         """Skip car purchase."""
         from moneySmartz.screens.game_screen import GameScreen
@@ -378,7 +361,7 @@ class CarPurchaseScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("CAR PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "CAR PURCHASE OPPORTUNITY", BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -392,7 +375,7 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -405,7 +388,7 @@ class CarPurchaseScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -429,7 +412,7 @@ class CarPurchaseScreen(Screen):
                 ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -454,16 +437,11 @@ class HousingScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # House options
-        self.house_options = [
-            {"name": "Small Starter Home", "value": 150000},
-            {"name": "Mid-size Family Home", "value": 250000},
-            {"name": "Large Luxury Home", "value": 500000},
-            {"name": "Urban Condo", "value": 200000},
-        ]
+        self.house_options = HOUSE_OPTIONS
 
         # Selected house
         self.selected_house = None
@@ -471,6 +449,9 @@ class HousingScreen(Screen):
         # Payment method for down payment
         self.payment_method = None
 
+        # Whether the house is bought with a mortgage (False when paying the full price)
+        self.mortgage = True
+
         # State (0 = house selection, 1 = payment selection, 2 = confirmation)
         self.state = 0
 
@@ -505,15 +486,7 @@ class HousingScreen(Screen):
 
         elif self.state == 1:
             # Payment method buttons for down payment
-            payment_options = []
-
-            down_payment = self.selected_house['value'] * 0.2
-
-            if self.game.player.cash >= down_payment:
-                payment_options.append("Cash")
-
-            if self.game.player.bank_account and self.game.player.bank_account.balance >= down_payment:
-                payment_options.append("Bank Account")
+            payment_options = self.game.get_down_payment_options(self.selected_house)
 
             if not payment_options:
                 # Not enough money for down payment
@@ -531,6 +504,27 @@ class HousingScreen(Screen):
                 )
                 self.buttons.append(method_button)
 
+            # What-if comparison button, when the player could also pay the full price
+            if self.game.get_down_payment_options(self.selected_house, mortgage=False):
+                compare_button = Button(
+                    SCREEN_WIDTH // 2 - 150,
+                    SCREEN_HEIGHT - 160,
+                    300, 50,
+                    "Compare Mortgage vs Cash",
+                    action=self.compare_financing
+                )
+                self.buttons.append(compare_button)
+
+            # Loan offer comparison button
+            offers_button = Button(
+                SCREEN_WIDTH // 2 - 150,
+                SCREEN_HEIGHT - 220,
+                300, 50,
+                "Compare Mortgage Offers",
+                action=self.compare_loan_offers
+            )
+            self.buttons.append(offers_button)
+
             # Back button
             back_button = Button(
                 SCREEN_WIDTH // 2 - 100,
@@ -587,36 +581,32 @@ class HousingScreen(Screen):
         """Select a payment method for down payment."""
         self.payment_method = method
 
-        # Calculate down payment (20% is standard)
-        down_payment = self.selected_house['value'] * 0.2
-        loan_amount = self.selected_house['value'] - down_payment
-
-        # Process down payment
-        if method == "Cash":
-            self.game.player.cash -= down_payment
-        else:  # Bank Account
-            self.game.player.bank_account.withdraw(down_payment)
-
-        # Create mortgage
-        if self.game.player.credit_score >= 750:
-            interest_rate = 0.035  # 3.5%
-        elif self.game.player.credit_score >= 700:
-            interest_rate = 0.04   # 4.0%
-        elif self.game.player.credit_score >= 650:
-            interest_rate = 0.045  # 4.5%
-        else:
-            interest_rate = 0.055  # 5.5%
-
-        loan = Loan("Mortgage", loan_amount, interest_rate, 30)  # 30-year mortgage
-        self.game.player.loans.append(loan)
-
-        # Add house to assets
-        self.game.player.assets.append(Asset("House", self.selected_house['name'], self.selected_house['value']))
+        # Process down payment, create mortgage and add house to assets
+        self.game.purchase_house(self.selected_house, method, self.mortgage)
 
         # Move to confirmation
         self.state = 2
         self.create_house_buttons()
 
+    def compare_loan_offers(self):
+        """Compare the mortgage offers for the selected house."""
+        from moneySmartz.screens.financial_screens import LoanComparisonScreen
+        self.game.gui_manager.set_screen(LoanComparisonScreen(self.game, self.selected_house, True, self))
+
+    def compare_financing(self):
+        """Compare the futures of buying the selected house with a 30-year mortgage and paying cash."""
+        from moneySmartz.whatif import get_house_branches
+        branches = get_house_branches(self.game, self.selected_house)
+        self.game.gui_manager.set_screen(WhatIfScreen(self.game, "MORTGAGE VS CASH", branches, self, self.choose_branch))
+
+    def choose_branch(self, branch):
+        """Buy the house the way a what-if branch was simulated."""
+        house, method, mortgage = branch.args
+        self.selected_house = house
+        self.mortgage = mortgage
+        self.select_payment_method(method)
+        self.game.gui_manager.set_screen(self)
+
     def skip_purchase(self):
         """Skip house purchase."""
         from moneySmartz.screens.game_screen import GameScreen
@@ -633,7 +623,7 @@ class HousingScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("HOUSE PURCHASE OPPORTUNITY", True, BLUE)
+        title_surface = render_text(self.title_font, "HOUSE PURCHASE OPPORTUNITY", BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -647,7 +637,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -663,29 +653,38 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
         elif self.state == 2:
             # Confirmation state
-            loan = self.game.player.loans[-1]  # The loan we just added
-            down_payment = self.selected_house['value'] * 0.2
+            if self.mortgage:
+                loan = self.game.player.loans[-1]  # The loan we just added
+                down_payment = self.selected_house['value'] * 0.2
 
-            text_lines = [
-                f"Congratulations on your new {self.selected_house['name']}!",
-                "",
-                f"You paid the down payment of ${down_payment:.2f} using {self.payment_method}.",
-                "",
-                f"Your mortgage details:",
-                f"Loan Amount: ${loan.original_amount:.2f}",
-                f"Interest Rate: {loan.interest_rate*100:.1f}%",
-                f"Monthly Payment: ${loan.monthly_payment:.2f}",
-                f"Term: {loan.term_years} years"
-            ]
+                text_lines = [
+                    f"Congratulations on your new {self.selected_house['name']}!",
+                    "",
+                    f"You paid the down payment of ${down_payment:.2f} using {self.payment_method}.",
+                    "",
+                    f"Your mortgage details:",
+                    f"Loan Amount: ${loan.original_amount:.2f}",
+                    f"Interest Rate: {loan.interest_rate*100:.1f}%",
+                    f"Monthly Payment: ${loan.monthly_payment:.2f}",
+                    f"Term: {loan.term_years} years"
+                ]
+            else:
+                text_lines = [
+                    f"Congratulations on your new {self.selected_house['name']}!",
+                    "",
+                    f"You paid the full price of ${self.selected_house['value']} using {self.payment_method}.",
+                    "",
+                    "You own your home outright, with no mortgage payments."
+                ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -728,7 +727,7 @@ class HousingScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -744,23 +743,18 @@ class FamilyPlanningScreen(Screen):
         super().__init__(game)
 
         # Title
-        self.title_font = pygame.font.SysFont('Arial', FONT_LARGE)
-        self.text_font = pygame.font.SysFont('Arial', FONT_MEDIUM)
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
 
         # State (0 = initial, 1 = spouse added, 2 = children question, 3 = confirmation)
         self.state = 0
 
-        # Spouse info
-        self.spouse_age = self.game.player.age - random.randint(-3, 3)  # Spouse age is close to player age
-        self.spouse_has_job = random.random() < 0.7  # 70% chance of spouse having a job
-
-        if self.spouse_has_job:
-            self.spouse_income = int(self.game.player.salary * random.uniform(0.5, 1.5))  # Spouse income relative to player
-        else:
-            self.spouse_income = 0
-
-        # Children info
-        self.num_children = random.randint(1, 3)  # Random number of children
+        # Spouse and children info
+        self.profile = self.game.generate_family_profile()
+        self.spouse_age = self.profile["spouse_age"]
+        self.spouse_has_job = self.profile["spouse_has_job"]
+        self.spouse_income = self.profile["spouse_income"]
+        self.num_children = self.profile["num_children"]
 
         # Create buttons
         self.create_buttons()
@@ -823,12 +817,8 @@ class FamilyPlanningScreen(Screen):
 
     def start_family(self):
         """Start a family by adding a spouse."""
-        # Add spouse to family
-        self.game.player.family.append({"relation": "Spouse", "age": self.spouse_age})
-
-        # Add spouse income if applicable
-        if self.spouse_has_job:
-            self.game.player.salary += self.spouse_income
+        # Add spouse to family, along with their income if applicable
+        self.game.start_family(self.profile)
 
         # Move to next state
         self.state = 1
@@ -837,10 +827,7 @@ class FamilyPlanningScreen(Screen):
     def have_children(self):
         """Have children."""
         # Add children to family
-        for i in range(self.num_children):
-            child_name = f"Child {i+1}"  # Placeholder name
-            child_age = 0  # Newborn
-            self.game.player.family.append({"relation": "Child", "name": child_name, "age": child_age})
+        self.game.have_children(self.num_children)
 
         # Move to confirmation state
         self.state = 2
@@ -868,7 +855,7 @@ class FamilyPlanningScreen(Screen):
         surface.fill(WHITE)
 
         # Title
-        title_surface = self.title_font.render("FAMILY PLANNING", True, BLUE)
+        title_surface = render_text(self.title_font, "FAMILY PLANNING", BLUE)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 80))
         surface.blit(title_surface, title_rect)
 
@@ -882,7 +869,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -911,7 +898,7 @@ class FamilyPlanningScreen(Screen):
             ])
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -929,7 +916,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -950,7 +937,7 @@ class FamilyPlanningScreen(Screen):
             ]
 
             for i, line in enumerate(text_lines):
-                text_surface = self.text_font.render(line, True, BLACK)
+                text_surface = render_text(self.text_font, line, BLACK)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 150 + i * 30))
                 surface.blit(text_surface, text_rect)
 
@@ -1014,3 +1001,138 @@ class FamilyPlanningScreen(Screen):
                 positions.append((x, y))
 
         return positions
+
+class WhatIfScreen(Screen):
+    """
+    Screen comparing the futures of a decision's branches side by side.
+    The branches are simulated in worker processes (see moneySmartz.whatif) while the
+    screen keeps drawing; once they're done the player can go with one of them, which
+    calls choose(branch), or go back to the screen they came from.
+    """
+    def __init__(self, game, title, branches, back_screen, choose):
+        super().__init__(game)
+        from moneySmartz.whatif import WhatIf
+
+        # Title
+        self.title_font = get_font(FONT_LARGE)
+        self.text_font = get_font(FONT_MEDIUM)
+        self.small_font = get_font(FONT_SMALL)
+
+        self.title = title
+        self.branches = branches
+        self.back_screen = back_screen
+        self.choose = choose
+
+        # Start simulating right away; update() picks up the results when they're ready
+        self.what_if = WhatIf(game, branches).start()
+        self.results = None
+
+        # Centers of the branch columns
+        column_width = (SCREEN_WIDTH - 300) // len(branches)
+        self.column_x = [280 + column_width * i + column_width // 2 for i in range(len(branches))]
+
+        self.create_buttons()
+
+    def create_buttons(self):
+        """Create the choice buttons (once the results are in) and the back button."""
+        self.buttons = []
+
+        if self.results is not None:
+            for x, branch in zip(self.column_x, self.branches):
+                choose_button = Button(
+                    x - 120,
+                    SCREEN_HEIGHT - 160,
+                    240, 50,
+                    f"Choose {branch.label}",
+                    font_size=FONT_SMALL,
+                    action=lambda b=branch: self.choose(b)
+                )
+                self.buttons.append(choose_button)
+
+        # Back button
+        back_button = Button(
+            SCREEN_WIDTH // 2 - 100,
+            SCREEN_HEIGHT - 90,
+            200, 50,
+            "Back",
+            action=self.go_back
+        )
+        self.buttons.append(back_button)
+
+    def is_animating(self):
+        """The progress bar moves until the results are in."""
+        return self.results is None
+
+    def update(self):
+        """Pick up the results once every branch has been simulated."""
+        if self.results is None:
+            if self.what_if.done():
+                self.results = self.what_if.get_results()
+                self.create_buttons()
+                self.mark_dirty()
+            else:
+                self.mark_dirty(pygame.Rect(SCREEN_WIDTH // 2 - 200, 300, 400, 80))  # The progress bar
+
+    def go_back(self):
+        """Stop the comparison and return to the previous screen."""
+        self.what_if.cancel()
+        self.game.gui_manager.set_screen(self.back_screen)
+
+    def draw(self, surface):
+        """Draw the comparison (or its progress)."""
+        # Background
+        surface.fill(WHITE)
+
+        # Title
+        title_surface = render_text(self.title_font, f"WHAT IF: {self.title}", BLUE)
+        title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 60))
+        surface.blit(title_surface, title_rect)
+
+        intro = f"Each choice is played out {self.what_if.runs} times with the same luck (events, jobs and family)."
+        intro_surface = render_text(self.small_font, intro, BLACK)
+        intro_rect = intro_surface.get_rect(center=(SCREEN_WIDTH // 2, 105))
+        surface.blit(intro_surface, intro_rect)
+
+        # Branch headers
+        for x, branch in zip(self.column_x, self.branches):
+            label_surface = render_text(self.text_font, branch.label, BLACK)
+            surface.blit(label_surface, label_surface.get_rect(center=(x, 160)))
+            description_surface = render_text(self.small_font, branch.description, DARK_GRAY)
+            surface.blit(description_surface, description_surface.get_rect(center=(x, 190)))
+
+        if self.results is None:
+            # Progress bar while the branches are simulated
+            progress = self.what_if.get_progress()
+            bar_rect = pygame.Rect(SCREEN_WIDTH // 2 - 200, 350, 400, 30)
+            pygame.draw.rect(surface, LIGHT_GRAY, bar_rect)
+            pygame.draw.rect(surface, GREEN, (bar_rect.x, bar_rect.y, int(bar_rect.width * progress), bar_rect.height))
+            pygame.draw.rect(surface, BLACK, bar_rect, 2)  # Border
+
+            text_surface = render_text(self.text_font, f"Simulating... {progress * 100:.0f}%", BLACK)
+            surface.blit(text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, 320)))
+
+        else:
+            # Net worth at each horizon
+            for row, years in enumerate(self.what_if.horizons):
+                y = 250 + row * 110
+
+                horizon_surface = render_text(self.text_font, f"In {years} years", BLUE)
+                surface.blit(horizon_surface, (40, y))
+                age_surface = render_text(self.small_font, f"(age {self.game.player.age + years})", DARK_GRAY)
+                surface.blit(age_surface, (40, y + 30))
+
+                medians = [result["net_worth"][years]["median"] for result in self.results]
+                for x, result, median in zip(self.column_x, self.results, medians):
+                    net_worth = result["net_worth"][years]
+                    color = GREEN if median == max(medians) else BLACK
+
+                    median_surface = render_text(self.text_font, f"Median: ${net_worth['median']:.2f}", color)
+                    surface.blit(median_surface, median_surface.get_rect(center=(x, y + 12)))
+
+                    spread = f"10%: ${net_worth['p10']:.2f} / 90%: ${net_worth['p90']:.2f}"
+                    spread_surface = render_text(self.small_font, spread, DARK_GRAY)
+                    surface.blit(spread_surface, spread_surface.get_rect(center=(x, y + 45)))
+
+        # Draw buttons
+        for button in self.buttons:
+            button.draw(surface)
@@ -0,0 +1,145 @@
+"""
+Game state snapshots for Money Smartz.
+
+A SnapshotHistory keeps a ring buffer of the game's state at the start of each
+of the last N months, so the player can rewind (say, one year) and try again.
+
+Snapshots are cheap because most of the state is shared rather than copied:
+- the player's ledger is append-only, so a snapshot only records its length
+  and a rewind truncates it back to it (see Ledger.get_state);
+- each model object's other attributes are captured in a small dict, and when
+  nothing about an object changed since the previous snapshot, the previous
+  record is reused, so unchanged objects share one record between snapshots;
+- the random streams count their draws, so RNGRegistry.get_state shares the
+  state of a stream that wasn't drawn from instead of taking it again.
+"""
+from collections import deque
+
+# Player attributes holding lists of other objects
+LIST_ATTRIBUTES = ("loans", "family")
+
+# Player attributes holding an AssetRegistry or a Ledger, recorded with their get_state
+STATE_ATTRIBUTES = ("assets", "ledger")
+
+class Snapshot:
+    """
+    The state of a game at the start of one month.
+    records holds an (object, attributes) pair for the player, their balance sheet
+    and each of their accounts, cards, loans and assets.
+    """
+    def __init__(self, month_index, game_state, records, rng_state, scheduler_state):
+        self.month_index = month_index
+        self.game_state = game_state
+        self.records = records
+        self.rng_state = rng_state
+        self.scheduler_state = scheduler_state
+
+class SnapshotHistory:
+    """
+    A ring buffer of the last capacity monthly snapshots of a game.
+    A capacity of 0 turns snapshots off (the headless engine doesn't need them).
+    """
+    def __init__(self, capacity=60):
+        self.capacity = capacity
+        self.snapshots = deque(maxlen=capacity)
+        self.previous = {}  # id(object) -> its record in the latest snapshot, for sharing
+
+    def record(self, game):
+        """Take a snapshot of the game's current state. Returns the Snapshot, or None if snapshots are off."""
+        if not self.capacity or game.player is None:
+            return None
+
+        month_index = game.get_month_index()
+        if self.snapshots and self.snapshots[-1].month_index == month_index:
+            self.snapshots.pop()  # Retake this month's snapshot
+
+        player = game.player
+        records = [self.capture(player, STATE_ATTRIBUTES), self.capture(player.balance_sheet)]
+        for obj in (player.bank_account, player.debit_card, player.credit_card):
+            if obj is not None:
+                records.append(self.capture(obj))
+        for obj in player.loans:
+            records.append(self.capture(obj))
+        for obj in player.assets:
+            records.append(self.capture(obj))
+        self.previous = {id(record[0]): record for record in records}
+
+        snapshot = Snapshot(
+            month_index,
+            {"current_month": game.current_month, "current_year": game.current_year, "game_over": game.game_over},
+            records,
+            game.rng.get_state(),
+            game.get_life_stage_scheduler().get_state()
+        )
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    def capture(self, obj, state_attributes=()):
+        """
+        Return an (object, attributes) record of a model object, reusing the previous record if nothing changed.
+        The attributes named in state_attributes are recorded with their get_state.
+        """
+        attributes = obj.__dict__.copy()
+        for name in LIST_ATTRIBUTES:
+            if name in attributes:
+                attributes[name] = tuple(attributes[name])
+        for name in state_attributes:
+            attributes[name] = attributes[name].get_state()
+
+        previous = self.previous.get(id(obj))
+        if previous is not None and previous[0] is obj and previous[1] == attributes:
+            return previous
+        return (obj, attributes)
+
+    def restore(self, game, snapshot):
+        """
+        Put the game back in the state captured by a snapshot.
+        Snapshots taken after it are dropped, since they belong to the abandoned future.
+        """
+        while self.snapshots and self.snapshots[-1] is not snapshot:
+            self.snapshots.pop()
+
+        for obj, attributes in snapshot.records:
+            for name, value in attributes.items():
+                if name in LIST_ATTRIBUTES:
+                    getattr(obj, name)[:] = value
+                elif obj is game.player and name in STATE_ATTRIBUTES:
+                    getattr(obj, name).set_state(value)
+                else:
+                    setattr(obj, name, value)
+
+        for name, value in snapshot.game_state.items():
+            setattr(game, name, value)
+        game.rng.set_state(snapshot.rng_state)
+        game.get_life_stage_scheduler().set_state(snapshot.scheduler_state)
+
+        self.previous = {id(record[0]): record for record in snapshot.records}
+
+    def rewind(self, game, months):
+        """
+        Rewind the game by up to the given number of months, to the latest snapshot taken
+        at least that far back (or the oldest one if the history doesn't go back that far).
+        Returns the number of months rewound (0 if there's nothing to rewind to).
+        """
+        now = game.get_month_index()
+        target = now - months
+        candidates = [snapshot for snapshot in self.snapshots if snapshot.month_index < now]
+        if not candidates:
+            return 0
+
+        snapshot = candidates[0]
+        for candidate in candidates:
+            if candidate.month_index <= target:
+                snapshot = candidate
+
+        self.restore(game, snapshot)
+        return now - snapshot.month_index
+
+    def can_rewind(self, game):
+        """Check whether there's an earlier month to rewind to."""
+        return bool(self.snapshots) and self.snapshots[0].month_index < game.get_month_index()
+
+    def clear(self):
+        """Drop every snapshot."""
+        self.snapshots.clear()
+        self.previous = {}
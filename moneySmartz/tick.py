@@ -0,0 +1,191 @@
+"""
+Monthly tick pipeline for Money Smartz.
+
+Advancing the game by a month runs an ordered list of named stages: calendar
+rollover, the credit card statement, income, loans, card minimum, living
+expenses, mid-month, interest, asset aging, events and life stages. The text mode, the GUI and the headless engine all
+advance through the same pipeline. Extensions can register their own stages,
+and every stage keeps a wall-time counter so a batch run shows which stage
+dominates.
+"""
+import time
+
+class TickStage:
+    """
+    A named stage of the monthly tick.
+    func(game, report) updates the game and may record results in the month's report.
+    """
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+        self.calls = 0
+        self.total_time = 0.0  # Wall time spent in the stage, in seconds
+
+# Built-in stages
+
+def calendar_stage(game, report):
+    """Advance the calendar, noting whether a new year started."""
+    report["new_year"] = game.advance_calendar()
+
+def statement_stage(game, report):
+    """Close last month's credit card statement, charging its interest."""
+    game.close_card_statement()
+
+def income_stage(game, report):
+    """Pay the month's salary."""
+    game.process_income()
+
+def loans_stage(game, report):
+    """Make the month's loan payments."""
+    if not game.process_loan_payments():
+        report["all_paid"] = False
+
+def card_minimum_stage(game, report):
+    """Make the credit card minimum payment."""
+    if not game.process_card_minimum_payment():
+        report["all_paid"] = False
+
+def living_expenses_stage(game, report):
+    """Pay the month's living expenses."""
+    if not game.process_living_expenses():
+        report["all_paid"] = False
+
+def bills_stage(game, report):
+    """Pay the loans, card minimum and living expenses in one batched pass."""
+    if not game.settle_monthly_bills():
+        report["all_paid"] = False
+
+def mid_month_stage(game, report):
+    """Move the ledger to the middle of the month, after the bills."""
+    game.start_mid_month()
+
+def interest_stage(game, report):
+    """Apply savings interest at the start of each year."""
+    if report["new_year"]:
+        game.apply_savings_interest()
+
+def asset_aging_stage(game, report):
+    """Age assets at the start of each year."""
+    if report["new_year"]:
+        game.age_assets()
+
+def events_stage(game, report):
+    """Roll for a random event and apply its cash effect."""
+    if game.roll_for_random_event():
+        event, cash_effect = game.choose_random_event()
+
+        # Only events that have an effect are reported
+        if cash_effect != 0:
+            report["random_event"] = {
+                "event": event,
+                "cash_effect": cash_effect,
+                "message": game.apply_event_cash_effect(cash_effect)
+            }
+
+def life_stages_stage(game, report):
+    """Queue the life stage events that came due this month (handled by the front end)."""
+    game.get_life_stage_scheduler().collect_due(game)
+
+DEFAULT_STAGES = [
+    ("calendar", calendar_stage),
+    ("statement", statement_stage),
+    ("income", income_stage),
+    ("loans", loans_stage),
+    ("card_minimum", card_minimum_stage),
+    ("living_expenses", living_expenses_stage),
+    ("mid_month", mid_month_stage),
+    ("interest", interest_stage),
+    ("asset_aging", asset_aging_stage),
+    ("events", events_stage),
+    ("life_stages", life_stages_stage),
+]
+
+# The same month with the three bill stages settled in one batched pass (used by the headless engine)
+BATCHED_STAGES = [
+    ("calendar", calendar_stage),
+    ("statement", statement_stage),
+    ("income", income_stage),
+    ("bills", bills_stage),
+    ("mid_month", mid_month_stage),
+    ("interest", interest_stage),
+    ("asset_aging", asset_aging_stage),
+    ("events", events_stage),
+    ("life_stages", life_stages_stage),
+]
+
+class MonthlyTick:
+    """
+    An ordered pipeline of named stages run once per game month.
+    Starts with the built-in stages; use register and unregister to change it.
+    """
+    def __init__(self, stages=None):
+        self.stages = []
+        for name, func in (DEFAULT_STAGES if stages is None else stages):
+            self.register(name, func)
+
+    def register(self, name, func, before=None, after=None):
+        """
+        Add a stage to the pipeline: at the end, or just before or after the named stage.
+        Raises ValueError if a stage with the same name exists or the anchor stage doesn't.
+        """
+        if self.find(name) is not None:
+            raise ValueError(f"A stage named {name!r} is already registered.")
+
+        index = len(self.stages)
+        anchor = before if before is not None else after
+        if anchor is not None:
+            anchor_index = self.find(anchor)
+            if anchor_index is None:
+                raise ValueError(f"No stage named {anchor!r}.")
+            index = anchor_index if before is not None else anchor_index + 1
+
+        self.stages.insert(index, TickStage(name, func))
+
+    def unregister(self, name):
+        """Remove a stage from the pipeline. Raises ValueError if there's no such stage."""
+        index = self.find(name)
+        if index is None:
+            raise ValueError(f"No stage named {name!r}.")
+        del self.stages[index]
+
+    def find(self, name):
+        """Return the position of the named stage, or None."""
+        for index, stage in enumerate(self.stages):
+            if stage.name == name:
+                return index
+        return None
+
+    def is_builtin(self):
+        """Check whether the pipeline holds exactly the built-in stages (default or batched)."""
+        stages = [(stage.name, stage.func) for stage in self.stages]
+        return stages == DEFAULT_STAGES or stages == BATCHED_STAGES
+
+    def run(self, game, skip=()):
+        """
+        Run every stage (except those named in skip) for one month.
+        Returns the month's report: "new_year" (bool), "all_paid" (False if a payment
+        was missed) and "random_event" (None, or a dict with the event, its cash effect
+        and the payment message). Stages may add their own entries.
+        """
+        report = {"new_year": False, "all_paid": True, "random_event": None}
+
+        for stage in self.stages:
+            if stage.name in skip:
+                continue
+
+            start = time.perf_counter()
+            stage.func(game, report)
+            stage.total_time += time.perf_counter() - start
+            stage.calls += 1
+
+        return report
+
+    def get_timings(self):
+        """Return each stage's call count and total wall time, in pipeline order."""
+        return {stage.name: {"calls": stage.calls, "total_time": stage.total_time} for stage in self.stages}
+
+    def reset_timings(self):
+        """Zero every stage's counters."""
+        for stage in self.stages:
+            stage.calls = 0
+            stage.total_time = 0.0
@@ -1,7 +1,85 @@
 import pygame
+from collections import deque, OrderedDict
 from pygame.locals import *
 from moneySmartz.constants import *
 
+class FontManager:
+    """
+    A cache of pygame fonts shared by every screen.
+    pygame.font.SysFont looks the font file up on the system and loads it each time it's called,
+    so screens ask get_font for their fonts instead: each (family, size, bold) is loaded once
+    and the same Font object handed out after that. warm loads the usual sizes up front, so the
+    first frame doesn't pay for them.
+    """
+    def __init__(self):
+        self.fonts = {}  # (family, size, bold) -> Font
+
+    def get(self, size, bold=False, family=FONT_FAMILY):
+        """Return the shared font of a size (and family and weight), loading it the first time."""
+        key = (family, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.SysFont(family, size, bold=bold)
+        return font
+
+    def warm(self, sizes=(FONT_SMALL, FONT_MEDIUM, FONT_LARGE, FONT_TITLE), family=FONT_FAMILY):
+        """Load the fonts of some sizes (regular and bold) ahead of the first frame."""
+        for size in sizes:
+            for bold in (False, True):
+                self.get(size, bold, family)
+
+    def clear(self):
+        """Forget every font (needed after pygame.font.quit)."""
+        self.fonts.clear()
+
+# The process-wide font cache
+font_manager = FontManager()
+
+def get_font(size, bold=False, family=FONT_FAMILY):
+    """Return a shared font from the process-wide FontManager."""
+    return font_manager.get(size, bold, family)
+
+class TextCache:
+    """
+    A least recently used cache of rendered text surfaces, keyed by (text, font, color, antialias).
+    Most of what the screens draw is the same text every frame, so only text that changes
+    (a new month, a new balance) is rendered again. At most maxsize surfaces are kept; hits
+    and misses count the lookups. The surfaces are shared, so callers must not draw on them.
+    """
+    def __init__(self, maxsize=TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        """Return the surface of some text in a font and color, rendering it if it isn't cached."""
+        key = (text, font, color, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.maxsize:
+            self.surfaces.popitem(last=False)  # Drop the least recently used
+        return surface
+
+    def clear(self):
+        """Drop every cached surface and reset the counters."""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+# The process-wide text cache
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the process-wide TextCache (see TextCache.render)."""
+    return text_cache.render(font, text, color, antialias)
+
 class Button:
     """
     A button UI element that can be clicked to trigger an action.
@@ -12,7 +90,7 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.text_color = text_color
-        self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.action = action
         self.hovered = False
 
@@ -22,7 +100,7 @@ class Button:
         pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, BLACK, self.rect, 2)  # Border
 
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -43,7 +121,7 @@ class TextInput:
     def __init__(self, x, y, width, height, font_size=FONT_MEDIUM, max_length=20, initial_text=""):
         self.rect = pygame.Rect(x, y, width, height)
         self.text = initial_text
-        self.font = pygame.font.SysFont('Arial', font_size)
+        self.font = get_font(font_size)
         self.active = False
         self.max_length = max_length
 
@@ -53,7 +131,7 @@ class TextInput:
         pygame.draw.rect(surface, color, self.rect)
         pygame.draw.rect(surface, BLACK, self.rect, 2)  # Border
 
-        text_surface = self.font.render(self.text, True, BLACK)
+        text_surface = render_text(self.font, self.text, BLACK)
         text_rect = text_surface.get_rect(midleft=(self.rect.left + 10, self.rect.centery))
         surface.blit(text_surface, text_rect)
 
@@ -76,14 +154,99 @@ class TextInput:
 
         return self.text
 
+class Slider:
+    """
+    A horizontal slider for picking a number between minimum and maximum, in steps.
+    Click or drag along the track to move the handle.
+    """
+    def __init__(self, x, y, width, height, minimum, maximum, step=1, value=None):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.step = step
+        self.value = minimum if value is None else value
+        self.dragging = False
+
+    def get_handle_x(self):
+        """Return the x coordinate of the handle for the current value."""
+        fraction = (self.value - self.minimum) / (self.maximum - self.minimum) if self.maximum > self.minimum else 0
+        return self.rect.left + int(fraction * self.rect.width)
+
+    def set_from_x(self, x):
+        """Set the value from an x coordinate along the track, snapped to a step."""
+        fraction = min(1, max(0, (x - self.rect.left) / self.rect.width))
+        steps = round(fraction * (self.maximum - self.minimum) / self.step)
+        self.value = min(self.maximum, self.minimum + steps * self.step)
+
+    def draw(self, surface):
+        """Draw the slider on the given surface."""
+        track = pygame.Rect(self.rect.left, self.rect.centery - 3, self.rect.width, 6)
+        pygame.draw.rect(surface, LIGHT_GRAY, track)
+        pygame.draw.rect(surface, BLUE, (track.left, track.top, self.get_handle_x() - track.left, track.height))
+        pygame.draw.circle(surface, LIGHT_BLUE if self.dragging else BLUE, (self.get_handle_x(), self.rect.centery), self.rect.height // 2)
+        pygame.draw.circle(surface, BLACK, (self.get_handle_x(), self.rect.centery), self.rect.height // 2, 2)  # Border
+
+    def update(self, events):
+        """
+        Update the slider based on mouse input.
+        Returns True if the value changed.
+        """
+        old_value = self.value
+        for event in events:
+            if event.type == MOUSEBUTTONDOWN and event.button == 1 and self.rect.inflate(0, 10).collidepoint(event.pos):
+                self.dragging = True
+                self.set_from_x(event.pos[0])
+            elif event.type == MOUSEMOTION and self.dragging:
+                self.set_from_x(event.pos[0])
+            elif event.type == MOUSEBUTTONUP and event.button == 1:
+                self.dragging = False
+
+        return self.value != old_value
+
 class Screen:
     """
     Base class for all screens in the game.
+
+    The GUIManager only redraws the parts of a screen that changed. A screen reports them
+    with mark_dirty: a rect, or nothing for the whole screen. Buttons changing their hover
+    state are reported here, and the manager redraws everything after a click or key press
+    (which can change anything) and when the screen is shown. Screens that change by
+    themselves (animations, progress bars) mark what changed in update, and say so with
+    is_animating, so the manager keeps running at full frame rate for them.
     """
     def __init__(self, game):
         self.game = game
         self.buttons = []
         self.next_screen = None
+        self.full_redraw = True
+        self.dirty_rects = []
+
+    def mark_dirty(self, rect=None):
+        """Mark a region of the screen (or the whole screen, if rect is None) as needing a redraw."""
+        if rect is None:
+            self.full_redraw = True
+        elif not self.full_redraw:
+            self.dirty_rects.append(pygame.Rect(rect))
+
+    def take_dirty(self):
+        """
+        Return the regions marked since the last call and clear them:
+        None if the whole screen needs a redraw, else a (possibly empty) list of rects.
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.dirty_rects = []
+            return None
+
+        rects, self.dirty_rects = self.dirty_rects, []
+        return rects
+
+    def is_animating(self):
+        """
+        Check whether the screen is changing by itself. While it isn't, the GUIManager
+        sleeps until there's input instead of running at full frame rate.
+        """
+        return False
 
     def handle_events(self, events):
         """Handle pygame events for this screen."""
@@ -95,7 +258,10 @@ class Screen:
                 mouse_click = True
 
         for button in self.buttons:
+            hovered = button.hovered
             action = button.update(mouse_pos, mouse_click)
+            if button.hovered != hovered:
+                self.mark_dirty(button.rect)
             if action:
                 action()
                 return
@@ -121,25 +287,123 @@ class GUIManager:
         self.clock = pygame.time.Clock()
         self.current_screen = None
         self.running = True
+        self.toasts = deque(maxlen=TOAST_LIMIT)  # (message, time it disappears) pairs, oldest first
+        self.toast_layout = []                   # (message, rect) of each toast drawn in the last frame
+        font_manager.warm()  # Load the fonts before the first frame
+        self.toast_font = get_font(FONT_SMALL)
 
     def set_screen(self, screen):
-        """Set the current screen to be displayed."""
+        """Set the current screen to be displayed (it's redrawn in full)."""
         self.current_screen = screen
+        screen.mark_dirty()
 
     def run(self):
-        """Run the main game loop."""
+        """
+        Run the main game loop.
+        While the current screen is animating, the loop runs at FPS frames a second;
+        otherwise it blocks until there's input (see wait_for_events), so a screen the
+        player is just reading costs almost no CPU.
+        """
         while self.running and not self.game.game_over:
-            events = pygame.event.get()
+            if self.current_screen and self.current_screen.is_animating():
+                events = pygame.event.get()
+            else:
+                events = self.wait_for_events()
             for event in events:
                 if event.type == QUIT:
                     self.running = False
 
             if self.current_screen:
+                # Anything but moving the mouse may change what's on screen
+                if any(event.type != MOUSEMOTION for event in events):
+                    self.current_screen.mark_dirty()
                 self.current_screen.handle_events(events)
                 self.current_screen.update()
-                self.current_screen.draw(self.screen)
 
+            self.show_notifications()
+            self.draw_frame()
+            self.clock.tick(FPS)  # Never faster than FPS, even with a stream of input
+
+        pygame.quit()
+
+    def wait_for_events(self):
+        """
+        Block until there's an event, or until IDLE_TIMEOUT passes or the oldest toast expires
+        (whichever is first), then return every waiting event (an empty list on a timeout).
+        """
+        timeout = IDLE_TIMEOUT
+        if self.toasts:
+            timeout = max(1, min(timeout, self.toasts[0][1] - pygame.time.get_ticks()))
+
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
+
+    def draw_frame(self):
+        """
+        Redraw what changed on the current screen and the toasts, and push it to the display:
+        the whole screen with display.flip, or just the damaged rects with display.update
+        (drawing clipped to them). Returns the rects pushed (None for the whole screen).
+        """
+        screen = self.current_screen
+        if screen is None:
+            return []
+
+        for rect in self.update_toasts():
+            screen.mark_dirty(rect)
+
+        dirty = screen.take_dirty()
+        if dirty is None:
+            screen.draw(self.screen)
+            self.draw_toasts(self.screen)
             pygame.display.flip()
-            self.clock.tick(FPS)
+        elif dirty:
+            self.screen.set_clip(dirty[0].unionall(dirty[1:]))
+            screen.draw(self.screen)
+            self.draw_toasts(self.screen)
+            self.screen.set_clip(None)
+            pygame.display.update(dirty)
+        return dirty
+
+    def show_notifications(self):
+        """Turn the game's waiting notifications into toasts."""
+        if not self.game.notifications:
+            return
+
+        expires = pygame.time.get_ticks() + TOAST_DURATION
+        for notification in self.game.notifications.drain():
+            self.toasts.append((notification.message, expires))
+
+    def update_toasts(self):
+        """
+        Drop the expired toasts and lay out the rest in the top right corner.
+        Returns the rects that need a redraw (where toasts were and are) if they changed.
+        """
+        now = pygame.time.get_ticks()
+        while self.toasts and self.toasts[0][1] <= now:
+            self.toasts.popleft()
+
+        layout = []
+        y = 10
+        for message, _ in self.toasts:
+            text_surface = render_text(self.toast_font, message, WHITE)
+            rect = text_surface.get_rect(topright=(SCREEN_WIDTH - 20, y + 8))
+            layout.append((message, rect.inflate(20, 16)))
+            y += rect.height + 24
+
+        if layout == self.toast_layout:
+            return []
+        damaged = [rect for _, rect in self.toast_layout + layout]
+        self.toast_layout = layout
+        return damaged
+
+    def draw_toasts(self, surface):
+        """Draw the current toasts where update_toasts laid them out."""
+        if len(self.toast_layout) != len(self.toasts):
+            self.update_toasts()
 
-        pygame.quit()
\ No newline at end of file
+        for message, box in self.toast_layout:
+            text_surface = render_text(self.toast_font, message, WHITE)
+            pygame.draw.rect(surface, DARK_GRAY, box)
+            surface.blit(text_surface, text_surface.get_rect(center=box.center))
\ No newline at end of file
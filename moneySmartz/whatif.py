@@ -0,0 +1,225 @@
+"""
+What-if comparisons for Money Smartz.
+
+Forks the current game into one branch per decision (say, buying the New Luxury
+Car or the Used Economy Car) and simulates each branch forward many times with
+the headless engine, in worker processes, reporting the spread of the player's
+net worth 10, 20 and 30 years out.
+
+- Forking is cheap: only the player's objects, the calendar and the life stage
+  queues are pickled, once. Each worker unpickles them once and resets its copy
+  between runs with a snapshot restore (see moneySmartz.snapshots) instead of
+  copying the game again.
+- Branches are compared under common random numbers: run i of every branch
+  reseeds the game's streams with the same seed, so all branches live through
+  the same events, job offers and family rolls, and the difference between them
+  comes from the decision rather than from luck.
+- start() only hands the runs to a process pool, so the GUI keeps drawing frames
+  while they're simulated and polls done() each frame.
+"""
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from moneySmartz.constants import CAR_OPTIONS, WHAT_IF_RUNS, WHAT_IF_HORIZONS
+from moneySmartz.engine import SimulationEngine, DecisionPolicy
+from moneySmartz.montecarlo import _silence_worker
+from moneySmartz.snapshots import SnapshotHistory
+
+class Branch:
+    """
+    One decision to compare: a label, a description of the details (such as how it's
+    paid for) and the Game method that makes it, with its arguments.
+    For example Branch("New Luxury Car", "purchase_car", (car, "Auto Loan")).
+    """
+    def __init__(self, label, action, args=(), description=""):
+        self.label = label
+        self.action = action
+        self.args = tuple(args)
+        self.description = description
+
+    def apply(self, game):
+        """Make the decision in a game."""
+        getattr(game, self.action)(*self.args)
+
+def get_car_branches(game, names=("New Luxury Car", "Used Economy Car")):
+    """Return a branch for buying each of the named cars, paid for the way the default policy would."""
+    policy = DecisionPolicy()
+    branches = []
+    for name in names:
+        car = next(car for car in CAR_OPTIONS if car["name"] == name)
+        method = policy.choose_car_payment(game, car, game.get_car_payment_options(car))
+        branches.append(Branch(car["name"], "purchase_car", (car, method), f"Paid with: {method}"))
+    return branches
+
+def get_house_branches(game, house):
+    """
+    Return the branches for buying a house with a 30-year mortgage and for paying its
+    full price up front, leaving out the ones the player can't afford.
+    """
+    branches = []
+
+    payment_options = game.get_down_payment_options(house)
+    if payment_options:
+        method = payment_options[0]
+        branches.append(Branch("30-Year Mortgage", "purchase_house", (house, method, True), f"20% down from {method}"))
+
+    payment_options = game.get_down_payment_options(house, mortgage=False)
+    if payment_options:
+        method = payment_options[0]
+        branches.append(Branch("Pay Cash", "purchase_house", (house, method, False), f"Full price from {method}"))
+
+    return branches
+
+def get_horizons(age, horizons=WHAT_IF_HORIZONS):
+    """Return the horizons (in years) that end by retirement, or just the years left until retirement if none do."""
+    years_left = 65 - age  # Retirement age
+    fitting = [years for years in horizons if years <= years_left]
+    if fitting:
+        return fitting
+    return [years_left] if years_left > 0 else []
+
+def fork_game(game):
+    """
+    Capture what a branch needs of a game (the player, the calendar and the life stage
+    queues) as a pickled blob. The rest of the Game (the GUI, the tick pipeline, the
+    event table) is rebuilt by the worker, so this is much cheaper than a deep copy.
+    """
+    state = {
+        "player": game.player,
+        "current_month": game.current_month,
+        "current_year": game.current_year,
+        "scheduler": game.get_life_stage_scheduler().get_state()
+    }
+    return pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+
+def load_fork(fork, policy=None):
+    """Build a headless SimulationEngine whose game is a copy of a forked game."""
+    state = pickle.loads(fork)
+    engine = SimulationEngine(policy=policy)
+    game = engine.game
+    game.player = state["player"]
+    game.current_month = state["current_month"]
+    game.current_year = state["current_year"]
+    game.life_stages.set_state(state["scheduler"])
+    return engine
+
+def simulate_branch(fork, branch, seeds, horizons, policy=None):
+    """
+    Simulate one branch of a forked game once per seed.
+    Returns one row per seed with the player's net worth at each horizon (in years);
+    a run that reaches retirement first keeps its net worth at retirement.
+    """
+    engine = load_fork(fork, policy)
+    game = engine.game
+
+    # Every run starts over from the fork
+    history = SnapshotHistory(1)
+    start = history.record(game)
+
+    rows = []
+    for seed in seeds:
+        history.restore(game, start)
+        game.rng.reseed(seed)
+        branch.apply(game)
+
+        row = []
+        months = 0
+        for years in horizons:
+            engine.run(years * 12 - months)
+            months = years * 12
+            row.append(game.calculate_net_worth())
+        rows.append(row)
+
+    return rows
+
+def get_percentile(values, fraction):
+    """Return the value at a fraction of the way through a sorted list."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+class WhatIf:
+    """
+    A what-if comparison of several branches from the current state of a game.
+    start() hands the runs to a process pool and returns at once; poll done() (the GUI
+    does so every frame) and call get_results() once it's finished.
+    Run i of every branch uses the seed base_seed + i (common random numbers).
+    """
+    def __init__(self, game, branches, runs=WHAT_IF_RUNS, horizons=WHAT_IF_HORIZONS, policy=None, max_workers=None, base_seed=None):
+        if base_seed is None:
+            base_seed = game.rng.derive_seed(f"whatif:{game.get_month_index()}")
+
+        self.branches = list(branches)
+        self.runs = runs
+        self.horizons = get_horizons(game.player.age, horizons)
+        self.policy = policy
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.base_seed = base_seed
+        self.fork = fork_game(game)
+        self.executor = None
+        self.futures = []  # (branch index, future) pairs, in seed order per branch
+        self.results = None
+
+    def start(self):
+        """Submit the runs of every branch to a process pool. Returns the WhatIf."""
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_silence_worker)
+
+        # Several chunks per worker, so progress can be reported as they finish
+        chunksize = max(1, self.runs // (self.max_workers * 4))
+        for index, branch in enumerate(self.branches):
+            for first in range(0, self.runs, chunksize):
+                seeds = range(self.base_seed + first, self.base_seed + min(first + chunksize, self.runs))
+                future = self.executor.submit(simulate_branch, self.fork, branch, seeds, self.horizons, self.policy)
+                self.futures.append((index, future))
+
+        return self
+
+    def get_progress(self):
+        """Return the fraction of the runs that have finished."""
+        if not self.futures:
+            return 0.0
+        return sum(future.done() for _, future in self.futures) / len(self.futures)
+
+    def done(self):
+        """Check whether every run has finished."""
+        return all(future.done() for _, future in self.futures)
+
+    def get_results(self):
+        """
+        Wait for the runs and summarize them: one dict per branch with its label,
+        description and, for each horizon, the p10, median and p90 net worth.
+        """
+        if self.results is not None:
+            return self.results
+
+        rows = [[] for _ in self.branches]
+        for index, future in self.futures:
+            rows[index].extend(future.result())
+        self.executor.shutdown(wait=False)
+
+        self.results = []
+        for branch, branch_rows in zip(self.branches, rows):
+            net_worth = {}
+            for column, years in enumerate(self.horizons):
+                values = sorted(row[column] for row in branch_rows)
+                net_worth[years] = {
+                    "p10": get_percentile(values, 0.1),
+                    "median": get_percentile(values, 0.5),
+                    "p90": get_percentile(values, 0.9)
+                }
+
+            self.results.append({
+                "label": branch.label,
+                "description": branch.description,
+                "runs": len(branch_rows),
+                "net_worth": net_worth
+            })
+
+        return self.results
+
+    def cancel(self):
+        """Stop the comparison, dropping the runs that haven't started."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+def compare_branches(game, branches, **kwargs):
+    """Run a what-if comparison to the end and return its results (see WhatIf.get_results)."""
+    return WhatIf(game, branches, **kwargs).start().get_results()